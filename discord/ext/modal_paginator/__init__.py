@@ -1,5 +1,54 @@
+from .aggregate import FormAggregator as FormAggregator, QuestionSummary as QuestionSummary
+from .admission import AdmissionController as AdmissionController
+from .button_set import ButtonSet as ButtonSet
+from .broadcast import BroadcastReport as BroadcastReport, BroadcastResult as BroadcastResult, broadcast as broadcast
+from .cache import AnswerCache as AnswerCache, CheckCache as CheckCache
 from .core import ModalPaginator as ModalPaginator, PaginatorModal as PaginatorModal
+from .converters import (
+    Converter as Converter,
+    DateConverter as DateConverter,
+    FloatConverter as FloatConverter,
+    IntConverter as IntConverter,
+    MemberConverter as MemberConverter,
+    MemberResolver as MemberResolver,
+    RoleConverter as RoleConverter,
+)
 from .custom_button import CustomButton as CustomButton
+from .delta import SubmitDelta as SubmitDelta
+from .drafts import (
+    DraftAutosaver as DraftAutosaver,
+    DraftStore as DraftStore,
+    JSONDraftStore as JSONDraftStore,
+    PageDraft as PageDraft,
+)
+from .events import (
+    EventBus as EventBus,
+    ModalSubmitEvent as ModalSubmitEvent,
+    PageChangeEvent as PageChangeEvent,
+    PaginatorEvent as PaginatorEvent,
+    SessionEndEvent as SessionEndEvent,
+    SessionStartEvent as SessionStartEvent,
+)
+from .forms import FormDefinition as FormDefinition, FormRegistry as FormRegistry
+from .enums import AdmissionPolicy as AdmissionPolicy, AdvancePolicy as AdvancePolicy, SessionState as SessionState
+from .registry import SessionRegistry as SessionRegistry
+from .renderer import ContentRenderer as ContentRenderer, EmbedRenderer as EmbedRenderer, Renderer as Renderer
+from .review import AnswerReview as AnswerReview
+from .throttle import ClickThrottle as ClickThrottle
+from .tracing import (
+    JSONLinesExporter as JSONLinesExporter,
+    Span as Span,
+    SpanExporter as SpanExporter,
+    Tracer as Tracer,
+)
+from .shared import SharedModalPaginator as SharedModalPaginator
+from .validators import (
+    AsyncValidator as AsyncValidator,
+    Choice as Choice,
+    NumberRange as NumberRange,
+    Regex as Regex,
+    Validator as Validator,
+)
 
 __version__ = "1.3.0a"
 __author__ = "Soheab"
@@ -0,0 +1,264 @@
+from __future__ import annotations
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .enums import AdmissionPolicy
+from .errors import AdmissionRejected
+
+if TYPE_CHECKING:
+    from .core import ModalPaginator
+
+__all__ = ("AdmissionController",)
+
+
+class AdmissionController:
+    r"""Limits the amount of active :class:`.ModalPaginator`\s per user, per guild and in total.
+
+    Pass an instance to the ``admission`` kwarg of :class:`.ModalPaginator`. Paginators are admitted
+    in :meth:`.ModalPaginator.send` and release their slot when they are stopped (finished, cancelled or timed out).
+    The same instance should be shared by all paginators that should count towards the same limits.
+
+    Checking the limits only looks up counters, :meth:`AdmissionController.can_admit` can be
+    called before even creating a paginator to reject a burst of starts cheaply.
+
+    With :attr:`.AdmissionPolicy.queue`, a paginator that is sent to an interaction that wasn't responded to yet
+    defers the interaction before it waits for a slot, since Discord requires a response within 3 seconds.
+    The paginator is then sent as a followup and :exc:`.AdmissionRejected` must be handled using
+    :attr:`discord.Interaction.followup` as well.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    per_user: Optional[:class:`int`]
+        The maximum amount of active paginators per user. Defaults to ``None`` (no limit).
+    per_guild: Optional[:class:`int`]
+        The maximum amount of active paginators per guild. Defaults to ``None`` (no limit).
+    total: Optional[:class:`int`]
+        The maximum amount of active paginators in total. Defaults to ``None`` (no limit).
+    policy: :class:`.AdmissionPolicy`
+        What to do when a limit is reached. Defaults to :attr:`.AdmissionPolicy.reject`.
+    max_queue: :class:`int`
+        The maximum amount of paginators that may wait for a slot if ``policy`` is :attr:`.AdmissionPolicy.queue`.
+        Defaults to ``100``.
+    queue_timeout: Optional[:class:`float`]
+        How long a paginator may wait for a slot, in seconds. Defaults to ``30.0``.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        ADMISSION = AdmissionController(per_user=1, total=500, policy=AdmissionPolicy.replace_oldest)
+
+        @bot.tree.command()
+        async def verify(interaction: discord.Interaction) -> None:
+            paginator = ModalPaginator(modals, admission=ADMISSION)
+            try:
+                await paginator.send(interaction)
+            except AdmissionRejected:
+                await interaction.response.send_message("Too many people are verifying, try again later.")
+    """
+
+    def __init__(
+        self,
+        *,
+        per_user: Optional[int] = None,
+        per_guild: Optional[int] = None,
+        total: Optional[int] = None,
+        policy: AdmissionPolicy = AdmissionPolicy.reject,
+        max_queue: int = 100,
+        queue_timeout: Optional[float] = 30.0,
+    ) -> None:
+        self.per_user: Optional[int] = per_user
+        self.per_guild: Optional[int] = per_guild
+        self.total: Optional[int] = total
+        self.policy: AdmissionPolicy = policy
+        self.max_queue: int = max_queue
+        self.queue_timeout: Optional[float] = queue_timeout
+
+        # paginator -> (user ID, guild ID)
+        self._sessions: Dict[ModalPaginator, Tuple[Optional[int], Optional[int]]] = {}
+        # user ID -> their paginators, oldest first
+        self._users: Dict[int, List[ModalPaginator]] = {}
+        self._guilds: Dict[int, int] = {}
+        self._waiting: int = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __repr__(self) -> str:
+        return f"<AdmissionController active={len(self._sessions)} waiting={self._waiting} policy={self.policy}>"
+
+    @property
+    def waiting(self) -> int:
+        """:class:`int`: The amount of paginators that are waiting for a slot."""
+        return self._waiting
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        return self._condition
+
+    def _get_exceeded(self, user_id: Optional[int], guild_id: Optional[int]) -> Optional[Tuple[str, int]]:
+        if self.per_user is not None and user_id is not None and len(self._users.get(user_id, ())) >= self.per_user:
+            return ("user", self.per_user)
+        if self.per_guild is not None and guild_id is not None and self._guilds.get(guild_id, 0) >= self.per_guild:
+            return ("guild", self.per_guild)
+        if self.total is not None and len(self._sessions) >= self.total:
+            return ("total", self.total)
+
+        return None
+
+    def _get_replaceable(self, user_id: Optional[int], guild_id: Optional[int]) -> Optional[ModalPaginator]:
+        # the user's oldest paginator whose slot would let the new one in.
+        # stopping one that doesn't free the exceeded limit (e.g. in another guild) would cancel it for nothing
+        if user_id is None:
+            return None
+
+        sessions = self._users.get(user_id, [])
+        for session in sessions:
+            _, session_guild_id = self._sessions[session]
+            if self.per_user is not None and len(sessions) - 1 >= self.per_user:
+                continue
+            if self.per_guild is not None and guild_id is not None:
+                guild_count = self._guilds.get(guild_id, 0) - (session_guild_id == guild_id)
+                if guild_count >= self.per_guild:
+                    continue
+            if self.total is not None and len(self._sessions) - 1 >= self.total:
+                continue
+
+            return session
+
+        return None
+
+    def _would_wait(self, user_id: Optional[int], guild_id: Optional[int]) -> bool:
+        return (
+            self.policy is AdmissionPolicy.queue
+            and self._waiting < self.max_queue
+            and self._get_exceeded(user_id, guild_id) is not None
+        )
+
+    def can_admit(self, user_id: Optional[int] = None, guild_id: Optional[int] = None) -> bool:
+        """Returns whether a paginator of the given user and guild would be admitted right now without
+        replacing or waiting.
+
+        Parameters
+        -----------
+        user_id: Optional[:class:`int`]
+            The ID of the user. Defaults to ``None`` (not limited per user).
+        guild_id: Optional[:class:`int`]
+            The ID of the guild. Defaults to ``None`` (not limited per guild).
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the paginator would be admitted.
+        """
+        return self._get_exceeded(user_id, guild_id) is None
+
+    def _admit(self, paginator: ModalPaginator, user_id: Optional[int], guild_id: Optional[int]) -> None:
+        self._sessions[paginator] = (user_id, guild_id)
+        if user_id is not None:
+            self._users.setdefault(user_id, []).append(paginator)
+        if guild_id is not None:
+            self._guilds[guild_id] = self._guilds.get(guild_id, 0) + 1
+
+    async def acquire(
+        self, paginator: ModalPaginator, user_id: Optional[int] = None, guild_id: Optional[int] = None
+    ) -> None:
+        """Admits a paginator according to the limits and :attr:`policy`.
+
+        This is called in :meth:`.ModalPaginator.send`.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to admit.
+        user_id: Optional[:class:`int`]
+            The ID of the user of the paginator. Defaults to ``None`` (not limited per user).
+        guild_id: Optional[:class:`int`]
+            The ID of the guild of the paginator. Defaults to ``None`` (not limited per guild).
+
+        Raises
+        -------
+        AdmissionRejected
+            The paginator was not admitted.
+        """
+        if paginator in self._sessions:
+            return
+
+        exceeded = self._get_exceeded(user_id, guild_id)
+        if exceeded is None:
+            self._admit(paginator, user_id, guild_id)
+            return
+
+        if self.policy is AdmissionPolicy.reject:
+            raise AdmissionRejected(*exceeded)
+
+        if self.policy is AdmissionPolicy.replace_oldest:
+            oldest = self._get_replaceable(user_id, guild_id)
+            if oldest is None:
+                raise AdmissionRejected(*exceeded)
+
+            # releases the slot, see ModalPaginator.stop
+            oldest.stop()
+            self._admit(paginator, user_id, guild_id)
+            # so the replaced paginator's buttons don't look like they still work
+            await oldest._edit_stopped_message()  # pyright: ignore [reportPrivateUsage]
+            return
+
+        if self._waiting >= self.max_queue:
+            raise AdmissionRejected("queue", self.max_queue)
+
+        condition = self._get_condition()
+        self._waiting += 1
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self._get_exceeded(user_id, guild_id) is None),
+                    timeout=self.queue_timeout,
+                )
+                self._admit(paginator, user_id, guild_id)
+        except asyncio.TimeoutError:
+            raise AdmissionRejected(*exceeded) from None
+        finally:
+            self._waiting -= 1
+
+    def release(self, paginator: ModalPaginator) -> None:
+        """Releases the slot of a paginator. Does nothing if the paginator wasn't admitted.
+
+        This is called when the paginator is stopped.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to release.
+        """
+        try:
+            user_id, guild_id = self._sessions.pop(paginator)
+        except KeyError:
+            return
+
+        if user_id is not None:
+            sessions = self._users[user_id]
+            sessions.remove(paginator)
+            if not sessions:
+                # don't keep a key for every user that ever had a session
+                del self._users[user_id]
+        if guild_id is not None:
+            count = self._guilds[guild_id] - 1
+            if count:
+                self._guilds[guild_id] = count
+            else:
+                del self._guilds[guild_id]
+
+        if self._waiting and self._condition is not None:
+            asyncio.get_running_loop().create_task(self._notify())
+
+    async def _notify(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
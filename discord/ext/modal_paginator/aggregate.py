@@ -0,0 +1,281 @@
+from __future__ import annotations
+import heapq
+import sys
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .utils import question_key
+
+if TYPE_CHECKING:
+    from .core import ModalPaginator
+
+__all__ = (
+    "FormAggregator",
+    "QuestionSummary",
+)
+
+
+class _Column:
+    # answers are dictionary encoded: each distinct (interned) answer gets a code
+    # and the column only counts the answers per code instead of storing them
+    # the lengths are counted too, text inputs are at most 4000 characters so there are few distinct lengths
+    __slots__ = ("responses", "values", "counts", "length_counts", "_lookup", "length_sum", "empty")
+
+    def __init__(self) -> None:
+        self.responses: int = 0
+        self.values: List[str] = []
+        self.counts: List[int] = []
+        self.length_counts: Dict[int, int] = {}
+        self._lookup: Dict[str, int] = {}
+        self.length_sum: int = 0
+        self.empty: int = 0
+
+    def append(self, value: str) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self._lookup[value] = code
+            self.values.append(value)
+            self.counts.append(0)
+
+        self.counts[code] += 1
+        self.responses += 1
+        self.length_counts[len(value)] = self.length_counts.get(len(value), 0) + 1
+        self.length_sum += len(value)
+        if not value:
+            self.empty += 1
+
+
+def _median(lengths: List[Tuple[int, int]], total: int) -> float:
+    # lengths are (length, count) pairs sorted by length
+    if not total:
+        return 0.0
+
+    # the middle positions, the same position if the total is odd
+    low, high = (total - 1) // 2, total // 2
+    low_length: Optional[int] = None
+    seen = 0
+    for length, count in lengths:
+        seen += count
+        if low_length is None and seen > low:
+            low_length = length
+        if seen > high:
+            return (low_length + length) / 2  # type: ignore  # set in this or a previous iteration
+
+    return 0.0
+
+
+class QuestionSummary:
+    """Represents the statistics of the answers to a single question, returned by :meth:`FormAggregator.summary`.
+
+    This is a snapshot, answers that are added to the aggregator afterwards are not included.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    question: :class:`str`
+        The question. This is the custom ID of the text input if it was explicitly passed, else the label.
+    responses: :class:`int`
+        The amount of sessions that answered the question, including empty answers.
+    empty: :class:`int`
+        The amount of empty answers.
+    distinct: :class:`int`
+        The amount of distinct answers.
+    min_length: :class:`int`
+        The length of the shortest answer.
+    max_length: :class:`int`
+        The length of the longest answer.
+    mean_length: :class:`float`
+        The mean length of the answers.
+    median_length: :class:`float`
+        The median length of the answers.
+    """
+
+    __slots__ = (
+        "question",
+        "responses",
+        "empty",
+        "distinct",
+        "min_length",
+        "max_length",
+        "mean_length",
+        "median_length",
+        "_lengths",
+        "_counts",
+    )
+
+    def __init__(self, question: str, column: _Column) -> None:
+        self.question: str = question
+        self.responses: int = column.responses
+        self.empty: int = column.empty
+        self.distinct: int = len(column.values)
+
+        # snapshots of the column, the summary doesn't change when more answers are added
+        self._lengths: List[Tuple[int, int]] = sorted(column.length_counts.items())
+        self._counts: List[Tuple[str, int]] = list(zip(column.values, column.counts))
+
+        self.min_length: int = self._lengths[0][0] if self._lengths else 0
+        self.max_length: int = self._lengths[-1][0] if self._lengths else 0
+        self.mean_length: float = column.length_sum / self.responses if self.responses else 0.0
+        self.median_length: float = _median(self._lengths, self.responses)
+
+    def __repr__(self) -> str:
+        return (
+            f"<QuestionSummary question={self.question!r} responses={self.responses} "
+            f"empty_rate={self.empty_rate:.2f}>"
+        )
+
+    @property
+    def empty_rate(self) -> float:
+        """:class:`float`: The fraction of answers that were empty, between ``0.0`` and ``1.0``."""
+        if not self.responses:
+            return 0.0
+
+        return self.empty / self.responses
+
+    def top_values(self, amount: int = 5, *, include_empty: bool = False) -> List[Tuple[str, int]]:
+        """Returns the most common answers and how many times they were given.
+
+        Parameters
+        -----------
+        amount: :class:`int`
+            The amount of answers to return. Defaults to ``5``.
+        include_empty: :class:`bool`
+            Whether to include empty answers. Defaults to ``False``.
+
+        Returns
+        --------
+        List[Tuple[:class:`str`, :class:`int`]]
+            The answers and their counts, most common first.
+        """
+        pairs: Iterable[Tuple[str, int]] = self._counts
+        if not include_empty:
+            pairs = (pair for pair in pairs if pair[0])
+
+        return heapq.nlargest(amount, pairs, key=lambda pair: pair[1])
+
+    def length_distribution(self, bucket_size: int = 100) -> Dict[int, int]:
+        """Returns how many answers fall into each length bucket.
+
+        Parameters
+        -----------
+        bucket_size: :class:`int`
+            The size of each bucket. Defaults to ``100``.
+
+        Returns
+        --------
+        Dict[:class:`int`, :class:`int`]
+            A mapping of the start of each bucket to the amount of answers in it, sorted by bucket.
+        """
+        buckets: Dict[int, int] = {}
+        for length, count in self._lengths:
+            bucket = (length // bucket_size) * bucket_size
+            buckets[bucket] = buckets.get(bucket, 0) + count
+
+        return buckets
+
+
+class FormAggregator:
+    """Collects the answers of many finished sessions of the same form for per-question statistics.
+
+    The answers are appended to compact per-question columns so the paginators don't
+    have to be kept alive after they are added.
+
+    An instance can be passed as the ``collector`` of :func:`~discord.ext.modal_paginator.broadcast.broadcast`.
+
+    .. versionadded:: 1.3
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        aggregator = FormAggregator()
+
+        async def on_finish(paginator: ModalPaginator, interaction: discord.Interaction) -> None:
+            aggregator.add(paginator)
+
+        ...
+        summary = aggregator.summary("What is your favorite color?")
+        print(summary.responses, summary.empty_rate, summary.top_values(3))
+    """
+
+    __slots__ = ("_columns", "_sessions")
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, _Column] = {}
+        self._sessions: int = 0
+
+    def __len__(self) -> int:
+        return self._sessions
+
+    def __call__(self, paginator: ModalPaginator) -> None:
+        self.add(paginator)
+
+    @property
+    def questions(self) -> List[str]:
+        """List[:class:`str`]: The questions that have been answered, in the order they were first seen."""
+        return list(self._columns)
+
+    def add(self, paginator: ModalPaginator) -> None:
+        """Adds the answers of a paginator to the aggregator.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to add the answers of.
+        """
+        self.add_answers({question_key(inp): inp.value for inp in paginator.text_inputs})
+
+    def add_answers(self, answers: Dict[str, Optional[str]]) -> None:
+        """Adds a mapping of question to answer to the aggregator.
+
+        Parameters
+        -----------
+        answers: Dict[:class:`str`, Optional[:class:`str`]]
+            The answers to add. ``None`` is counted as an empty answer.
+        """
+        for question, answer in answers.items():
+            column = self._columns.get(question)
+            if column is None:
+                column = self._columns[sys.intern(question)] = _Column()
+
+            column.append(answer or "")
+
+        self._sessions += 1
+
+    def summary(self, question: str) -> QuestionSummary:
+        """Returns the statistics of the answers to the given question.
+
+        Parameters
+        -----------
+        question: :class:`str`
+            The question. See :attr:`QuestionSummary.question`.
+
+        Raises
+        -------
+        KeyError
+            The question has not been answered.
+
+        Returns
+        --------
+        :class:`QuestionSummary`
+            The statistics.
+        """
+        return QuestionSummary(question, self._columns[question])
+
+    def summaries(self) -> Dict[str, QuestionSummary]:
+        """Returns the statistics of all questions.
+
+        Returns
+        --------
+        Dict[:class:`str`, :class:`QuestionSummary`]
+            A mapping of question to its statistics.
+        """
+        return {question: QuestionSummary(question, column) for question, column in self._columns.items()}
+
+    def clear(self) -> None:
+        """Removes all collected answers."""
+        self._columns.clear()
+        self._sessions = 0
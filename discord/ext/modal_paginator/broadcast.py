@@ -0,0 +1,290 @@
+from __future__ import annotations
+import asyncio
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+import discord
+
+from .core import MessageT, ModalPaginator
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+else:
+    Self = Any
+
+PaginatorFactory = Callable[[discord.abc.Messageable], ModalPaginator]
+SessionCollector = Callable[[ModalPaginator], Union[Coroutine[Any, Any, Any], Any]]
+
+__all__ = (
+    "BroadcastResult",
+    "BroadcastReport",
+    "broadcast",
+)
+
+
+class BroadcastResult:
+    """Represents the result of sending a paginator to a single recipient using :func:`broadcast`.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    recipient: :class:`discord.abc.Messageable`
+        The recipient the paginator was sent to.
+    paginator: :class:`.ModalPaginator`
+        The paginator that was sent.
+    message: Optional[Union[:class:`~discord.Message`, :class:`~discord.WebhookMessage`, :class:`~discord.InteractionMessage`]]
+        The message that was sent or ``None`` if sending failed.
+    error: Optional[:class:`Exception`]
+        The error that was raised on the last attempt or ``None`` if sending succeeded.
+    attempts: :class:`int`
+        How many times sending was attempted.
+    elapsed: :class:`float`
+        How long it took to send the paginator in seconds, including retries.
+    """  # noqa: E501
+
+    __slots__ = ("recipient", "paginator", "message", "error", "attempts", "elapsed")
+
+    def __init__(self, recipient: discord.abc.Messageable, paginator: ModalPaginator) -> None:
+        self.recipient: discord.abc.Messageable = recipient
+        self.paginator: ModalPaginator = paginator
+        self.message: Optional[MessageT] = None
+        self.error: Optional[Exception] = None
+        self.attempts: int = 0
+        self.elapsed: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<BroadcastResult recipient={self.recipient!r} success={self.success} attempts={self.attempts}>"
+
+    @property
+    def success(self) -> bool:
+        """:class:`bool`: Whether the paginator was sent."""
+        return self.message is not None
+
+
+class BroadcastReport:
+    """Represents the outcome of :func:`broadcast`.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    results: List[:class:`BroadcastResult`]
+        The results per recipient, in the same order as the recipients were given.
+    rate_limited: :class:`int`
+        How many times a 429 (rate limited) response was received.
+    elapsed: :class:`float`
+        How long the whole broadcast took in seconds.
+    """
+
+    __slots__ = ("results", "rate_limited", "elapsed", "_session_tasks")
+
+    def __init__(self) -> None:
+        self.results: List[BroadcastResult] = []
+        self.rate_limited: int = 0
+        self.elapsed: float = 0.0
+        self._session_tasks: List[asyncio.Task[Any]] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"<BroadcastReport sent={len(self.succeeded)} failed={len(self.failed)} "
+            f"rate_limited={self.rate_limited} elapsed={self.elapsed:.2f}>"
+        )
+
+    @property
+    def succeeded(self) -> List[BroadcastResult]:
+        """List[:class:`BroadcastResult`]: The results of the recipients the paginator was sent to."""
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> List[BroadcastResult]:
+        """List[:class:`BroadcastResult`]: The results of the recipients the paginator couldn't be sent to."""
+        return [result for result in self.results if not result.success]
+
+    @property
+    def throughput(self) -> float:
+        """:class:`float`: The amount of paginators sent per second."""
+        if not self.elapsed:
+            return 0.0
+
+        return len(self.succeeded) / self.elapsed
+
+    async def wait(self, *, timeout: Optional[float] = None) -> None:
+        """Waits until all sent paginators are stopped (finished, cancelled or timed out)
+        and passed to the ``collector``, if any.
+
+        Parameters
+        -----------
+        timeout: Optional[:class:`float`]
+            How long to wait for in seconds. Defaults to ``None`` (wait forever).
+
+        Raises
+        -------
+        asyncio.TimeoutError
+            The timeout was reached. The paginators are still collected when they stop.
+        """
+        if self._session_tasks:
+            # shielded so that the sessions are still collected if waiting times out
+            await asyncio.wait_for(asyncio.shield(asyncio.gather(*self._session_tasks)), timeout=timeout)
+
+
+class _AdaptiveLimiter:
+    # additive increase, multiplicative decrease on rate limits
+    def __init__(self, maximum: int) -> None:
+        self.maximum: int = maximum
+        self.limit: int = maximum
+        self._in_flight: int = 0
+        self._successes: int = 0
+        self._condition: asyncio.Condition = asyncio.Condition()
+
+    async def __aenter__(self) -> Self:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        self._successes += 1
+        if self.limit < self.maximum and self._successes >= self.limit:
+            self._successes = 0
+            self.limit += 1
+
+    def on_rate_limit(self) -> None:
+        self._successes = 0
+        self.limit = max(1, self.limit // 2)
+
+
+def _get_retry_after(error: Exception) -> Optional[float]:
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+
+    if isinstance(error, discord.HTTPException) and error.status == 429:
+        retry_after = getattr(error.response, "headers", {}).get("Retry-After")
+        try:
+            return float(retry_after) if retry_after is not None else 1.0
+        except ValueError:
+            return 1.0
+
+    return None
+
+
+async def broadcast(
+    factory: PaginatorFactory,
+    recipients: Iterable[discord.abc.Messageable],
+    *,
+    concurrency: int = 5,
+    max_retries: int = 3,
+    collector: Optional[SessionCollector] = None,
+    **kwargs: Any,
+) -> BroadcastReport:
+    """Sends a paginator to many recipients (e.g. members or channels) with bounded concurrency.
+
+    The amount of paginators that are sent at the same time is lowered when a recipient is rate limited
+    and slowly raised again up to ``concurrency`` while sending succeeds.
+    Rate limited recipients are retried after the time Discord told us to wait.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    factory: Callable[[:class:`discord.abc.Messageable`], :class:`.ModalPaginator`]
+        A callable that creates a new paginator for the given recipient.
+    recipients: Iterable[:class:`discord.abc.Messageable`]
+        The recipients to send the paginator to.
+    concurrency: :class:`int`
+        The maximum amount of paginators to send at the same time. Defaults to ``5``.
+    max_retries: :class:`int`
+        How many times to retry sending to a recipient after being rate limited. Defaults to ``3``.
+    collector: Optional[Callable[[:class:`.ModalPaginator`], Any]]
+        A callable that is called with each sent paginator after it stopped (finished, cancelled or timed out).
+        Optionally async. Use :meth:`BroadcastReport.wait` to wait for all of them.
+    **kwargs: Any
+        Additional keyword arguments to pass to :meth:`.ModalPaginator.send`.
+
+    Returns
+    --------
+    :class:`BroadcastReport`
+        The results of the broadcast.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        report = await broadcast(
+            lambda member: ModalPaginator.from_text_inputs("Why should you stay verified?"),
+            guild.members,
+            content="Please re-verify!",
+            collector=save_answers,
+        )
+        print(f"Sent to {len(report.succeeded)} members at {report.throughput:.1f}/s")
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    report = BroadcastReport()
+    limiter = _AdaptiveLimiter(concurrency)
+    queue: asyncio.Queue[BroadcastResult] = asyncio.Queue()
+    for recipient in recipients:
+        result = BroadcastResult(recipient, factory(recipient))
+        report.results.append(result)
+        queue.put_nowait(result)
+
+    async def collect(paginator: ModalPaginator) -> None:
+        await paginator.wait()
+        if collector is not None:
+            await discord.utils.maybe_coroutine(collector, paginator)
+
+    async def send(result: BroadcastResult) -> None:
+        start = time.perf_counter()
+        while True:
+            result.attempts += 1
+            async with limiter:
+                try:
+                    result.message = await result.paginator.send(result.recipient, **kwargs)
+                except Exception as error:
+                    result.error = error
+                else:
+                    result.error = None
+
+            retry_after = _get_retry_after(result.error) if result.error is not None else None
+            if retry_after is None:
+                break
+
+            report.rate_limited += 1
+            limiter.on_rate_limit()
+            if result.attempts > max_retries:
+                break
+
+            await asyncio.sleep(retry_after)
+
+        result.elapsed = time.perf_counter() - start
+        if result.success:
+            limiter.on_success()
+            report._session_tasks.append(asyncio.create_task(collect(result.paginator)))  # pyright: ignore [reportPrivateUsage] # noqa: E501
+        else:
+            result.paginator.stop()
+
+    async def worker() -> None:
+        while not queue.empty():
+            await send(queue.get_nowait())
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, queue.qsize()))))
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,174 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple, Type
+
+import discord
+
+from .custom_button import CustomButton
+from .default_buttons import BUTTONS as DEFAULT_BUTTONS
+from .errors import InvalidButtonKey
+
+if TYPE_CHECKING:
+    from .core import ButtonKeysLiteral, CustomButtons, ModalPaginator
+else:
+    ButtonKeysLiteral = str
+    CustomButtons = Dict[str, Optional[discord.ui.Button[Any]]]
+    ModalPaginator = Any
+
+# style, label, emoji, row
+_ButtonAttrs = Tuple[discord.ButtonStyle, Optional[str], Optional[discord.PartialEmoji], Optional[int]]
+
+__all__ = ("ButtonSet",)
+
+
+def _get_attrs(button: discord.ui.Button[Any]) -> _ButtonAttrs:
+    return (button.style, button.label, button.emoji, button.row)
+
+
+def _scratch_button(attrs: _ButtonAttrs) -> discord.ui.Button[Any]:
+    style, label, emoji, row = attrs
+    return discord.ui.Button(style=style, label=label, emoji=emoji, row=row)
+
+
+class _CompiledButton:
+    __slots__ = ("base", "required", "optional", "callback")
+
+    def __init__(
+        self,
+        base: _ButtonAttrs,
+        required: _ButtonAttrs,
+        optional: _ButtonAttrs,
+        callback: Optional[Callable[..., Any]],
+    ) -> None:
+        self.base: _ButtonAttrs = base
+        self.required: _ButtonAttrs = required
+        self.optional: _ButtonAttrs = optional
+        self.callback: Optional[Callable[..., Any]] = callback
+
+    @staticmethod
+    def apply(button: discord.ui.Button[Any], attrs: _ButtonAttrs) -> None:
+        style, label, emoji, row = attrs
+        if button.style is not style:
+            button.style = style
+        if button.label != label:
+            button.label = label
+        if button.emoji != emoji:
+            button.emoji = emoji
+        if button.row != row:
+            button.row = row
+
+
+class ButtonSet:
+    """A precompiled set of buttons to pass to the ``buttons`` kwarg in :class:`.ModalPaginator`.
+
+    The given buttons are validated and resolved against the default buttons once.
+    The :meth:`.CustomButton.on_required_modal` and :meth:`.CustomButton.on_optional_modal`
+    hooks are also called once, on a scratch button, and their result is stored so that
+    changing the state of the buttons is a lookup instead of calling the hooks again.
+    This means that the hooks should only change the style, label or emoji of the button
+    and not depend on the state of the paginator.
+
+    The same instance can, and should, be reused for all paginators that use the same buttons.
+    A dictionary passed to ``buttons`` is converted to a new instance of this class for every paginator.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    buttons: Optional[Dict[:class:`str`, Optional[:class:`discord.ui.Button`]]]
+        The buttons to customize the default buttons with. Same as the ``buttons`` kwarg in :class:`.ModalPaginator`.
+
+    Raises
+    -------
+    InvalidButtonKey
+        A key in ``buttons`` is not a valid button key.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        BUTTONS = ButtonSet({"FINISH": CustomButton(label="Done"), "CANCEL": None})
+
+        paginator = ModalPaginator(modals, buttons=BUTTONS)
+    """
+
+    __slots__ = ("_buttons", "_removed", "_compiled")
+
+    def __init__(self, buttons: Optional[CustomButtons] = None) -> None:
+        if buttons is None:
+            buttons = {}
+
+        for name in buttons:
+            if name not in DEFAULT_BUTTONS:
+                raise InvalidButtonKey(name, tuple(DEFAULT_BUTTONS.keys()))
+
+        self._buttons: Dict[ButtonKeysLiteral, discord.ui.Button[Any]] = {}
+        removed: list[ButtonKeysLiteral] = []
+        for name, default_button in DEFAULT_BUTTONS.items():
+            button = buttons.get(name, default_button)
+            if button is None:
+                removed.append(name)
+            else:
+                self._buttons[name] = button
+
+        self._removed: FrozenSet[ButtonKeysLiteral] = frozenset(removed)
+        # the defaults of the buttons on the paginator can differ per (sub)class
+        self._compiled: Dict[Type[Any], Dict[ButtonKeysLiteral, _CompiledButton]] = {}
+
+    def __repr__(self) -> str:
+        return f"<ButtonSet removed={sorted(self._removed)!r}>"
+
+    @property
+    def removed(self) -> FrozenSet[ButtonKeysLiteral]:
+        """FrozenSet[:class:`str`]: The keys of the buttons that are removed from the paginator."""
+        return self._removed
+
+    def _compile(
+        self, paginator: ModalPaginator, defaults: Mapping[ButtonKeysLiteral, discord.ui.Button[Any]]
+    ) -> Dict[ButtonKeysLiteral, _CompiledButton]:
+        try:
+            return self._compiled[type(paginator)]
+        except KeyError:
+            pass
+
+        compiled: Dict[ButtonKeysLiteral, _CompiledButton] = {}
+        for name, button in self._buttons.items():
+            scratch = _scratch_button(_get_attrs(defaults[name]))
+            CustomButton._copy_attrs(scratch, button)  # pyright: ignore [reportPrivateUsage]
+            base = _get_attrs(scratch)
+
+            required = optional = base
+            if isinstance(button, CustomButton):
+                scratch = _scratch_button(base)
+                button.on_required_modal(scratch)
+                required = _get_attrs(scratch)
+
+                scratch = _scratch_button(base)
+                button.on_optional_modal(scratch)
+                optional = _get_attrs(scratch)
+
+            callback = button.callback if isinstance(button, CustomButton) and button._override_callback else None  # pyright: ignore [reportPrivateUsage] # noqa: E501
+            compiled[name] = _CompiledButton(base, required, optional, callback)
+
+        self._compiled[type(paginator)] = compiled
+        return compiled
+
+    def _apply(self, paginator: ModalPaginator, defaults: Mapping[ButtonKeysLiteral, discord.ui.Button[Any]]) -> None:
+        for name, compiled in self._compile(paginator, defaults).items():
+            button = defaults[name]
+            _CompiledButton.apply(button, compiled.base)
+            if compiled.callback is not None:
+                button.callback = compiled.callback
+
+        for name in self._removed:
+            paginator.remove_item(defaults[name])
+
+    def _apply_state(
+        self,
+        paginator: ModalPaginator,
+        defaults: Mapping[ButtonKeysLiteral, discord.ui.Button[Any]],
+        *,
+        required: bool,
+    ) -> None:
+        for name, compiled in self._compile(paginator, defaults).items():
+            _CompiledButton.apply(defaults[name], compiled.required if required else compiled.optional)
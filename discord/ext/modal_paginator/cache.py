@@ -0,0 +1,204 @@
+from __future__ import annotations
+from collections import OrderedDict
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+
+__all__ = (
+    "CheckCache",
+    "AnswerCache",
+)
+
+
+class CheckCache:
+    """A TTL cache for the results of the ``check`` passed to :class:`.ModalPaginator`.
+
+    The results are cached per user so that an expensive check (e.g. one that resolves roles
+    or queries a database) only runs once per ``ttl`` seconds for each user.
+
+    The same instance can be passed to multiple paginators that use the same check.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    ttl: :class:`float`
+        How long a result should be cached for, in seconds.
+    max_size: Optional[:class:`int`]
+        The maximum amount of users to cache results for.
+        The least recently used result is removed when this is exceeded. Defaults to ``None`` (no limit).
+    """
+
+    def __init__(self, ttl: float, *, max_size: Optional[int] = None) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0.")
+
+        self.ttl: float = ttl
+        self.max_size: Optional[int] = max_size
+        self._results: OrderedDict[int, Tuple[float, bool]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, user_id: int, /) -> Optional[bool]:
+        """Returns the cached result for the given user.
+
+        Parameters
+        -----------
+        user_id: :class:`int`
+            The ID of the user.
+
+        Returns
+        --------
+        Optional[:class:`bool`]
+            The cached result or ``None`` if there is none or it has expired.
+        """
+        try:
+            expires_at, result = self._results[user_id]
+        except KeyError:
+            return None
+
+        if expires_at <= time.monotonic():
+            del self._results[user_id]
+            return None
+
+        self._results.move_to_end(user_id)
+        return result
+
+    def set(self, user_id: int, result: bool, /) -> None:
+        """Caches the result for the given user.
+
+        Parameters
+        -----------
+        user_id: :class:`int`
+            The ID of the user.
+        result: :class:`bool`
+            The result of the check.
+        """
+        self._results[user_id] = (time.monotonic() + self.ttl, result)
+        self._results.move_to_end(user_id)
+        if self.max_size is not None:
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None, /) -> None:
+        """Removes the cached result for the given user or all results if ``user_id`` is ``None``.
+
+        Parameters
+        -----------
+        user_id: Optional[:class:`int`]
+            The ID of the user. Defaults to ``None``.
+        """
+        if user_id is None:
+            self._results.clear()
+        else:
+            self._results.pop(user_id, None)
+
+
+class AnswerCache:
+    r"""A TTL cache for the answers of finished or cancelled :class:`.ModalPaginator`\s.
+
+    The answers are cached per user and form so that text inputs can be prefilled with
+    what the user answered last time, e.g. when they retry after a failed verification.
+    See the ``answer_cache`` and ``form_id`` kwargs of :class:`.ModalPaginator`.
+
+    The same instance can be passed to multiple paginators, also of different forms.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    ttl: :class:`float`
+        How long answers should be cached for, in seconds.
+    max_size: Optional[:class:`int`]
+        The maximum amount of user and form pairs to cache answers for.
+        The least recently used answers are removed when this is exceeded. Defaults to ``None`` (no limit).
+    """
+
+    def __init__(self, ttl: float, *, max_size: Optional[int] = None) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0.")
+
+        self.ttl: float = ttl
+        self.max_size: Optional[int] = max_size
+        self._answers: OrderedDict[Tuple[int, str], Tuple[float, Dict[str, str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    def get(self, user_id: int, form_id: str, /) -> Optional[Dict[str, str]]:
+        """Returns the cached answers of the given user to the given form.
+
+        Parameters
+        -----------
+        user_id: :class:`int`
+            The ID of the user.
+        form_id: :class:`str`
+            The ID of the form.
+
+        Returns
+        --------
+        Optional[Dict[:class:`str`, :class:`str`]]
+            A mapping of question to answer or ``None`` if there are none or they have expired.
+        """
+        key = (user_id, form_id)
+        try:
+            expires_at, answers = self._answers[key]
+        except KeyError:
+            return None
+
+        if expires_at <= time.monotonic():
+            del self._answers[key]
+            return None
+
+        self._answers.move_to_end(key)
+        return answers.copy()
+
+    def set(self, user_id: int, form_id: str, answers: Mapping[str, Optional[str]], /) -> None:
+        """Caches the answers of the given user to the given form.
+
+        Empty answers are not cached. Answers to questions that are not in ``answers``
+        but were cached before are kept, so answers of an earlier session are not lost
+        if a later one was cancelled halfway through.
+
+        Parameters
+        -----------
+        user_id: :class:`int`
+            The ID of the user.
+        form_id: :class:`str`
+            The ID of the form.
+        answers: Mapping[:class:`str`, Optional[:class:`str`]]
+            A mapping of question to answer.
+        """
+        key = (user_id, form_id)
+        merged = self.get(user_id, form_id) or {}
+        merged.update((question, answer) for question, answer in answers.items() if answer)
+        if not merged:
+            return
+
+        self._answers[key] = (time.monotonic() + self.ttl, merged)
+        self._answers.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._answers) > self.max_size:
+                self._answers.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None, form_id: Optional[str] = None, /) -> None:
+        """Removes cached answers.
+
+        Parameters
+        -----------
+        user_id: Optional[:class:`int`]
+            The ID of the user to remove the answers of. Defaults to ``None`` (all users).
+        form_id: Optional[:class:`str`]
+            The ID of the form to remove the answers of. Defaults to ``None`` (all forms).
+        """
+        if user_id is not None and form_id is not None:
+            self._answers.pop((user_id, form_id), None)
+            return
+
+        for key in [
+            key
+            for key in self._answers
+            if (user_id is None or key[0] == user_id) and (form_id is None or key[1] == form_id)
+        ]:
+            del self._answers[key]
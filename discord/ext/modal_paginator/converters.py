@@ -0,0 +1,283 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import asyncio
+import datetime
+import re
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+import discord
+
+
+T = TypeVar("T")
+
+_ID_REGEX = re.compile(r"^(?:<@[!&]?)?([0-9]{15,20})>?$")
+
+__all__ = (
+    "Converter",
+    "IntConverter",
+    "FloatConverter",
+    "DateConverter",
+    "RoleConverter",
+    "MemberConverter",
+    "MemberResolver",
+)
+
+
+def _parse_id(value: str) -> Optional[int]:
+    match = _ID_REGEX.match(value.strip())
+    return int(match.group(1)) if match else None
+
+
+class Converter(ABC, Generic[T]):
+    """The base class for converters that can be attached to text inputs in a :class:`.PaginatorModal`.
+
+    Subclass this and override :meth:`convert` to create your own converter.
+
+    See :meth:`.PaginatorModal.set_converter` for how to attach a converter to a text input.
+
+    .. versionadded:: 1.3
+    """
+
+    @abstractmethod
+    async def convert(self, interaction: discord.Interaction[Any], value: str) -> T:
+        """Converts the value of a text input.
+
+        This should raise an exception (e.g. :exc:`ValueError`) if the value can't be converted,
+        it will be wrapped in a :exc:`.ConversionError`.
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction the conversion is for.
+        value: :class:`str`
+            The value of the text input. Never empty.
+
+        Returns
+        --------
+        Any
+            The converted value.
+        """
+
+
+class IntConverter(Converter[int]):
+    """Converts the value to an :class:`int`.
+
+    .. versionadded:: 1.3
+    """
+
+    async def convert(self, interaction: discord.Interaction[Any], value: str) -> int:
+        return int(value.strip().replace(",", ""))
+
+
+class FloatConverter(Converter[float]):
+    """Converts the value to a :class:`float`.
+
+    .. versionadded:: 1.3
+    """
+
+    async def convert(self, interaction: discord.Interaction[Any], value: str) -> float:
+        return float(value.strip().replace(",", ""))
+
+
+class DateConverter(Converter[datetime.date]):
+    """Converts the value to a :class:`datetime.date` using the given formats.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    *formats: :class:`str`
+        The :meth:`~datetime.datetime.strptime` formats to try, in order. Defaults to ``"%Y-%m-%d"``.
+    """
+
+    def __init__(self, *formats: str) -> None:
+        self.formats: Tuple[str, ...] = formats or ("%Y-%m-%d",)
+
+    async def convert(self, interaction: discord.Interaction[Any], value: str) -> datetime.date:
+        value = value.strip()
+        for fmt in self.formats:
+            try:
+                return datetime.datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+
+        raise ValueError(f"{value!r} does not match any of the formats: {', '.join(self.formats)}")
+
+
+class RoleConverter(Converter[discord.Role]):
+    """Converts the value to a :class:`discord.Role` of the interaction's guild.
+
+    The value can be an ID, a mention or a name (case-insensitive).
+    Only the guild's cache is used, so this never makes an API request.
+
+    .. versionadded:: 1.3
+    """
+
+    async def convert(self, interaction: discord.Interaction[Any], value: str) -> discord.Role:
+        guild = interaction.guild
+        if guild is None:
+            raise ValueError("Roles can only be converted in a guild.")
+
+        role_id = _parse_id(value)
+        role = guild.get_role(role_id) if role_id is not None else None
+        if role is None:
+            name = value.strip().casefold()
+            role = discord.utils.find(lambda r: r.name.casefold() == name, guild.roles)
+
+        if role is None:
+            raise ValueError(f"Role {value!r} not found.")
+
+        return role
+
+
+class MemberResolver:
+    r"""Resolves members in batches.
+
+    Members are looked up in the guild's cache first. Member IDs that aren't cached
+    are collected for ``delay`` seconds and then resolved using a single
+    :meth:`discord.Guild.query_members` call per guild (up to 100 IDs per call, the calls are made concurrently),
+    so converting many answers of one or multiple sessions at once doesn't make one request per answer.
+    If a call fails, the lookups of its IDs raise the exception.
+    Names that aren't cached can't be batched but identical lookups that are in progress are shared.
+
+    The same instance should be shared by all converters that should be batched together,
+    by default all :class:`MemberConverter`\s share one.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    delay: :class:`float`
+        How long to collect IDs for before resolving them, in seconds. Defaults to ``0.05``.
+    """
+
+    def __init__(self, *, delay: float = 0.05) -> None:
+        self.delay: float = delay
+        self._pending: Dict[int, Tuple[discord.Guild, Dict[int, asyncio.Future[Optional[discord.Member]]]]] = {}
+        self._name_lookups: Dict[Tuple[int, str], asyncio.Future[Optional[discord.Member]]] = {}
+
+    async def resolve(self, guild: discord.Guild, value: str) -> Optional[discord.Member]:
+        """Resolves a member by ID, mention or name.
+
+        Parameters
+        -----------
+        guild: :class:`discord.Guild`
+            The guild to resolve the member in.
+        value: :class:`str`
+            The ID, mention or name of the member.
+
+        Returns
+        --------
+        Optional[:class:`discord.Member`]
+            The member or ``None`` if not found.
+        """
+        user_id = _parse_id(value)
+        if user_id is not None:
+            return guild.get_member(user_id) or await self._resolve_id(guild, user_id)
+
+        return guild.get_member_named(value.strip()) or await self._resolve_name(guild, value.strip())
+
+    def _resolve_id(self, guild: discord.Guild, user_id: int) -> asyncio.Future[Optional[discord.Member]]:
+        try:
+            _, futures = self._pending[guild.id]
+        except KeyError:
+            futures = {}
+            self._pending[guild.id] = (guild, futures)
+            asyncio.get_running_loop().call_later(self.delay, self._schedule_flush, guild.id)
+
+        future = futures.get(user_id)
+        if future is None:
+            future = futures[user_id] = asyncio.get_running_loop().create_future()
+
+        return future
+
+    def _schedule_flush(self, guild_id: int) -> None:
+        guild, futures = self._pending.pop(guild_id)
+        asyncio.create_task(self._flush(guild, futures))
+
+    async def _flush(self, guild: discord.Guild, futures: Dict[int, asyncio.Future[Optional[discord.Member]]]) -> None:
+        chunks = list(discord.utils.as_chunks(list(futures), 100))
+        results = await asyncio.gather(
+            *(guild.query_members(user_ids=chunk, limit=len(chunk), cache=True) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for chunk, result in zip(chunks, results):
+            members: Dict[int, discord.Member] = {}
+            if not isinstance(result, BaseException):
+                members = {member.id: member for member in result}
+
+            for user_id in chunk:
+                future = futures[user_id]
+                if future.done():
+                    continue
+
+                if isinstance(result, BaseException):
+                    # e.g. the request timed out, the lookups fail instead of making a request per ID
+                    future.set_exception(result)
+                else:
+                    future.set_result(members.get(user_id))
+
+    async def _resolve_name(self, guild: discord.Guild, name: str) -> Optional[discord.Member]:
+        key = (guild.id, name.casefold())
+        future = self._name_lookups.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = self._name_lookups[key] = asyncio.get_running_loop().create_future()
+        try:
+            members = await guild.query_members(query=name, limit=5, cache=True)
+            member = discord.utils.find(
+                lambda m: name.casefold() in (m.name.casefold(), m.display_name.casefold()), members
+            )
+            future.set_result(member)
+        except Exception:
+            # let the other lookups treat it as not found, the exception is raised here
+            future.set_result(None)
+            raise
+        finally:
+            del self._name_lookups[key]
+
+        return member
+
+
+_DEFAULT_RESOLVER: Optional[MemberResolver] = None
+
+
+class MemberConverter(Converter[discord.Member]):
+    """Converts the value to a :class:`discord.Member` of the interaction's guild.
+
+    The value can be an ID, a mention or a name. Lookups are batched using a :class:`MemberResolver`.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    resolver: Optional[:class:`MemberResolver`]
+        The resolver to use. Defaults to a resolver shared by all member converters.
+    """
+
+    def __init__(self, *, resolver: Optional[MemberResolver] = None) -> None:
+        self._resolver: Optional[MemberResolver] = resolver
+
+    @property
+    def resolver(self) -> MemberResolver:
+        """:class:`MemberResolver`: The resolver used by this converter."""
+        global _DEFAULT_RESOLVER
+        if self._resolver is None:
+            if _DEFAULT_RESOLVER is None:
+                _DEFAULT_RESOLVER = MemberResolver()
+
+            self._resolver = _DEFAULT_RESOLVER
+
+        return self._resolver
+
+    async def convert(self, interaction: discord.Interaction[Any], value: str) -> discord.Member:
+        guild = interaction.guild
+        if guild is None:
+            raise ValueError("Members can only be converted in a guild.")
+
+        member = await self.resolver.resolve(guild, value)
+        if member is None:
+            raise ValueError(f"Member {value!r} not found.")
+
+        return member
@@ -1,15 +1,23 @@
 from __future__ import annotations
+import asyncio
+import contextlib
+import logging
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ContextManager,
     Coroutine,
     Dict,
     Generic,
     List,
     Optional,
     Sequence,
+    Set,
     Literal,
+    Tuple,
+    Type,
     TypeVar,
     Union,
     overload,
@@ -18,9 +26,21 @@ from typing import (
 import discord
 from discord.ext import commands as _commands
 
-from .default_buttons import BUTTONS as DEFAULT_BUTTONS
-from .errors import InvalidButtonKey, NoModals, NotAModal
-from .custom_button import CustomButton
+from .admission import AdmissionController
+from .button_set import ButtonSet
+from .cache import AnswerCache, CheckCache
+from .converters import Converter
+from .delta import SubmitDelta
+from .drafts import DraftAutosaver
+from .enums import AdvancePolicy, SessionState
+from .errors import ConversionError, NoModals, NotAModal
+from .events import EventBus, ModalSubmitEvent, PageChangeEvent, PaginatorEvent, SessionEndEvent, SessionStartEvent
+from .registry import registry
+from .renderer import ContentRenderer, Renderer
+from .review import AnswerReview
+from .throttle import ClickThrottle, _TokenBucket  # pyright: ignore [reportPrivateUsage]
+from .tracing import Span, Tracer, _detach_span  # pyright: ignore [reportPrivateUsage]
+from .validators import AsyncValidator, Validator
 from . import utils
 
 if TYPE_CHECKING:
@@ -35,8 +55,28 @@ ClsT = TypeVar(
 )
 ReturnType = TypeVar("ReturnType")
 PaginatorCallable = Callable[[ClsT, discord.Interaction[Any]], Union[Coroutine[Any, Any, ReturnType], ReturnType]]
-ButtonKeysLiteral = Literal["NEXT", "PREVIOUS", "OPEN", "FINISH", "CANCEL"]
+ButtonKeysLiteral = Literal["NEXT", "PREVIOUS", "OPEN", "FINISH", "CANCEL", "REVIEW"]
 CustomButtons = Dict[ButtonKeysLiteral, Optional[discord.ui.Button[Any]]]
+# key in discord.Interaction.extras that stores the render the interaction was made on
+_RENDER_ID_KEY = "modal_paginator_render_id"
+# key in discord.Interaction.extras that is set when the paginator deferred the interaction
+_DEFERRED_KEY = "modal_paginator_deferred"
+# the content of the default error messages of the buttons, by method name
+# also used by FormDefinition to translate them
+_DEFAULT_ERROR_MESSAGES: Dict[str, str] = {
+    "get_previous_button_error_message": "Please complete the current modal before going back.",
+    "get_next_button_error_message": "Please complete the current modal before going to the next one.",
+    "get_open_button_error_message": (
+        "Something went wrong... there is no current modal. Please report this to the developer."
+    ),
+    "get_finish_button_error_message": (
+        "You shouldn't be able to press this button... please finish all required modals."
+    ),
+}
+
+
+def _default_error_message(name: str) -> Dict[str, Any]:
+    return {"content": _DEFAULT_ERROR_MESSAGES[name], "ephemeral": True, "delete_after": 5}
 
 
 if utils.IS_DPY2_5:
@@ -55,6 +95,14 @@ __all__ = (
     "ModalPaginator",
 )
 
+_log = logging.getLogger(__name__)
+
+# used when no buttons are passed, so the defaults are only resolved once
+_DEFAULT_BUTTON_SET = ButtonSet()
+_DEFAULT_RENDERER = ContentRenderer()
+# used instead of a span if the paginator isn't traced
+_NO_SPAN: ContextManager[Any] = contextlib.nullcontext()
+
 
 class PaginatorModal(discord.ui.Modal):
     """Represents a modal that can be used in a :class:`.ModalPaginator`.
@@ -91,6 +139,20 @@ class PaginatorModal(discord.ui.Modal):
         self._callback: Optional[PaginatorCallable[Self, Any]] = callback
         self.required: bool = required
         self._inputs: tuple[discord.ui.TextInput[Self], ...] = inputs
+        # the ID of the user that passed the paginator's check when opening this modal
+        self._checked_user_id: Optional[int] = None
+        self._converters: Dict[discord.ui.TextInput[Self], Converter[Any]] = {}
+        self._validators: Dict[discord.ui.TextInput[Self], List[Validator]] = {}
+        self._async_validators: Dict[discord.ui.TextInput[Self], List[AsyncValidator]] = {}
+        self._errors: Dict[discord.ui.TextInput[Self], str] = {}
+        # whether the errors are from finishing the paginator (async validators or converters),
+        # see ModalPaginator.validate_answers
+        self._has_finish_errors: bool = False
+        # the answers of the last accepted submission, per question
+        self._last_values: Optional[Dict[str, str]] = None
+        self._last_delta: Optional[SubmitDelta] = None
+        # sent instead of this modal when it's opened again after it was stopped, see _to_send
+        self._reopened: Optional[_ReopenedModal] = None
 
         for inp in inputs:
             self.add_item(inp)
@@ -110,6 +172,26 @@ class PaginatorModal(discord.ui.Modal):
         """:class:`ModalPaginator`: The paginator of the modal."""
         return self._paginator
 
+    def _to_send(self) -> discord.ui.Modal:
+        # the library doesn't dispatch the submissions of a stopped modal anymore, e.g. after it was submitted,
+        # so a new modal with the same text inputs is sent that hands its submission to this one
+        if self._reopened is not None:
+            self._reopened.stop()
+            self._reopened = None
+
+        if not super().is_finished():
+            return self
+
+        self._reopened = _ReopenedModal(self)
+        return self._reopened
+
+    def stop(self) -> None:
+        if self._reopened is not None:
+            self._reopened.stop()
+            self._reopened = None
+
+        super().stop()
+
     @classmethod
     def _to_self(cls, paginator: ModalPaginator, modal: discord.ui.Modal) -> Self:
         if isinstance(modal, cls):
@@ -137,6 +219,8 @@ class PaginatorModal(discord.ui.Modal):
         min_length: Optional[int] = None,
         max_length: Optional[int] = None,
         row: Optional[int] = None,
+        converter: Optional[Converter[Any]] = None,
+        validators: Sequence[Union[Validator, AsyncValidator]] = (),
     ) -> discord.ui.TextInput[Self]:
         """Adds a text input to the modal. This an easy way to add a text input to the modal.
 
@@ -169,6 +253,14 @@ class PaginatorModal(discord.ui.Modal):
             like to control the relative positioning of the row then passing an index is advised.
             For example, row=1 will show up before row=2. Defaults to ``None``, which is automatic
             ordering. The row number must be between 0 and 4 (i.e. zero indexed).
+        converter: Optional[:class:`.Converter`]
+            The converter to attach to the text input. See :meth:`PaginatorModal.set_converter`.
+
+            .. versionadded:: 1.3
+        validators: Sequence[Union[:class:`.Validator`, :class:`.AsyncValidator`]]
+            The validators to attach to the text input. See :meth:`PaginatorModal.add_validator`.
+
+            .. versionadded:: 1.3
 
         Returns
         --------
@@ -187,6 +279,11 @@ class PaginatorModal(discord.ui.Modal):
             row=row,
         )
         self.add_item(text_input)
+        if converter is not None:
+            self.set_converter(text_input, converter)
+        if validators:
+            self.add_validator(text_input, *validators)
+
         return text_input
 
     def append_input(self, text_input: TextInpT, /) -> TextInpT:
@@ -207,11 +304,175 @@ class PaginatorModal(discord.ui.Modal):
         self.add_item(text_input)
         return text_input
 
+    def set_converter(self, text_input: discord.ui.TextInput[Any], converter: Optional[Converter[Any]], /) -> None:
+        """Attaches a converter to a text input in this modal.
+
+        The value of the text input is converted using :meth:`PaginatorModal.convert` or
+        :meth:`ModalPaginator.convert_answers`.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        text_input: :class:`discord.ui.TextInput`
+            The text input to attach the converter to.
+        converter: Optional[:class:`.Converter`]
+            The converter or ``None`` to remove the converter.
+
+        Raises
+        -------
+        ValueError
+            The text input is not in this modal.
+        """
+        if text_input not in self.children:
+            raise ValueError("The text input is not in this modal.")
+
+        if converter is None:
+            self._converters.pop(text_input, None)
+        else:
+            self._converters[text_input] = converter
+
+    def add_validator(
+        self, text_input: discord.ui.TextInput[Any], /, *validators: Union[Validator, AsyncValidator]
+    ) -> None:
+        r"""Attaches validators to a text input in this modal.
+
+        :class:`.Validator`\s are run in order when the modal is submitted, see :meth:`PaginatorModal.validate`.
+        :class:`.AsyncValidator`\s are run when the paginator is finished, see :meth:`ModalPaginator.validate_answers`.
+        Empty values of optional text inputs aren't validated.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        text_input: :class:`discord.ui.TextInput`
+            The text input to attach the validators to.
+        *validators: Union[:class:`.Validator`, :class:`.AsyncValidator`]
+            The validators to attach.
+
+        Raises
+        -------
+        ValueError
+            The text input is not in this modal.
+        """
+        if text_input not in self.children:
+            raise ValueError("The text input is not in this modal.")
+
+        for validator in validators:
+            if isinstance(validator, AsyncValidator):
+                self._async_validators.setdefault(text_input, []).append(validator)
+            else:
+                self._validators.setdefault(text_input, []).append(validator)
+
+    @property
+    def errors(self) -> Dict[discord.ui.TextInput[Self], str]:
+        """Dict[:class:`discord.ui.TextInput`, :class:`str`]: The errors of the last submission, per text input.
+
+        The modal isn't considered finished while this isn't empty.
+
+        .. versionadded:: 1.3
+        """
+        return self._errors
+
+    @property
+    def last_delta(self) -> Optional[SubmitDelta]:
+        """Optional[:class:`.SubmitDelta`]: What changed on the last accepted submission of this modal
+        or ``None`` if it wasn't submitted yet.
+
+        .. versionadded:: 1.3
+        """
+        return self._last_delta
+
+    def is_finished(self) -> bool:
+        """:class:`bool`: Whether the modal was submitted.
+
+        .. versionchanged:: 1.3
+            This is ``False`` if the last submission did not pass validation, see :attr:`PaginatorModal.errors`.
+        """
+        if self._errors:
+            return False
+
+        return super().is_finished()
+
+    def validate(self) -> Dict[discord.ui.TextInput[Self], str]:
+        """Runs the validators attached to the text inputs against their current values.
+
+        This is called in :meth:`PaginatorModal.on_submit` and sets :attr:`PaginatorModal.errors`.
+        Values that didn't change since the last accepted submission aren't validated again.
+
+        .. versionadded:: 1.3
+
+        Returns
+        --------
+        Dict[:class:`discord.ui.TextInput`, :class:`str`]
+            The first error message per invalid text input.
+        """
+        errors: Dict[discord.ui.TextInput[Self], str] = {}
+        previous = self._last_values or {}
+        for text_input, validators in self._validators.items():
+            value = text_input.value
+            if not value or previous.get(utils.question_key(text_input)) == value:
+                continue
+
+            for validator in validators:
+                error = validator(value)
+                if error is not None:
+                    errors[text_input] = error
+                    break
+
+        self._errors = errors
+        return errors
+
+    async def convert(self, interaction: discord.Interaction[Any]) -> Dict[str, Any]:
+        """Converts the values of the text inputs that have a converter attached.
+
+        Text inputs without a converter are returned as-is and empty values are returned as ``None``.
+        The converters are run concurrently so lookups can be batched, see :class:`.MemberResolver`.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction to pass to the converters, e.g. for the guild.
+
+        Raises
+        -------
+        ConversionError
+            A value could not be converted.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            A mapping of the text input's custom ID, or label if no custom ID was passed, to the converted value.
+        """
+
+        async def convert(text_input: discord.ui.TextInput[Any]) -> Any:
+            value = text_input.value
+            converter = self._converters.get(text_input)
+            if not value or converter is None:
+                return value or None
+
+            try:
+                return await converter.convert(interaction, value)
+            except ConversionError:
+                raise
+            except Exception as e:
+                raise ConversionError(text_input, value, original=e) from e
+
+        text_inputs = self.text_inputs
+        results = await asyncio.gather(*(convert(inp) for inp in text_inputs))
+        return {utils.question_key(inp): result for inp, result in zip(text_inputs, results)}
+
     async def interaction_check(self, interaction: discord.Interaction[Any]) -> bool:
         """This is called by the library when the modal is interacted with.
 
         The default implementation calls :class:`ModalPaginator.interaction_check`.
 
+        .. versionchanged:: 1.3
+            If the paginator uses a :class:`.CheckCache`, the check is skipped for the user that
+            opened this modal using the "Open" button as the check already passed for them.
+
         Parameters
         -----------
         interaction: :class:`discord.Interaction`
@@ -222,6 +483,10 @@ class PaginatorModal(discord.ui.Modal):
         :class:`bool`
             Whether the interaction should be processed.
         """
+        if self._checked_user_id is not None and self._checked_user_id == interaction.user.id:
+            self._checked_user_id = None
+            return True
+
         return await self.paginator.interaction_check(interaction)
 
     async def on_submit(self, interaction: discord.Interaction[Any]) -> None:
@@ -229,8 +494,14 @@ class PaginatorModal(discord.ui.Modal):
 
         The default implementation is the following:
 
-        #. Increment the current page of the paginator.
-        #. Stop the paginator using the ``stop`` method.
+        #. Clear the errors of the previous submission, including those of the async validators.
+        #. Validate the values using :meth:`PaginatorModal.validate`. If a value is invalid,
+           the values are kept as the defaults of the text inputs, the page stays unfinished
+           and the paginator's message shows the errors. Nothing else happens.
+        #. Stop the modal using the ``stop`` method.
+        #. Move the paginator to the next page according to :attr:`ModalPaginator.advance_policy`.
+        #. Update the paginator's message.
+        #. Call :meth:`ModalPaginator.on_page_submit` with what changed since the previous submission.
 
         * If a ``callback`` was passed to the modal, run it.
 
@@ -243,17 +514,75 @@ class PaginatorModal(discord.ui.Modal):
         interaction: :class:`discord.Interaction`
             The interaction to use for the paginator.
         """
-        self.paginator.current_page += 1
+        paginator = self.paginator
+        try:
+            with paginator._span("modal submit", title=self.title):  # pyright: ignore [reportPrivateUsage]
+                await self.__submit(interaction)
+        finally:
+            if paginator.is_finished():
+                paginator._end_trace()  # pyright: ignore [reportPrivateUsage]
+
+    async def __submit(self, interaction: discord.Interaction[Any]) -> None:
+        # the async validators and converters run again when the paginator is finished
+        self._errors = {}
+        self._has_finish_errors = False
+        if self._validators and self.validate():
+            # keep what the user entered so they only have to fix the invalid values
+            for text_input in self.text_inputs:
+                text_input.default = text_input.value
+
+            async with self.paginator._get_lock():  # pyright: ignore [reportPrivateUsage]
+                await self.paginator.update(interaction, **self.paginator.get_validation_error_message(self))
+            return
+
+        current = {utils.question_key(text_input): text_input.value for text_input in self.text_inputs}
+        delta = self._last_delta = SubmitDelta(self, self._last_values, current)
+        self._last_values = current
+
         self.stop()
-        await self.paginator.update(interaction)
+        paginator = self.paginator
+        async with paginator._get_lock():  # pyright: ignore [reportPrivateUsage]
+            previous = paginator.current_page
+            paginator.current_page = paginator._get_next_page()  # pyright: ignore [reportPrivateUsage]
+            await paginator.update(interaction)
+
+        emit = paginator._emit  # pyright: ignore [reportPrivateUsage]
+        emit("modal_submit", ModalSubmitEvent, interaction, self, delta)
+        if paginator.current_page != previous:
+            emit("page_change", PageChangeEvent, interaction, previous, paginator.current_page)
+        with paginator._span("callback on_page_submit"):  # pyright: ignore [reportPrivateUsage]
+            await paginator.on_page_submit(interaction, delta)
+        drafts = paginator._drafts  # pyright: ignore [reportPrivateUsage]
+        if drafts is not None and not delta.is_noop:
+            drafts.mark_dirty(self.paginator, self, interaction.user.id)
+
         if self._callback:
-            return await discord.utils.maybe_coroutine(self._callback, self, interaction)
+            with paginator._span("callback modal"):  # pyright: ignore [reportPrivateUsage]
+                return await discord.utils.maybe_coroutine(self._callback, self, interaction)
 
         return await super().on_submit(interaction)
 
 
+class _ReopenedModal(discord.ui.Modal):
+    # holds the same text inputs as the modal, so the library sets the submitted values on them
+    def __init__(self, modal: PaginatorModal) -> None:
+        super().__init__(title=modal.title, custom_id=modal.custom_id, timeout=modal.timeout)
+        self.modal: PaginatorModal = modal
+        for item in modal.children:
+            self.add_item(item)
+
+    async def interaction_check(self, interaction: discord.Interaction[Any]) -> bool:
+        return await self.modal.interaction_check(interaction)
+
+    async def on_submit(self, interaction: discord.Interaction[Any]) -> None:
+        await self.modal.on_submit(interaction)
+
+    async def on_error(self, interaction: discord.Interaction[Any], error: Exception) -> None:
+        await self.modal.on_error(interaction, error)
+
+
 class ModalPaginator(discord.ui.View):
-    """A paginator for :class:`discord.ui.Modal`
+    r"""A paginator for :class:`discord.ui.Modal`
 
     Parameters
     -----------
@@ -274,6 +603,18 @@ class ModalPaginator(discord.ui.View):
         .. versionadded:: 1.1
     check: Optional[Callable[[:class:`ModalPaginator`, :class:`discord.Interaction`], :class:`bool`]]
         A check that is run when the paginator is interacted with (``interaction_check``). Defaults to ``None``.
+    validation_timeout: Optional[:class:`float`]
+        How long the :class:`.AsyncValidator`\s may take in total when the paginator is finished,
+        in seconds. Defaults to ``5.0``. See :meth:`ModalPaginator.validate_answers`.
+
+        .. versionadded:: 1.3
+    check_cache: Optional[:class:`.CheckCache`]
+        A cache to store the results of ``check`` in per user. Defaults to ``None`` (no caching).
+
+        If set, the check also only runs once for opening and submitting the same modal.
+        Use :meth:`ModalPaginator.invalidate_check` to remove cached results.
+
+        .. versionadded:: 1.3
     finish_callback: Optional[Callable[[:class:`ModalPaginator`, :class:`discord.Interaction`], Coroutine[Any, Any, Any]]]
         A callback that is run when the paginator is finished (``on_finish``). Defaults to ``None``.
     can_go_back: :class:`bool`
@@ -284,10 +625,10 @@ class ModalPaginator(discord.ui.View):
         The timeout of the paginator. Defaults to ``None``. Timeouts aren't really handled.
     sort_modals: :class:`bool`
         Whether the modals should be sorted by required. Defaults to ``True``.
-    buttons: Optional[Dict[:class:`str`, Optional[:class:`discord.ui.Button`]]]
+    buttons: Optional[Union[Dict[:class:`str`, Optional[:class:`discord.ui.Button`]], :class:`.ButtonSet`]]
         A dictionary of buttons to customize the default buttons of the paginator with.
 
-        Valid keys are: ``"OPEN"``, ``"NEXT"``, ``"PREVIOUS"``, ``"CANCEL"`` and ``"FINISH"``.
+        Valid keys are: ``"OPEN"``, ``"NEXT"``, ``"PREVIOUS"``, ``"CANCEL"``, ``"FINISH"`` and ``"REVIEW"``.
         It's recommended to use :class:`.CustomButton` instead of :class:`discord.ui.Button` to customize the buttons.
 
         Example:
@@ -306,6 +647,70 @@ class ModalPaginator(discord.ui.View):
 
         See :class:`.CustomButton` for more info.
 
+        .. versionchanged:: 1.3
+            This can now also be a :class:`.ButtonSet`, which should be used if the same buttons are used
+            for many paginators as it's only validated and resolved once.
+    advance_policy: :class:`.AdvancePolicy`
+        Where to go to after a modal is submitted. Defaults to :attr:`.AdvancePolicy.next_page`.
+
+        .. versionadded:: 1.3
+    answer_cache: Optional[:class:`.AnswerCache`]
+        A cache to store the answers in per user when the paginator is finished or cancelled. Defaults to ``None``.
+
+        When the paginator is sent, the text inputs are prefilled with the user's cached answers
+        of the same form. Questions are matched by the custom ID of the text input if it was explicitly passed,
+        else by the label. See :meth:`ModalPaginator.prefill`.
+
+        .. versionadded:: 1.3
+    form_id: Optional[:class:`str`]
+        The ID of the form, used to key the answers in ``answer_cache`` and the drafts in ``drafts``.
+        Required if either is given.
+
+        .. versionadded:: 1.3
+    allow_resubmit: :class:`bool`
+        Whether modals that were already submitted can be opened and submitted again. Defaults to ``False``.
+        The text inputs are prefilled with the previous answers. See :meth:`ModalPaginator.on_page_submit`.
+
+        .. versionadded:: 1.3
+    admission: Optional[:class:`~discord.ext.modal_paginator.admission.AdmissionController`]
+        The controller that limits the amount of active paginators. Defaults to ``None`` (no limits).
+
+        The paginator is admitted in :meth:`ModalPaginator.send`, which raises :exc:`.AdmissionRejected`
+        if it's not, and releases its slot when it's stopped.
+
+        .. versionadded:: 1.3
+    throttle: Optional[:class:`~discord.ext.modal_paginator.throttle.ClickThrottle`]
+        How fast the "Next" and "Previous" buttons may be pressed before presses are deferred and
+        rendered together. Defaults to ``None`` (no throttling).
+
+        .. versionadded:: 1.3
+    renderer: Optional[:class:`~discord.ext.modal_paginator.renderer.Renderer`]
+        Renders the message of the paginator. Defaults to ``None``, which renders
+        :attr:`ModalPaginator.page_string` as the content.
+
+        .. versionadded:: 1.3
+    review: :class:`bool`
+        Whether to add a "Review" button that lets the user review their answers before finishing.
+        Defaults to ``False``. See :meth:`ModalPaginator.review`.
+
+        .. versionadded:: 1.3
+    events: Optional[:class:`~discord.ext.modal_paginator.events.EventBus`]
+        The bus to emit the lifecycle events of the paginator to. Defaults to ``None``.
+
+        .. versionadded:: 1.3
+    tracer: Optional[:class:`~discord.ext.modal_paginator.tracing.Tracer`]
+        The tracer to trace the session with, from sending the paginator until it's stopped.
+        Defaults to ``None`` (not traced).
+
+        .. versionadded:: 1.3
+    drafts: Optional[:class:`~discord.ext.modal_paginator.drafts.DraftAutosaver`]
+        The autosaver to save the submitted pages with. Defaults to ``None``.
+
+        When the paginator is sent, the values and finished state of the pages are restored from the user's draft
+        of the same form. The draft is deleted when the paginator is finished or cancelled.
+
+        .. versionadded:: 1.3
+
 
     Attributes
     -----------
@@ -315,6 +720,27 @@ class ModalPaginator(discord.ui.View):
         Whether the paginator should automatically finish when all required modals are filled in. Defaults to ``False``.
 
         .. versionadded:: 1.1
+    coalesced_interactions: :class:`int`
+        The amount of button presses that were acknowledged and dropped because they were made
+        on an outdated render of the paginator or after it already finished, e.g. due to double clicks.
+
+        .. versionadded:: 1.3
+    advance_policy: :class:`.AdvancePolicy`
+        Where to go to after a modal is submitted.
+
+        .. versionadded:: 1.3
+    throttled_interactions: :class:`int`
+        The amount of "Next" and "Previous" presses that were deferred because of the ``throttle``.
+
+        .. versionadded:: 1.3
+    coalesced_renders: :class:`int`
+        The amount of times throttled presses were rendered together in a single edit.
+
+        .. versionadded:: 1.3
+    form_id: Optional[:class:`str`]
+        The ID of the form, used to key the answers in the ``answer_cache`` and the drafts in ``drafts``.
+
+        .. versionadded:: 1.3
 
     Example
     --------
@@ -338,6 +764,8 @@ class ModalPaginator(discord.ui.View):
     """  # noqa: E501
 
     _message: Optional[MessageT] = None
+    # the interaction the paginator was sent with, used to edit the message without fetching it
+    _interaction: Optional[discord.Interaction[Any]] = None
 
     def __init__(
         self,
@@ -351,9 +779,25 @@ class ModalPaginator(discord.ui.View):
         can_go_back: bool = True,
         disable_after: bool = True,
         sort_modals: bool = True,
-        buttons: Optional[CustomButtons] = None,
+        buttons: Optional[Union[CustomButtons, ButtonSet]] = None,
+        advance_policy: AdvancePolicy = AdvancePolicy.next_page,
+        check_cache: Optional[CheckCache] = None,
+        validation_timeout: Optional[float] = 5.0,
+        answer_cache: Optional[AnswerCache] = None,
+        form_id: Optional[str] = None,
+        drafts: Optional[DraftAutosaver] = None,
+        allow_resubmit: bool = False,
+        admission: Optional[AdmissionController] = None,
+        throttle: Optional[ClickThrottle] = None,
+        renderer: Optional[Renderer] = None,
+        review: bool = False,
+        events: Optional[EventBus] = None,
+        tracer: Optional[Tracer] = None,
     ) -> None:
         super().__init__(timeout=timeout)
+        if (answer_cache is not None or drafts is not None) and form_id is None:
+            raise ValueError("form_id is required if answer_cache or drafts is given.")
+
         if modals is None:
             modals = []
 
@@ -363,31 +807,64 @@ class ModalPaginator(discord.ui.View):
         self._max_pages: int = len(self._modals) - 1
         self._finish_callback: Optional[PaginatorCallable[Self, Any]] = finish_callback
         self._check: Optional[PaginatorCallable[Self, bool]] = check
+        self._check_cache: Optional[CheckCache] = check_cache
+        self.validation_timeout: Optional[float] = validation_timeout
+        self._answer_cache: Optional[AnswerCache] = answer_cache
+        self.form_id: Optional[str] = form_id
+        self._drafts: Optional[DraftAutosaver] = drafts
+        self._allow_resubmit: bool = allow_resubmit
+        self._admission: Optional[AdmissionController] = admission
+        self._throttle: Optional[ClickThrottle] = throttle
+        self._bucket: Optional[_TokenBucket] = _TokenBucket(throttle.rate, throttle.burst) if throttle else None
+        # renders the throttled presses once the user stopped pressing
+        self._render_task: Optional[asyncio.Task[None]] = None
+        self._renderer: Renderer = renderer if renderer is not None else _DEFAULT_RENDERER
+        self._review: bool = review
+        self._events: Optional[EventBus] = events
+        self._tracer: Optional[Tracer] = tracer
+        # the root span of the session, started in send
+        self._trace: Optional[Span] = None
+        self.throttled_interactions: int = 0
+        self.coalesced_renders: int = 0
         self._disable_after: bool = disable_after
         self._can_go_back = can_go_back
         self._sort_modals = sort_modals
         self.auto_finish = auto_finish
+        self.advance_policy: AdvancePolicy = advance_policy
 
         self.author_id: Optional[int] = author_id
         self.current_page: int = 0
         self._current_modal: Optional[PaginatorModal] = None
 
-        self.__methods_map: Dict[str, discord.ui.Button[Self]] = {
+        # interactions are handled one at a time, see _dispatch_item
+        self._lock: Optional[asyncio.Lock] = None
+        self._render_id: int = 0
+        self.coalesced_interactions: int = 0
+        # what the message should be edited to when the paginator is finished or cancelled
+        self._final_message_kwargs: Dict[str, Any] = {}
+        self._converted_answers: Optional[Dict[str, Any]] = None
+
+        self._state: SessionState = SessionState.active
+        self._created_at: float = time.monotonic()
+        self._released: bool = False
+        registry.add(self)
+
+        self.__methods_map: Dict[ButtonKeysLiteral, discord.ui.Button[Self]] = {
             "OPEN": self.open_button,
             "NEXT": self.next_page,
             "PREVIOUS": self.previous_page,
             "FINISH": self.finish_button,
             "CANCEL": self.cancel_button,
+            "REVIEW": self.review_button,
         }
 
-        if buttons is not None:
-            for name in buttons:
-                if name not in DEFAULT_BUTTONS:
-                    raise InvalidButtonKey(name, tuple(DEFAULT_BUTTONS.keys()))
-        else:
-            buttons = {}
+        if buttons is None:
+            buttons = _DEFAULT_BUTTON_SET
+        elif not isinstance(buttons, ButtonSet):
+            buttons = ButtonSet(buttons)
 
-        self._buttons: Dict[ButtonKeysLiteral, Optional[CustomButton]] = self._set_buttons(buttons)
+        self._button_set: ButtonSet = buttons
+        self._set_buttons()
 
     @classmethod
     def from_text_inputs(
@@ -401,7 +878,20 @@ class ModalPaginator(discord.ui.View):
         can_go_back: bool = True,
         disable_after: bool = True,
         sort_modals: bool = True,
-        buttons: Optional[CustomButtons] = None,
+        buttons: Optional[Union[CustomButtons, ButtonSet]] = None,
+        advance_policy: AdvancePolicy = AdvancePolicy.next_page,
+        check_cache: Optional[CheckCache] = None,
+        validation_timeout: Optional[float] = 5.0,
+        answer_cache: Optional[AnswerCache] = None,
+        form_id: Optional[str] = None,
+        drafts: Optional[DraftAutosaver] = None,
+        allow_resubmit: bool = False,
+        admission: Optional[AdmissionController] = None,
+        throttle: Optional[ClickThrottle] = None,
+        renderer: Optional[Renderer] = None,
+        review: bool = False,
+        events: Optional[EventBus] = None,
+        tracer: Optional[Tracer] = None,
         titles: Union[str, Sequence[str]] = discord.utils.MISSING,
         default_title: str = "Enter your input",
     ) -> ModalPaginator:
@@ -508,6 +998,19 @@ class ModalPaginator(discord.ui.View):
             disable_after=disable_after,
             sort_modals=sort_modals,
             buttons=buttons,
+            advance_policy=advance_policy,
+            check_cache=check_cache,
+            validation_timeout=validation_timeout,
+            answer_cache=answer_cache,
+            form_id=form_id,
+            drafts=drafts,
+            allow_resubmit=allow_resubmit,
+            admission=admission,
+            throttle=throttle,
+            renderer=renderer,
+            review=review,
+            events=events,
+            tracer=tracer,
         )
 
     @property
@@ -528,6 +1031,71 @@ class ModalPaginator(discord.ui.View):
         """
         return [inp for modal in self.modals for inp in modal.text_inputs]
 
+    @property
+    def converted_answers(self) -> Optional[Dict[str, Any]]:
+        """Optional[Dict[:class:`str`, Any]]: The answers converted when the "Finish" button was pressed,
+        see :meth:`ModalPaginator.convert_answers`.
+
+        This is ``None`` until the paginator is finished or if no text input has a converter.
+
+        .. versionadded:: 1.3
+        """
+        return self._converted_answers
+
+    @property
+    def state(self) -> SessionState:
+        """:class:`.SessionState`: The state of the paginator.
+
+        .. versionadded:: 1.3
+        """
+        return self._state
+
+    @property
+    def age(self) -> float:
+        """:class:`float`: How long ago the paginator was created, in seconds.
+
+        .. versionadded:: 1.3
+        """
+        return time.monotonic() - self._created_at
+
+    def stop(self) -> None:
+        if self._state is SessionState.active:
+            self._state = SessionState.cancelled
+        if self._admission is not None:
+            self._admission.release(self)
+        self._cancel_render()
+        if not self._in_trace():
+            # else ended once the button press or submission that stopped the paginator is handled
+            self._end_trace()
+
+        super().stop()
+
+    def _dispatch_timeout(self) -> None:
+        if self._state is SessionState.active and not self.is_finished():
+            self._state = SessionState.timed_out
+            self._emit("timeout", SessionEndEvent, None, self._state)
+        if self._admission is not None:
+            self._admission.release(self)
+        self._end_trace()
+
+        super()._dispatch_timeout()  # pyright: ignore [reportPrivateUsage]
+
+    def _release(self) -> bool:
+        # drop what keeps a stopped paginator reachable, see SessionRegistry.sweep
+        if self._released:
+            return False
+
+        self._released = True
+        for modal in self._modals:
+            # removes modals that were opened but never submitted from the library's modal store
+            modal.stop()
+
+        self._message = None
+        self._interaction = None
+        self._current_modal = None
+        self._final_message_kwargs = {}
+        return True
+
     @property
     def current_modal(self) -> Optional[PaginatorModal]:
         """Optional[:class:`PaginatorModal`]: The current modal of the paginator."""
@@ -552,9 +1120,41 @@ class ModalPaginator(discord.ui.View):
         The message that the paginator is attached to. This is set in :meth:`ModalPaginator.send`.
 
         This is ``None`` if the paginator is not sent using :meth:`ModalPaginator.send`.
+
+        .. versionchanged:: 1.3
+            This is also ``None`` if the paginator was sent as a response to an interaction and
+            the message wasn't returned by the library. Use :meth:`ModalPaginator.fetch_message` to fetch it.
         """
         return self._message
 
+    async def fetch_message(self) -> Optional[MessageT]:
+        """Returns the message that the paginator is attached to, fetching it if needed.
+
+        The message is only fetched once using :meth:`discord.Interaction.original_response`
+        if the paginator was sent as a response to an interaction.
+
+        .. versionadded:: 1.3
+
+        Returns
+        --------
+        Optional[Union[:class:`~discord.Message`, :class:`~discord.WebhookMessage`, :class:`~discord.InteractionMessage`]]
+            The message or ``None`` if the paginator is not sent using :meth:`ModalPaginator.send`.
+        """  # noqa: E501
+        if self._message is None and self._interaction is not None:
+            self._message = await self._interaction.original_response()
+
+        return self._message
+
+    async def _edit_message(self, **kwargs: Any) -> None:
+        # edits the paginator's message without a followup interaction
+        # uses the interaction's token if the message wasn't fetched to save a request
+        if self._message is not None:
+            with self._span("http message.edit"):
+                await self._message.edit(**kwargs)
+        elif self._interaction is not None:
+            with self._span("http interaction.edit_original_response"):
+                await self._interaction.edit_original_response(**kwargs)
+
     def _handle_button_states(self) -> None:
         """Handles the button states. E.g, change the Open button's name to *Open
         if the current modal is required and not finished.
@@ -563,19 +1163,15 @@ class ModalPaginator(discord.ui.View):
         """
         modal: Optional[PaginatorModal] = self.current_modal
 
-        self.open_button.disabled = not modal or modal.is_finished()
+        self.open_button.disabled = not modal or (modal.is_finished() and not self._allow_resubmit)
         self.next_page.disabled = self.current_page >= self._max_pages or self._is_locked()
         self.previous_page.disabled = not self._can_go_back or self.current_page <= 0
         self.finish_button.disabled = not all(m.is_finished() for m in self._modals if m.required)
+        self.review_button.disabled = not any(m.is_finished() for m in self._modals)
         if modal:
-            for button in self._buttons.values():
-                if not button:
-                    continue
-
-                if modal.required and not modal.is_finished():
-                    button.on_required_modal(button)
-                else:
-                    button.on_optional_modal(button)
+            self._button_set._apply_state(  # pyright: ignore [reportPrivateUsage]
+                self, self.__methods_map, required=modal.required and not modal.is_finished()
+            )
 
     def _is_locked(self) -> bool:
         """:class:`bool`: Whether the current modal is required but not filled in by the user.
@@ -587,33 +1183,135 @@ class ModalPaginator(discord.ui.View):
 
         return self.current_modal.required and not self.current_modal.is_finished()
 
-    def _set_buttons(self, custom_buttons: CustomButtons) -> Dict[ButtonKeysLiteral, Optional[CustomButton]]:
-        res: Dict[ButtonKeysLiteral, Optional[CustomButton]] = {}
+    def _get_lock(self) -> asyncio.Lock:
+        # created lazily because the paginator can be constructed outside of a running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
+    def _dispatch_item(self, item: discord.ui.Item[Any], interaction: discord.Interaction[Any]) -> Any:
+        # this is called by the library as soon as the interaction is received
+        # so store the render the user interacted with before anything else can run
+        interaction.extras.setdefault(_RENDER_ID_KEY, self._render_id)
+        return super()._dispatch_item(item, interaction)  # pyright: ignore [reportUnknownMemberType]
+
+    def _is_stale(self, interaction: discord.Interaction[Any]) -> bool:
+        """:class:`bool`: Whether the interaction was made on an outdated render of the paginator."""
+        render_id: Optional[int] = interaction.extras.get(_RENDER_ID_KEY)
+        return render_id is not None and render_id != self._render_id
+
+    async def _drop_stale(self, interaction: discord.Interaction[Any]) -> None:
+        self.coalesced_interactions += 1
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+
+    def _emit(
+        self, name: str, event: Type[PaginatorEvent], interaction: Optional[discord.Interaction[Any]], *args: Any
+    ) -> None:
+        # the event is only created if someone is listening
+        if self._events is not None and self._events.has_listeners(name):
+            self._events.dispatch(name, event(self, interaction, *args))
+
+    def _span(self, name: str, **attributes: Any) -> ContextManager[Any]:
+        if self._trace is None or self._tracer is None:
+            return _NO_SPAN
+
+        return self._tracer.start_span(name, self._trace, **attributes)
+
+    def _in_trace(self) -> bool:
+        if self._trace is None:
+            return False
 
-        for name, default_button_data in DEFAULT_BUTTONS.items():
-            default_button = self.__methods_map[name]
-            custom_button = custom_buttons.get(name, discord.utils.MISSING)
+        current = Tracer.current_span()
+        return current is not None and current.trace_id == self._trace.trace_id
 
-            if custom_button is None:
-                res[name] = None
-                self.remove_item(default_button)
+    def _end_trace(self) -> None:
+        if self._trace is not None:
+            self._trace.set_attribute("state", self._state.name)
+            self._trace.end()
+            self._trace = None
+
+    def _is_throttled(self) -> bool:
+        return self._bucket is not None and not self._bucket.consume()
+
+    async def _defer_render(self, interaction: discord.Interaction[Any]) -> None:
+        # the page already changed, only the message edit is postponed
+        self.throttled_interactions += 1
+        self._current_modal = self.get_modal()
+        self._handle_button_states()
+        await interaction.response.defer()
+
+        self._cancel_render()
+        self._render_task = asyncio.create_task(self._render_later(interaction))
+
+    async def _render_later(self, interaction: discord.Interaction[Any]) -> None:
+        # the button press this was started in is already handled, its span ended
+        _detach_span()
+        await asyncio.sleep(self._throttle.quiet if self._throttle else 0)
+        async with self._get_lock():
+            self._render_task = None
+            with self._span("http interaction.edit_original_response"):
+                await interaction.edit_original_response(view=self, **self._renderer.render(self))
+            self._render_id += 1
+            self.coalesced_renders += 1
+
+    def _cancel_render(self) -> None:
+        if self._render_task is not None:
+            self._render_task.cancel()
+            self._render_task = None
+
+    def _get_next_page(self) -> int:
+        """:class:`int`: The page to go to after the current modal is submitted
+        according to :attr:`ModalPaginator.advance_policy`.
+
+        This is called in :meth:`PaginatorModal.on_submit`.
+        """
+        if self.advance_policy is AdvancePolicy.next_page:
+            return self.current_page + 1
+
+        only_required = self.advance_policy is AdvancePolicy.next_required_unfinished
+        total = len(self._modals)
+        # start at the page after the current one and wrap around,
+        # unless going back isn't allowed
+        end = total + 1 if self._can_go_back else total - self.current_page
+        for offset in range(1, end):
+            page = (self.current_page + offset) % total
+            modal = self._modals[page]
+            if modal.is_finished() or (only_required and not modal.required):
                 continue
 
-            # fmt: off
-            res[name] = CustomButton._copy_attrs(  # pyright: ignore [reportPrivateUsage]
-                default_button,
-                custom_button if custom_button is not discord.utils.MISSING else default_button_data
-            )
-            # fmt: on
+            return page
+
+        # everything is finished, behave like the default
+        return self.current_page + 1
+
+    def _set_buttons(self) -> None:
+        self._button_set._apply(self, self.__methods_map)  # pyright: ignore [reportPrivateUsage]
+        if self._tracer is not None:
+            for button in self.__methods_map.values():
+                self.__trace_callback(button)
 
         if self.auto_finish:
             self.remove_item(self.__methods_map["FINISH"])
-            res["FINISH"] = None
         if not self._can_go_back:
             self.remove_item(self.__methods_map["PREVIOUS"])
-            res["PREVIOUS"] = None
+        if not self._review:
+            self.remove_item(self.__methods_map["REVIEW"])
+
+    def __trace_callback(self, button: discord.ui.Button[Self]) -> None:
+        # wraps the callback, which may be a custom one, in a span per button press
+        callback = button.callback
 
-        return res
+        async def traced(interaction: discord.Interaction[Any]) -> Any:
+            try:
+                with self._span(f"button {button.custom_id}"):
+                    return await callback(interaction)
+            finally:
+                if self.is_finished():
+                    self._end_trace()
+
+        button.callback = traced  # type: ignore
 
     def validate_pages(self) -> None:
         """Validates all modals in the paginator. Basically checks if all modals are
@@ -626,6 +1324,8 @@ class ModalPaginator(discord.ui.View):
 
         #. Checks if all modals are instances of :class:`discord.ui.Modal`.
         #. Checks whether ``auto_finish`` is ``True`` and if so, checks if each modal is required.
+        #. Checks whether the questions are unique if any text input has a converter, see
+           :meth:`ModalPaginator.convert_answers`.
         #. Sorts the modals by required if ``sort_modals`` is ``True``.
         #. Sets the :attr:`ModalPaginator.current_modal` to the first modal in the list.
         #. Handles the button states.
@@ -638,6 +1338,9 @@ class ModalPaginator(discord.ui.View):
             A modal is not an instance/subclass of :class:`discord.ui.Modal`.
         NoModals
             There are no modals in the paginator.
+        ValueError
+            ``auto_finish`` is ``True`` but a modal is not required or
+            a text input has a converter but the questions are not unique.
         """
         modals: list[PaginatorModal] = []
         for idx, modal in enumerate(self._modals.copy()):
@@ -661,6 +1364,19 @@ class ModalPaginator(discord.ui.View):
         if not modals:
             raise NoModals()
 
+        if any(m._converters for m in modals):  # pyright: ignore [reportPrivateUsage]
+            # the converted answers are keyed by question
+            keys: Set[str] = set()
+            for modal in modals:
+                for text_input in modal.text_inputs:
+                    key = utils.question_key(text_input)
+                    if key in keys:
+                        raise ValueError(
+                            f"Multiple text inputs have the label or custom ID {key!r}. "
+                            "Pass a unique custom_id to the text inputs if the answers are converted."
+                        )
+                    keys.add(key)
+
         self._modals = modals
         self._max_pages = len(self._modals) - 1
         # sort by required if sort_modals is True
@@ -713,6 +1429,7 @@ class ModalPaginator(discord.ui.View):
         The default implementation is the following:
 
         * Check if a check was passed to the paginator. If so, run it.
+          The result is cached per user if a ``check_cache`` was passed to the paginator.
 
         else:
 
@@ -733,17 +1450,282 @@ class ModalPaginator(discord.ui.View):
             Whether the interaction should be processed.
         """
         if self._check:
-            return await discord.utils.maybe_coroutine(self._check, self, interaction)
+            if self._check_cache is None:
+                with self._span("check"):
+                    return await discord.utils.maybe_coroutine(self._check, self, interaction)
+
+            result = self._check_cache.get(interaction.user.id)
+            if result is None:
+                with self._span("check"):
+                    result = await discord.utils.maybe_coroutine(self._check, self, interaction)
+                self._check_cache.set(interaction.user.id, result)
+
+            return result
         elif self.author_id:
             return interaction.user.id == self.author_id
         else:
             return await super().interaction_check(interaction)
 
+    async def convert_answers(self, interaction: discord.Interaction[Any]) -> Dict[str, Any]:
+        """Converts the answers of all modals using the converters attached to their text inputs.
+
+        All converters are run concurrently, so lookups of the whole session can be batched.
+
+        This is called when the "Finish" button is pressed if any text input has a converter, after
+        :meth:`ModalPaginator.validate_answers`. The result is available as :attr:`ModalPaginator.converted_answers`
+        in :meth:`ModalPaginator.on_finish` and the ``finish_callback``. If a value can't be converted,
+        the paginator isn't finished and the error is shown like the errors of the async validators,
+        see :meth:`ModalPaginator.get_answers_validation_error_message`.
+
+        The answers are not converted if ``auto_finish`` is enabled since there is no "Finish" button.
+
+        See :meth:`PaginatorModal.convert` for more info.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction to pass to the converters, e.g. for the guild.
+
+        Raises
+        -------
+        ConversionError
+            A value could not be converted.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            A mapping of the text input's custom ID, or label if no custom ID was passed, to the converted value.
+        """
+        results: Dict[str, Any] = {}
+        for converted in await asyncio.gather(*(modal.convert(interaction) for modal in self._modals)):
+            results.update(converted)
+
+        return results
+
+    async def validate_answers(self, interaction: discord.Interaction[Any]) -> List[PaginatorModal]:
+        r"""Runs the :class:`.AsyncValidator`\s of all modals concurrently.
+
+        The validators must finish within :attr:`ModalPaginator.validation_timeout` seconds in total,
+        validators that don't are cancelled and their text input is considered invalid.
+        Validators that raise an exception are logged and their text input is considered invalid as well.
+        Invalid modals are marked as unfinished, see :attr:`PaginatorModal.errors`.
+
+        The errors of the previous time the paginator was finished, including conversion errors, are cleared first.
+        Modals whose last submission didn't pass their :class:`.Validator`\s are skipped.
+
+        This is called when the "Finish" button is pressed. The interaction is deferred before
+        the validators are run so use :attr:`discord.Interaction.followup` in :meth:`ModalPaginator.on_finish`
+        if the paginator has any async validators or converters.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction to pass to the validators.
+
+        Returns
+        --------
+        List[:class:`PaginatorModal`]
+            The invalid modals, in page order.
+        """
+        jobs: List[Tuple[PaginatorModal, discord.ui.TextInput[Any], AsyncValidator, asyncio.Task[Optional[str]]]] = []
+        for modal in self._modals:
+            if modal._has_finish_errors:  # pyright: ignore [reportPrivateUsage]
+                # from the previous time the paginator was finished, the values are validated again
+                modal._errors = {}  # pyright: ignore [reportPrivateUsage]
+                modal._has_finish_errors = False  # pyright: ignore [reportPrivateUsage]
+            elif modal._errors:  # pyright: ignore [reportPrivateUsage]
+                continue
+
+            for text_input, validators in modal._async_validators.items():  # pyright: ignore [reportPrivateUsage]
+                value = text_input.value
+                if not value:
+                    continue
+
+                for validator in validators:
+                    jobs.append((modal, text_input, validator, asyncio.ensure_future(validator(interaction, value))))
+
+        if not jobs:
+            return []
+
+        _, pending = await asyncio.wait([job[3] for job in jobs], timeout=self.validation_timeout)
+        for task in pending:
+            task.cancel()
+
+        invalid: List[PaginatorModal] = []
+        for modal, text_input, validator, task in jobs:
+            if text_input in modal._errors:  # pyright: ignore [reportPrivateUsage]
+                # only the first error per text input
+                continue
+
+            if task in pending or task.cancelled():
+                error = validator.timeout_message
+            elif task.exception() is not None:
+                _log.error("Async validator %r raised an exception", validator, exc_info=task.exception())
+                error = validator.error_message
+            else:
+                error = task.result()
+            if error is None:
+                continue
+
+            modal._errors[text_input] = error  # pyright: ignore [reportPrivateUsage]
+            modal._has_finish_errors = True  # pyright: ignore [reportPrivateUsage]
+            if modal not in invalid:
+                invalid.append(modal)
+
+        for modal in invalid:
+            for text_input in modal.text_inputs:
+                text_input.default = text_input.value
+
+        return invalid
+
+    def prefill(self, user_id: int) -> bool:
+        """Sets the defaults of the text inputs to the given user's cached answers to this form.
+
+        Only modals that weren't submitted yet are prefilled.
+        This is called in :meth:`ModalPaginator.send` if ``answer_cache`` was given.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        user_id: :class:`int`
+            The ID of the user to prefill the answers of.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether any text input was prefilled.
+        """
+        if self._answer_cache is None or self.form_id is None:
+            return False
+
+        answers = self._answer_cache.get(user_id, self.form_id)
+        if not answers:
+            return False
+
+        prefilled = False
+        for modal in self._modals:
+            if modal.is_finished():
+                continue
+
+            for text_input in modal.text_inputs:
+                answer = answers.get(utils.question_key(text_input))
+                if answer is not None:
+                    text_input.default = answer
+                    prefilled = True
+
+        return prefilled
+
+    def _remember_answers(self, user_id: int) -> None:
+        if self._answer_cache is None or self.form_id is None:
+            return
+
+        answers = {
+            utils.question_key(text_input): text_input.value
+            for modal in self._modals
+            if modal.is_finished()
+            for text_input in modal.text_inputs
+        }
+        self._answer_cache.set(user_id, self.form_id, answers)
+
+    def _get_user_id(
+        self, obj: Union[discord.abc.Messageable, discord.Interaction[Any], _commands.Context[Any]]
+    ) -> Optional[int]:
+        if self.author_id is not None:
+            return self.author_id
+        if isinstance(obj, discord.Interaction):
+            return obj.user.id
+        if isinstance(obj, _commands.Context):
+            return obj.author.id
+        if isinstance(obj, discord.abc.User):
+            return obj.id
+
+        return None
+
+    @staticmethod
+    def _get_guild_id(
+        obj: Union[discord.abc.Messageable, discord.Interaction[Any], _commands.Context[Any]]
+    ) -> Optional[int]:
+        if isinstance(obj, discord.Interaction):
+            return obj.guild_id
+
+        guild = getattr(obj, "guild", None)
+        return guild.id if guild is not None else None
+
+    def invalidate_check(self, user_id: Optional[int] = None) -> None:
+        """Removes the cached ``check`` result for the given user or for all users if ``user_id`` is ``None``.
+
+        Nothing happens if no ``check_cache`` was passed to the paginator.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        user_id: Optional[:class:`int`]
+            The ID of the user. Defaults to ``None``.
+        """
+        if self._check_cache is not None:
+            self._check_cache.invalidate(user_id)
+
+        for modal in self._modals:
+            if user_id is None or modal._checked_user_id == user_id:  # pyright: ignore [reportPrivateUsage]
+                modal._checked_user_id = None  # pyright: ignore [reportPrivateUsage]
+
+    def set_final_message(self, **kwargs: Any) -> None:
+        """Sets what the paginator's message should be edited to after it's finished or cancelled.
+
+        This is meant to be called in :meth:`ModalPaginator.on_finish`, :meth:`ModalPaginator.on_cancel` or
+        the ``finish_callback`` instead of responding to the interaction yourself. The given kwargs are sent together
+        with the disabled buttons in one response, instead of one response for your message and another
+        edit for disabling the buttons.
+
+        Calling this multiple times merges the kwargs.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        **kwargs: Any
+            The same keyword arguments as :meth:`interaction.response.edit_message <discord.InteractionResponse.edit_message>`.
+            E.g. ``content``, ``embed``, ``embeds``, ``attachments``. ``view`` is set by the paginator
+            if ``disable_after`` is ``True``.
+
+        Example
+        --------
+        .. code-block:: python
+            :linenos:
+
+            class MyPaginator(ModalPaginator):
+                async def on_finish(self, interaction: discord.Interaction) -> None:
+                    self.set_final_message(content="Thanks for applying!", embed=None)
+        """  # noqa: E501
+        self._final_message_kwargs.update(kwargs)
+
+    async def __send_final_message(self, interaction: discord.Interaction[Any]) -> None:
+        kwargs = self._final_message_kwargs
+        if self._disable_after:
+            await self.disable_all_buttons(interaction, **kwargs)
+        elif kwargs:
+            if not interaction.response.is_done():
+                with self._span("http interaction.response.edit_message"):
+                    await interaction.response.edit_message(**kwargs)
+            else:
+                await self._edit_message(**kwargs)
+
     async def __cancel_impl(self, interaction: discord.Interaction[Any]) -> None:
+        self._state = SessionState.cancelled
         self.stop()
-        await self.on_cancel(interaction)
-        if self._disable_after:
-            await self.disable_all_buttons(interaction)
+        self._emit("cancel", SessionEndEvent, interaction, self._state)
+        self._remember_answers(interaction.user.id)
+        with self._span("callback on_cancel"):
+            await self.on_cancel(interaction)
+        await self.__send_final_message(interaction)
+        if self._drafts is not None:
+            await self._drafts.discard(self, interaction.user.id)
 
         return
 
@@ -753,6 +1735,8 @@ class ModalPaginator(discord.ui.View):
 
         The default implementation does nothing.
 
+        Use :meth:`ModalPaginator.set_final_message` to edit the paginator's message together with disabling the buttons.
+
         Parameters
         -----------
         interaction: :class:`discord.Interaction`
@@ -761,20 +1745,65 @@ class ModalPaginator(discord.ui.View):
         pass
 
     async def __finish_impl(self, interaction: discord.Interaction[Any]) -> None:
+        self._state = SessionState.finished
         self.stop()
-        await self.on_finish(interaction)
+        self._emit("finish", SessionEndEvent, interaction, self._state)
+        self._remember_answers(interaction.user.id)
+        with self._span("callback on_finish"):
+            await self.on_finish(interaction)
         if self._finish_callback:
-            await discord.utils.maybe_coroutine(self._finish_callback, self, interaction)
-        if self._disable_after:
-            await self.disable_all_buttons(interaction)
+            with self._span("callback finish_callback"):
+                await discord.utils.maybe_coroutine(self._finish_callback, self, interaction)
+        await self.__send_final_message(interaction)
+        if self._drafts is not None:
+            await self._drafts.discard(self, interaction.user.id)
 
         return
 
+    async def on_page_submit(self, interaction: discord.Interaction[Any], delta: SubmitDelta) -> None:
+        """A callback that is called when a modal was submitted and its answers passed validation,
+        after the paginator's message was updated.
+
+        Use ``delta`` to only process the answers that changed when a modal is submitted again,
+        see the ``allow_resubmit`` kwarg. :attr:`.SubmitDelta.is_noop` is ``True`` if nothing changed.
+
+        The default implementation does nothing.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction of the submitted modal. Already responded to.
+        delta: :class:`.SubmitDelta`
+            What changed compared to the previous submission of the modal.
+        """
+        pass
+
+    async def review(self, interaction: discord.Interaction[Any]) -> None:
+        """Sends the user's answers so far as an ephemeral message for them to review before finishing.
+
+        The answers are rendered by an :class:`~discord.ext.modal_paginator.review.AnswerReview`, which builds
+        the pages on demand and offers the answers as a file as well.
+
+        This is called in the "Review" button, see the ``review`` kwarg. Override this to change the review.
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction to respond to.
+        """
+        await AnswerReview(self).send(interaction)
+
     async def on_finish(self, interaction: discord.Interaction[Any]) -> None:
         """A callback that is called when the paginator is finished. This is called when the "Finish" button is pressed.
 
         The default implementation does nothing.
 
+        Use :meth:`ModalPaginator.set_final_message` to edit the paginator's message together with disabling the buttons.
+
         Parameters
         -----------
         interaction: :class:`discord.Interaction`
@@ -800,42 +1829,123 @@ class ModalPaginator(discord.ui.View):
 
         return self._modals[self.current_page]
 
-    async def update(self, interaction: discord.Interaction[Any]) -> None:
+    async def update(self, interaction: discord.Interaction[Any], **kwargs: Any) -> None:
         """Updates the paginator's message.
 
+        If ``auto_finish`` is enabled and all required modals are finished, the paginator is finished
+        and its message is edited to the final message in the same request, see :meth:`ModalPaginator.set_final_message`.
+
+        .. versionchanged:: 1.3
+            :meth:`ModalPaginator.on_finish` is called before the message is edited and the buttons are disabled
+            if ``disable_after`` is enabled.
+
         Parameters
         -----------
         interaction: :class:`discord.Interaction`
             The interaction to use for the paginator.
+        **kwargs: Any
+            Additional keyword arguments to edit the message with. E.g. ``content`` to override the page string.
+
+            .. versionadded:: 1.3
         """
+        self._cancel_render()
         self._current_modal = self.get_modal()
         self._handle_button_states()
-        await interaction.response.edit_message(view=self, content=self.page_string)
-
-        if self.auto_finish and all(m.is_finished() for m in self._modals if m.required):
+        finished = self.auto_finish and all(m.is_finished() for m in self._modals if m.required)
+        if finished:
+            self._state = SessionState.finished
             self.stop()
-            await self.on_finish(interaction)
+            self._emit("finish", SessionEndEvent, interaction, self._state)
+            self._remember_answers(interaction.user.id)
+            with self._span("callback on_finish"):
+                await self.on_finish(interaction)
+            # the final message is sent with the same request, like when the "Finish" button is pressed
+            kwargs.update(self._final_message_kwargs)
+            if self._disable_after:
+                self._disable_buttons()
+                for key, value in self._renderer.render_stopped(self).items():
+                    kwargs.setdefault(key, value)
+
+        for key, value in self._renderer.render(self).items():
+            kwargs.setdefault(key, value)
+        if not interaction.response.is_done():
+            with self._span("http interaction.response.edit_message"):
+                await interaction.response.edit_message(view=self, **kwargs)
+        else:
+            # on_finish responded to the interaction
+            await self._edit_message(view=self, **kwargs)
+        self._render_id += 1
+
+        if finished and self._drafts is not None:
+            await self._drafts.discard(self, interaction.user.id)
+
+    async def _resume(self, interaction: discord.Interaction[Any], **kwargs: Any) -> None:
+        # responds with the paginator as it is, e.g. when a user resumes their SharedModalPaginator session
+        # unlike send, the paginator isn't validated, admitted or restored again and no new trace is started
+        self._cancel_render()
+        self._current_modal = self.get_modal()
+        self._handle_button_states()
+        for key, value in self._renderer.render(self).items():
+            kwargs.setdefault(key, value)
+        with self._span("http interaction.response.send_message"):
+            await interaction.response.send_message(view=self, **kwargs)
+        # the previous message is outdated, the paginator is edited through the new response from now on
+        self._interaction = interaction
+        self._message = None
+        self._render_id += 1
+
+    def _disable_buttons(self) -> None:
+        self.next_page.disabled = True
+        self.previous_page.disabled = True
+        self.open_button.disabled = True
+        self.finish_button.disabled = True
+        self.cancel_button.disabled = True
+        self.review_button.disabled = True
+
+    async def _edit_stopped_message(self) -> None:
+        # for paginators that were stopped without an interaction, e.g. replaced by the admission controller
+        if not self._disable_after:
             return
 
-    async def disable_all_buttons(self, interaction: discord.Interaction[Any]) -> None:
+        self._disable_buttons()
+        try:
+            await self._edit_message(view=self, **self._renderer.render_stopped(self))
+        except discord.HTTPException as e:
+            # e.g. the message was deleted or the interaction's token expired
+            _log.debug("Failed to disable the buttons of stopped paginator %r: %s", self, e)
+
+    async def disable_all_buttons(self, interaction: discord.Interaction[Any], **kwargs: Any) -> None:
         """Disables all buttons.
 
-        Uses the interaction if not responded else calls ``.edit`` on the :attr:`ModalPaginator.message`.
+        Uses the interaction if not responded else edits the paginator's message.
+
+        .. versionchanged:: 1.3
+            The message is edited using the interaction it was sent with if it wasn't fetched.
 
         Parameters
         -----------
         interaction: :class:`discord.Interaction`
             The interaction to edit.
+        **kwargs: Any
+            Additional keyword arguments to edit the message with, e.g. ``content``.
+            This is what was passed to :meth:`ModalPaginator.set_final_message` when the paginator is finished or cancelled.
+            Defaults to what the ``renderer`` renders for the stopped paginator, see
+            :meth:`~discord.ext.modal_paginator.renderer.Renderer.render_stopped`.
+
+            .. versionadded:: 1.3
         """
-        self.next_page.disabled = True
-        self.previous_page.disabled = True
-        self.open_button.disabled = True
-        self.finish_button.disabled = True
-        self.cancel_button.disabled = True
+        self._disable_buttons()
+        for key, value in self._renderer.render_stopped(self).items():
+            kwargs.setdefault(key, value)
+        kwargs["view"] = self
         if not interaction.response.is_done():
-            await interaction.response.edit_message(view=self)
-        elif self.message:
-            await self.message.edit(view=self)
+            with self._span("http interaction.response.edit_message"):
+                await interaction.response.edit_message(**kwargs)
+        elif interaction.extras.get(_DEFERRED_KEY):
+            with self._span("http interaction.edit_original_response"):
+                await interaction.edit_original_response(**kwargs)
+        else:
+            await self._edit_message(**kwargs)
 
     @overload
     async def send(
@@ -859,6 +1969,7 @@ class ModalPaginator(discord.ui.View):
         discord.InteractionMessage,
         discord.WebhookMessage,
         _InteractionCallbackResponse[Any],
+        None,
     ]: ...
 
     async def send(
@@ -873,6 +1984,7 @@ class ModalPaginator(discord.ui.View):
         discord.WebhookMessage,
         discord.InteractionMessage,
         _InteractionCallbackResponse[Any],
+        None,
     ]:
         r"""Sends the paginator.
 
@@ -883,6 +1995,12 @@ class ModalPaginator(discord.ui.View):
             This now can return ``None`` if ``return_message`` is ``False``.
         .. versionchanged:: 1.2.1
             This now returns the message/callback that was sent.
+        .. versionchanged:: 1.3
+            The text inputs are prefilled with the user's cached answers if ``answer_cache`` was given,
+            see :meth:`ModalPaginator.prefill`, and the pages are restored from the user's draft if ``drafts``
+            was given. The user is ``author_id`` or the user of ``obj``.
+            The paginator is admitted by the ``admission`` controller, if given. If it has to wait for a slot,
+            an interaction that wasn't responded to is deferred first and the paginator is sent as a followup.
 
         Parameters
         -----------
@@ -897,6 +2015,10 @@ class ModalPaginator(discord.ui.View):
             or if you don't want to add it at all.
 
             .. versionadded:: 1.2
+            .. versionchanged:: 1.3
+                What the ``renderer`` renders is added instead, e.g. the embed of an
+                :class:`~discord.ext.modal_paginator.renderer.EmbedRenderer`.
+                The page string is now also added if no ``kwargs`` are given.
         return_message: :class:`bool`
             Whether to return the message that was sent. Defaults to ``False``.
 
@@ -905,6 +2027,9 @@ class ModalPaginator(discord.ui.View):
             .. versionadded:: 1.2
             .. deprecated:: 1.2.1
                 This is deprecated as the method now returns the message/callback that was sent.
+            .. versionchanged:: 1.3
+                Only used if ``obj`` is an :class:`~discord.Interaction` that wasn't responded to and the
+                library doesn't return the message. If ``True``, the message is fetched and returned.
         **kwargs: Any
             Additional keyword arguments to the destination's sending method.
 
@@ -915,23 +2040,94 @@ class ModalPaginator(discord.ui.View):
 
         Returns
         --------
-        Union[:class:`~discord.Message`, :class:`~discord.WebhookMessage`, :class:`~discord.InteractionMessage`]
+        Optional[Union[:class:`~discord.Message`, :class:`~discord.WebhookMessage`, :class:`~discord.InteractionMessage`, :class:`~discord.InteractionCallbackResponse`]]
             The message that was sent.
 
-            :meth:`discord.Interaction.original_response` is used if ``obj`` is an :class:`discord.Interaction` and the
-            interaction was not responded to. Set ``return_message`` to disable this.
+            If ``obj`` is an :class:`discord.Interaction` that was not responded to, the message is not fetched unless
+            ``return_message`` is ``True``. Depending on the discord.py version, either the
+            :class:`~discord.InteractionCallbackResponse` or ``None`` is returned in that case.
+
+            .. versionchanged:: 1.3
+                The message is no longer fetched using :meth:`discord.Interaction.original_response` by default.
+                See :meth:`ModalPaginator.fetch_message`.
+
+        Raises
+        -------
+        AdmissionRejected
+            The paginator was not admitted by the ``admission`` controller.
+            The interaction may have been deferred, use :attr:`discord.Interaction.followup` to respond.
         """  # noqa: E501
         self.validate_pages()
+        user_id = self._get_user_id(obj)
+        if self._tracer is not None and self._trace is None:
+            self._trace = self._tracer.start_trace("ModalPaginator.session", pages=len(self._modals))
+            if self.form_id is not None:
+                self._trace.set_attribute("form_id", self.form_id)
+            if user_id is not None:
+                self._trace.set_attribute("user_id", user_id)
+
+        try:
+            with self._span("ModalPaginator.send"):
+                if self._admission is not None:
+                    guild_id = self._get_guild_id(obj)
+                    if (
+                        isinstance(obj, discord.Interaction)
+                        and not obj.response.is_done()
+                        and self._admission._would_wait(user_id, guild_id)  # pyright: ignore [reportPrivateUsage]
+                    ):
+                        # Discord requires a response within 3 seconds, waiting for a slot can take longer
+                        with self._span("http interaction.response.defer"):
+                            await obj.response.defer(ephemeral=kwargs.get("ephemeral", False), thinking=True)
+                    await self._admission.acquire(self, user_id, guild_id)
+                    try:
+                        result = await self.__send_impl(obj, user_id, add_page_string, return_message, **kwargs)
+                    except Exception:
+                        self._admission.release(self)
+                        raise
+                else:
+                    result = await self.__send_impl(obj, user_id, add_page_string, return_message, **kwargs)
+        except Exception:
+            # the session never started
+            self._end_trace()
+            raise
+
+        self._emit("session_start", SessionStartEvent, obj if isinstance(obj, discord.Interaction) else None)
+        return result
+
+    async def __send_impl(
+        self,
+        obj: Union[discord.abc.Messageable, discord.Interaction[Any], _commands.Context[Any]],
+        user_id: Optional[int],
+        add_page_string: bool,
+        return_message: bool,
+        **kwargs: Any,
+    ) -> Union[
+        discord.Message,
+        discord.WebhookMessage,
+        discord.InteractionMessage,
+        _InteractionCallbackResponse[Any],
+        None,
+    ]:
+        if user_id is not None:
+            if self._drafts is not None and await self._drafts.restore(self, user_id):
+                # continue where the user left off
+                self.current_page = next((i for i, m in enumerate(self._modals) if not m.is_finished()), 0)
+                self._current_modal = self.get_modal()
+                self._handle_button_states()
+            if self._answer_cache is not None:
+                self.prefill(user_id)
+
         base_kwargs: Dict[str, Any] = {"view": self}
-        if kwargs:
+        if add_page_string:
+            rendered = self._renderer.render(self)
+            page_content = rendered.pop("content", None)
             content = kwargs.get("content")
-            if add_page_string:
-                if content:
-                    kwargs["content"] = f"{self.page_string}\n\n{content}"
-                else:
-                    kwargs["content"] = self.page_string
+            if page_content:
+                kwargs["content"] = f"{page_content}\n\n{content}" if content else page_content
+            for key, value in rendered.items():
+                kwargs.setdefault(key, value)
 
-            base_kwargs.update(kwargs)
+        base_kwargs.update(kwargs)
 
         if not isinstance(
             obj, (discord.Interaction, discord.abc.Messageable)
@@ -941,18 +2137,25 @@ class ModalPaginator(discord.ui.View):
             )
 
         if not isinstance(obj, discord.Interaction):
-            self._message = await obj.send(**base_kwargs)
+            with self._span("http send"):
+                self._message = await obj.send(**base_kwargs)
             return self._message
 
         if obj.response.is_done():
             base_kwargs.pop("wait", None)
-            self._message = await obj.followup.send(wait=True, **base_kwargs)
+            with self._span("http interaction.followup.send"):
+                self._message = await obj.followup.send(wait=True, **base_kwargs)
             return self._message
 
-        response = await obj.response.send_message(**base_kwargs)
+        with self._span("http interaction.response.send_message"):
+            response = await obj.response.send_message(**base_kwargs)
+        # the message is only fetched when it's needed, the interaction's token is enough to edit it
+        self._interaction = obj
         if not utils.IS_DPY2_5 or not utils.IS_DPY_2_5_WITH_INTERACTIONEDITFIXED:
-            self._message = await obj.original_response()
-            return self._message
+            if return_message:
+                return await self.fetch_message()  # pyright: ignore[reportReturnType]
+
+            return response  # pyright: ignore[reportReturnType]
 
         if (
             response
@@ -963,7 +2166,10 @@ class ModalPaginator(discord.ui.View):
 
             return response
 
-        return self._message  # pyright: ignore[reportReturnType]
+        if return_message:
+            return await self.fetch_message()  # pyright: ignore[reportReturnType]
+
+        return response  # pyright: ignore[reportReturnType]
 
     async def __send_error_message(
         self, interaction: discord.Interaction[Any], to_call: Callable[[], Dict[str, Any]]
@@ -976,10 +2182,70 @@ class ModalPaginator(discord.ui.View):
             raise TypeError(ERROR_MESSAGE)
 
         try:
-            await interaction.response.send_message(**kwrgs)
+            with self._span("http interaction.response.send_message"):
+                await interaction.response.send_message(**kwrgs)
         except TypeError as e:
             raise TypeError(ERROR_MESSAGE) from e
 
+    def get_validation_error_message(self, modal: PaginatorModal) -> Dict[str, Any]:
+        r"""The message to edit the paginator's message with when a submitted modal did not pass validation.
+
+        You can override this to change the message using a dictonary with the same keys as
+        :meth:`interaction.response.edit_message <discord.InteractionResponse.edit_message>`.
+
+        This is called in :meth:`PaginatorModal.on_submit`.
+
+        The default implementation is the following:
+
+        ``{"content": "{page_string}\n\n**label**: error\n..."}``
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        modal: :class:`PaginatorModal`
+            The modal that was submitted. See :attr:`PaginatorModal.errors` for the errors.
+
+        Returns
+        --------
+        :class:`dict`
+            The message to edit with.
+        """
+        errors = "\n".join(f"**{text_input.label}**: {error}" for text_input, error in modal.errors.items())
+        return {"content": f"{self.page_string}\n\n{errors}"}
+
+    def get_answers_validation_error_message(self, modals: List[PaginatorModal]) -> Dict[str, Any]:
+        r"""The message to edit the paginator's message with when the "Finish" button is pressed
+        but some answers did not pass the :class:`.AsyncValidator`\s.
+
+        The paginator is already moved to the first invalid page when this is called.
+
+        You can override this to change the message using a dictonary with the same keys as
+        :meth:`interaction.edit_original_response <discord.Interaction.edit_original_response>`.
+
+        The default implementation is the following:
+
+        ``{"content": "{page_string}\n\nPage {page}: **label**: error\n..."}``
+
+        .. versionadded:: 1.3
+
+        Parameters
+        -----------
+        modals: List[:class:`PaginatorModal`]
+            The invalid modals, in page order. See :attr:`PaginatorModal.errors` for the errors.
+
+        Returns
+        --------
+        :class:`dict`
+            The message to edit with.
+        """
+        errors = "\n".join(
+            f"Page {self._modals.index(modal) + 1}: **{text_input.label}**: {error}"
+            for modal in modals
+            for text_input, error in modal.errors.items()
+        )
+        return {"content": f"{self.page_string}\n\n{errors}"}
+
     def get_previous_button_error_message(self) -> Dict[str, Any]:
         """The error message to send when the user tries
         to go back to a previous page but has to complete the current modal first.
@@ -1002,11 +2268,7 @@ class ModalPaginator(discord.ui.View):
         :class:`dict`
             The error message to send.
         """
-        return {
-            "content": "Please complete the current modal before going back.",
-            "ephemeral": True,
-            "delete_after": 5,
-        }
+        return _default_error_message("get_previous_button_error_message")
 
     def get_next_button_error_message(self) -> Dict[str, Any]:
         """The error message to send when the user tries
@@ -1030,11 +2292,7 @@ class ModalPaginator(discord.ui.View):
         :class:`dict`
             The error message to send.
         """
-        return {
-            "content": "Please complete the current modal before going to the next one.",
-            "ephemeral": True,
-            "delete_after": 5,
-        }
+        return _default_error_message("get_next_button_error_message")
 
     def get_open_button_error_message(self) -> Dict[str, Any]:
         """The error message to send when the user tries
@@ -1058,11 +2316,7 @@ class ModalPaginator(discord.ui.View):
         :class:`dict`
             The error message to send.
         """
-        return {
-            "content": "Something went wrong... there is no current modal. Please report this to the developer.",
-            "ephemeral": True,
-            "delete_after": 5,
-        }
+        return _default_error_message("get_open_button_error_message")
 
     def get_finish_button_error_message(self) -> Dict[str, Any]:
         """The error message to send when the user tries to press the "Finish" button
@@ -1086,29 +2340,51 @@ class ModalPaginator(discord.ui.View):
         :class:`dict`
             The error message to send.
         """
-        return {
-            "content": "You shouldn't be able to press this button... please finish all required modals.",
-            "ephemeral": True,
-            "delete_after": 5,
-        }
+        return _default_error_message("get_finish_button_error_message")
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.blurple, row=1, custom_id="PREVIOUS")
     async def previous_page(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Self]) -> None:
-        if self._is_locked():
-            await self.__send_error_message(interaction, self.get_previous_button_error_message)
-            return
-
-        self.current_page -= 1
-        await self.update(interaction)
+        async with self._get_lock():
+            if self._is_stale(interaction):
+                await self._drop_stale(interaction)
+                return
+
+            if self._is_locked():
+                await self.__send_error_message(interaction, self.get_previous_button_error_message)
+                return
+
+            previous = self.current_page
+            if self._is_throttled():
+                self.current_page = max(self.current_page - 1, 0)
+                await self._defer_render(interaction)
+            else:
+                self.current_page -= 1
+                await self.update(interaction)
+
+            if self.current_page != previous:
+                self._emit("page_change", PageChangeEvent, interaction, previous, self.current_page)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.blurple, row=1, custom_id="NEXT")
     async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button[Self]) -> None:
-        if self._is_locked():
-            await self.__send_error_message(interaction, self.get_next_button_error_message)
-            return
-
-        self.current_page += 1
-        await self.update(interaction)
+        async with self._get_lock():
+            if self._is_stale(interaction):
+                await self._drop_stale(interaction)
+                return
+
+            if self._is_locked():
+                await self.__send_error_message(interaction, self.get_next_button_error_message)
+                return
+
+            previous = self.current_page
+            if self._is_throttled():
+                self.current_page = min(self.current_page + 1, self._max_pages)
+                await self._defer_render(interaction)
+            else:
+                self.current_page += 1
+                await self.update(interaction)
+
+            if self.current_page != previous:
+                self._emit("page_change", PageChangeEvent, interaction, previous, self.current_page)
 
     @discord.ui.button(label="Open", row=0, custom_id="OPEN")
     async def open_button(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Self]) -> None:
@@ -1117,16 +2393,71 @@ class ModalPaginator(discord.ui.View):
             await self.__send_error_message(interaction, self.get_open_button_error_message)
             return
 
-        await interaction.response.send_modal(self.current_modal)
+        if self._allow_resubmit and self.current_modal.is_finished():
+            for text_input in self.current_modal.text_inputs:
+                text_input.default = text_input.value
+
+        if self._check_cache is not None:
+            # the check passed for this interaction, no need to run it again when the modal is submitted
+            self.current_modal._checked_user_id = interaction.user.id  # pyright: ignore [reportPrivateUsage]
+
+        with self._span("http interaction.response.send_modal"):
+            await interaction.response.send_modal(self.current_modal._to_send())  # pyright: ignore [reportPrivateUsage]
 
     @discord.ui.button(label="Finish", style=discord.ButtonStyle.green, row=2, custom_id="FINISH")
     async def finish_button(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Self]) -> None:
-        if not all(m.is_finished() for m in self._modals if m.required):
-            await self.__send_error_message(interaction, self.get_finish_button_error_message)
-            return
+        async with self._get_lock():
+            if self.is_finished():
+                # pressed twice, already handled
+                await self._drop_stale(interaction)
+                return
+
+            if not all(m.is_finished() for m in self._modals if m.required):
+                await self.__send_error_message(interaction, self.get_finish_button_error_message)
+                return
+
+            converts = any(m._converters for m in self._modals)  # pyright: ignore [reportPrivateUsage]
+            if converts or any(m._async_validators for m in self._modals):  # pyright: ignore [reportPrivateUsage]
+                await interaction.response.defer()
+                interaction.extras[_DEFERRED_KEY] = True
+                invalid = await self.validate_answers(interaction)
+                if not invalid and converts:
+                    invalid = await self.__convert_on_finish(interaction)
+                if invalid:
+                    self.current_page = self._modals.index(invalid[0])
+                    self._current_modal = self.get_modal()
+                    self._handle_button_states()
+                    await interaction.edit_original_response(
+                        view=self, **self.get_answers_validation_error_message(invalid)
+                    )
+                    self._render_id += 1
+                    return
+
+            await self.__finish_impl(interaction)
+
+    async def __convert_on_finish(self, interaction: discord.Interaction[Any]) -> List[PaginatorModal]:
+        try:
+            self._converted_answers = await self.convert_answers(interaction)
+        except ConversionError as e:
+            modal = next(m for m in self._modals if e.text_input in m.text_inputs)
+            modal._errors[e.text_input] = str(e)  # pyright: ignore [reportPrivateUsage]
+            modal._has_finish_errors = True  # pyright: ignore [reportPrivateUsage]
+            for text_input in modal.text_inputs:
+                text_input.default = text_input.value
 
-        await self.__finish_impl(interaction)
+            return [modal]
+
+        return []
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red, row=2, custom_id="CANCEL")
     async def cancel_button(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Self]) -> None:
-        await self.__cancel_impl(interaction)
+        async with self._get_lock():
+            if self.is_finished():
+                await self._drop_stale(interaction)
+                return
+
+            await self.__cancel_impl(interaction)
+
+    @discord.ui.button(label="Review", style=discord.ButtonStyle.gray, row=2, custom_id="REVIEW")
+    async def review_button(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Self]) -> None:
+        await self.review(interaction)
@@ -17,6 +17,7 @@ __all__ = (
     "PreviousButton",
     "CancelButton",
     "FinishButton",
+    "ReviewButton",
 )
 
 
@@ -69,10 +70,20 @@ FinishButton = CustomButton(label="Finish", style=discord.ButtonStyle.green, row
 Default implementation is, ``(label="Finish", style=discord.ButtonStyle.green, row=2)``.
 """
 
+ReviewButton = CustomButton(label="Review", style=discord.ButtonStyle.gray, row=2)
+"""Represents the default review button for :class:`.ModalPaginator`.
+Only added to the paginator if ``review`` is ``True``.
+
+Default implementation is, ``(label="Review", style=discord.ButtonStyle.gray, row=2)``.
+
+.. versionadded:: 1.3
+"""
+
 BUTTONS: Dict[ButtonKeysLiteral, CustomButton] = {
     "OPEN": OpenButton,
     "NEXT": NextButton,
     "PREVIOUS": PreviousButton,
     "FINISH": FinishButton,
     "CANCEL": CancelButton,
+    "REVIEW": ReviewButton,
 }
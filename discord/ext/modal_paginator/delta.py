@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .core import PaginatorModal
+
+__all__ = ("SubmitDelta",)
+
+
+class SubmitDelta:
+    """Represents what changed when a :class:`.PaginatorModal` was submitted compared to its previous submission.
+
+    This is passed to :meth:`.ModalPaginator.on_page_submit` and available as :attr:`.PaginatorModal.last_delta`.
+    Questions are the custom ID of the text input if it was explicitly passed, else the label.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    modal: :class:`.PaginatorModal`
+        The modal that was submitted.
+    changes: Dict[:class:`str`, Tuple[Optional[:class:`str`], :class:`str`]]
+        A mapping of question to its previous and new answer, only for the answers that changed.
+        The previous answer is ``None`` if this is the first submission.
+    is_first: :class:`bool`
+        Whether this is the first submission of the modal. All answers are in :attr:`changes` if so.
+    """
+
+    __slots__ = ("modal", "changes", "is_first")
+
+    def __init__(
+        self,
+        modal: PaginatorModal,
+        previous: Optional[Mapping[str, str]],
+        current: Mapping[str, str],
+    ) -> None:
+        self.modal: PaginatorModal = modal
+        self.is_first: bool = previous is None
+        if previous is None:
+            self.changes: Dict[str, Tuple[Optional[str], str]] = {
+                question: (None, answer) for question, answer in current.items()
+            }
+        else:
+            self.changes = {
+                question: (previous.get(question), answer)
+                for question, answer in current.items()
+                if previous.get(question) != answer
+            }
+
+    def __repr__(self) -> str:
+        return f"<SubmitDelta modal={self.modal!r} changed={list(self.changes)!r} is_first={self.is_first}>"
+
+    @property
+    def is_noop(self) -> bool:
+        """:class:`bool`: Whether the modal was submitted again without changing any answer."""
+        return not self.is_first and not self.changes
+
+    @property
+    def changed(self) -> Dict[str, str]:
+        """Dict[:class:`str`, :class:`str`]: A mapping of question to the new answer, only for changed answers."""
+        return {question: answer for question, (_, answer) in self.changes.items()}
@@ -0,0 +1,330 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import asyncio
+import json
+import logging
+import os
+import re
+from typing import TYPE_CHECKING, Dict, Optional, TypedDict, Union
+
+from .utils import question_key
+
+if TYPE_CHECKING:
+    from .core import ModalPaginator, PaginatorModal
+
+__all__ = (
+    "PageDraft",
+    "DraftStore",
+    "JSONDraftStore",
+    "DraftAutosaver",
+)
+
+_log = logging.getLogger(__name__)
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class PageDraft(TypedDict):
+    """The saved state of a single page (modal) of a :class:`.ModalPaginator`.
+
+    ``finished`` is whether the modal was submitted and ``values`` is a mapping of question to answer.
+    Questions are the custom ID of the text input if it was explicitly passed, else the label.
+
+    .. versionadded:: 1.3
+    """
+
+    finished: bool
+    values: Dict[str, str]
+
+
+# session key -> page index -> page
+Drafts = Dict[str, Dict[int, PageDraft]]
+
+
+class DraftStore(ABC):
+    """The base class for stores that persist drafts for a :class:`DraftAutosaver`.
+
+    A draft is the saved state of the pages of a single session, keyed by the page index.
+    Subclass this and override all methods to create your own store (e.g. backed by a database).
+
+    .. versionadded:: 1.3
+    """
+
+    @abstractmethod
+    async def save(self, drafts: Drafts) -> None:
+        """Saves a batch of changed pages.
+
+        Pages that are not in the batch must be kept as they are.
+
+        Parameters
+        -----------
+        drafts: Dict[:class:`str`, Dict[:class:`int`, :class:`PageDraft`]]
+            A mapping of session key to the changed pages of that session.
+        """
+
+    @abstractmethod
+    async def load(self, key: str) -> Optional[Dict[int, PageDraft]]:
+        """Loads the draft of a session.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the session.
+
+        Returns
+        --------
+        Optional[Dict[:class:`int`, :class:`PageDraft`]]
+            The saved pages or ``None`` if there is no draft.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Deletes the draft of a session, if any.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the session.
+        """
+
+
+class JSONDraftStore(DraftStore):
+    """A :class:`DraftStore` that saves each draft as a JSON file in a local directory.
+
+    Files are read and written in the event loop's default executor so the
+    event loop is never blocked by disk I/O. Files are replaced atomically.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    directory: Union[:class:`str`, :class:`os.PathLike`]
+        The directory to save the drafts in. Created if it doesn't exist.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike[str]]) -> None:
+        self.directory: str = os.fspath(directory)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{_UNSAFE_CHARS.sub('_', key)}.json")
+
+    def _read(self, key: str) -> Optional[Dict[int, PageDraft]]:
+        try:
+            with open(self._path(key), encoding="utf-8") as fp:
+                data: Dict[str, PageDraft] = json.load(fp)
+        except FileNotFoundError:
+            return None
+
+        return {int(index): page for index, page in data.items()}
+
+    def _write(self, drafts: Drafts) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        for key, pages in drafts.items():
+            draft = self._read(key) or {}
+            draft.update(pages)
+
+            path = self._path(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump({str(index): page for index, page in draft.items()}, fp)
+            os.replace(tmp_path, path)
+
+    def _remove(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    async def save(self, drafts: Drafts) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._write, drafts)
+
+    async def load(self, key: str) -> Optional[Dict[int, PageDraft]]:
+        return await asyncio.get_running_loop().run_in_executor(None, self._read, key)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._remove, key)
+
+
+class DraftAutosaver:
+    r"""Saves the submitted pages of :class:`.ModalPaginator`\s to a :class:`DraftStore` in the background.
+
+    Submitting a modal only takes a snapshot of its values in memory and marks the page as dirty.
+    The dirty pages of all sessions are saved in a single batch every ``interval`` seconds
+    so the interaction isn't delayed by the store.
+
+    Drafts are restored when the paginator is sent again to the same user, see :meth:`DraftAutosaver.restore`,
+    and deleted when the paginator is finished or cancelled. Drafts of paginators that timed out are kept.
+
+    Pass an instance to the ``drafts`` kwarg of :class:`.ModalPaginator`. The same instance can,
+    and should, be shared by all paginators. Call :meth:`DraftAutosaver.close` before shutting down
+    to save the pages that are still dirty.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    store: :class:`DraftStore`
+        The store to save the drafts in.
+    interval: :class:`float`
+        How long to collect dirty pages for before saving them, in seconds. Defaults to ``2.0``.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        drafts = DraftAutosaver(JSONDraftStore("drafts"))
+
+        paginator = ModalPaginator(modals, form_id="application", drafts=drafts)
+        await paginator.send(interaction)
+    """
+
+    def __init__(self, store: DraftStore, *, interval: float = 2.0) -> None:
+        self.store: DraftStore = store
+        self.interval: float = interval
+        self._dirty: Drafts = {}
+        self._flush_task: Optional[asyncio.Task[None]] = None
+        # saving and deleting are serialized so a discarded draft isn't saved again by a flush in progress
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
+    @property
+    def dirty(self) -> int:
+        """:class:`int`: The amount of sessions with pages that weren't saved yet."""
+        return len(self._dirty)
+
+    @staticmethod
+    def get_key(paginator: ModalPaginator, user_id: int) -> str:
+        """Returns the key of a session in the store.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator of the session.
+        user_id: :class:`int`
+            The ID of the user of the session.
+
+        Returns
+        --------
+        :class:`str`
+            The key, ``{form_id}:{user_id}``.
+        """
+        return f"{paginator.form_id}:{user_id}"
+
+    def mark_dirty(self, paginator: ModalPaginator, modal: PaginatorModal, user_id: int) -> None:
+        """Takes a snapshot of a submitted modal and schedules it to be saved.
+
+        This is called when a modal is submitted.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator of the modal.
+        modal: :class:`.PaginatorModal`
+            The submitted modal.
+        user_id: :class:`int`
+            The ID of the user that submitted the modal.
+        """
+        page: PageDraft = {
+            "finished": modal.is_finished(),
+            "values": {question_key(text_input): text_input.value for text_input in modal.text_inputs},
+        }
+        key = self.get_key(paginator, user_id)
+        self._dirty.setdefault(key, {})[paginator.modals.index(modal)] = page
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Saves all dirty pages now.
+
+        Pages that couldn't be saved are kept dirty and retried on the next flush
+        unless they were changed again in the meantime.
+        """
+        async with self._get_lock():
+            if not self._dirty:
+                return
+
+            batch, self._dirty = self._dirty, {}
+            try:
+                await self.store.save(batch)
+            except Exception:
+                _log.exception("Failed to save %d draft(s), retrying on the next flush.", len(batch))
+                for key, pages in batch.items():
+                    newer = self._dirty.setdefault(key, {})
+                    for index, page in pages.items():
+                        newer.setdefault(index, page)
+
+    async def restore(self, paginator: ModalPaginator, user_id: int) -> bool:
+        """Restores the values and finished state of the pages of a paginator from its draft.
+
+        This is called in :meth:`.ModalPaginator.send`.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to restore.
+        user_id: :class:`int`
+            The ID of the user of the session.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether a draft was restored.
+        """
+        key = self.get_key(paginator, user_id)
+        # pages that weren't saved yet are newer than the stored ones
+        pages = await self.store.load(key) or {}
+        pages.update(self._dirty.get(key, {}))
+        if not pages:
+            return False
+
+        modals = paginator.modals
+        for index, page in pages.items():
+            if index >= len(modals):
+                continue
+
+            modal = modals[index]
+            values = page["values"]
+            for text_input in modal.text_inputs:
+                value = values.get(question_key(text_input))
+                if value is not None:
+                    text_input._value = value  # pyright: ignore [reportPrivateUsage]
+                    text_input.default = value
+
+            if page["finished"]:
+                modal.stop()
+
+        return True
+
+    async def discard(self, paginator: ModalPaginator, user_id: int) -> None:
+        """Deletes the draft of a session, e.g. when it was finished.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator of the session.
+        user_id: :class:`int`
+            The ID of the user of the session.
+        """
+        key = self.get_key(paginator, user_id)
+        async with self._get_lock():
+            self._dirty.pop(key, None)
+            await self.store.delete(key)
+
+    async def close(self) -> None:
+        """Saves all dirty pages and stops the background task."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+
+        self._flush_task = None
+        await self.flush()
@@ -0,0 +1,68 @@
+from enum import Enum
+
+
+__all__ = (
+    "AdvancePolicy",
+    "SessionState",
+    "AdmissionPolicy",
+)
+
+
+class AdvancePolicy(Enum):
+    """Represents where the paginator should go to after a modal is submitted.
+
+    Pass this to the ``advance_policy`` kwarg in :class:`.ModalPaginator`.
+
+    .. versionadded:: 1.3
+    """
+
+    next_page = 0
+    """Go to the page after the current page. This is the default and the behaviour before this was added."""
+    next_unfinished = 1
+    """Go to the first page after the current page that isn't finished yet.
+    Wraps around to the first page if needed, unless ``can_go_back`` is ``False``.
+    """
+    next_required_unfinished = 2
+    """Go to the first required page after the current page that isn't finished yet.
+    Wraps around to the first page if needed, unless ``can_go_back`` is ``False``.
+    """
+
+
+class SessionState(Enum):
+    """Represents the state of a :class:`.ModalPaginator`.
+
+    See :attr:`.ModalPaginator.state` and :class:`~discord.ext.modal_paginator.registry.SessionRegistry`.
+
+    .. versionadded:: 1.3
+    """
+
+    active = 0
+    """The paginator is listening for interactions."""
+    finished = 1
+    """The paginator was finished."""
+    cancelled = 2
+    """The paginator was cancelled using the "Cancel" button or stopped using :meth:`~discord.ui.View.stop`."""
+    timed_out = 3
+    """The paginator timed out."""
+
+
+class AdmissionPolicy(Enum):
+    """Represents what an :class:`~discord.ext.modal_paginator.admission.AdmissionController`
+    does when a session limit is reached.
+
+    .. versionadded:: 1.3
+    """
+
+    reject = 0
+    """Raise :exc:`.AdmissionRejected`."""
+    replace_oldest = 1
+    """Stop the user's oldest paginator, disabling its buttons, and admit the new one.
+    Raises :exc:`.AdmissionRejected` if stopping none of the user's paginators would free the exceeded limit,
+    e.g. if the guild limit is reached and the user's paginators are in other guilds.
+    """
+    queue = 2
+    """Wait until a paginator stops. Raises :exc:`.AdmissionRejected` if too many paginators are waiting
+    or if waiting takes too long.
+
+    A paginator that is sent to an interaction defers it before waiting, so it's sent as a followup.
+    """
@@ -1,4 +1,4 @@
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import discord
 
@@ -8,6 +8,9 @@ __all__ = (
     "NotAModal",
     "NoModals",
     "InvalidButtonKey",
+    "ConversionError",
+    "AdmissionRejected",
+    "InvalidForm",
 )
 
 
@@ -54,3 +57,72 @@ class InvalidButtonKey(ModalPaginatorException):
         self.key: str = key
         keys = ", ".join(valid_keys)
         super().__init__(f"Invalid key in button dictionary: {key!r}. Valid keys are: {keys}")
+
+
+class ConversionError(ModalPaginatorException):
+    """Raised when a converter fails to convert the value of a text input.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    text_input: :class:`discord.ui.TextInput`
+        The text input that failed to convert.
+    value: :class:`str`
+        The value that failed to convert.
+    original: Optional[:class:`Exception`]
+        The original exception that was raised, if any.
+    """
+
+    def __init__(
+        self,
+        text_input: discord.ui.TextInput[Any],
+        value: str,
+        *,
+        message: Optional[str] = None,
+        original: Optional[Exception] = None,
+    ) -> None:
+        self.text_input: discord.ui.TextInput[Any] = text_input
+        self.value: str = value
+        self.original: Optional[Exception] = original
+        super().__init__(message or f"Could not convert {value!r} for {text_input.label!r}.")
+
+
+class AdmissionRejected(ModalPaginatorException):
+    """Raised when a paginator is not admitted by an :class:`~discord.ext.modal_paginator.admission.AdmissionController`
+    because a session limit is reached.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    scope: :class:`str`
+        The limit that was reached. One of ``"user"``, ``"guild"``, ``"total"`` or ``"queue"``.
+    limit: :class:`int`
+        The value of the limit.
+    """
+
+    def __init__(self, scope: str, limit: int) -> None:
+        self.scope: str = scope
+        self.limit: int = limit
+        super().__init__(f"The {scope} session limit of {limit} is reached.")
+
+
+class InvalidForm(ModalPaginatorException):
+    """Raised when a form definition is invalid, see :class:`~discord.ext.modal_paginator.forms.FormDefinition`.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    path: :class:`str`
+        Where in the definition the error is, e.g. ``pages[0].inputs[1].label``.
+    reason: :class:`str`
+        What is wrong.
+    """
+
+    def __init__(self, path: str, reason: str) -> None:
+        self.path: str = path
+        self.reason: str = reason
+        location = f" at {path}" if path else ""
+        super().__init__(f"Invalid form definition{location}: {reason}")
@@ -0,0 +1,279 @@
+from __future__ import annotations
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+import discord
+
+from .enums import SessionState
+
+if TYPE_CHECKING:
+    from .core import ModalPaginator, PaginatorModal
+    from .delta import SubmitDelta
+
+__all__ = (
+    "EventBus",
+    "PaginatorEvent",
+    "SessionStartEvent",
+    "PageChangeEvent",
+    "ModalSubmitEvent",
+    "SessionEndEvent",
+)
+
+_log = logging.getLogger(__name__)
+
+_EVENTS = frozenset(("session_start", "page_change", "modal_submit", "finish", "cancel", "timeout"))
+
+Listener = Callable[[Any], Any]
+
+
+class PaginatorEvent:
+    """The base class of the events emitted by a :class:`.ModalPaginator`.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    paginator: :class:`.ModalPaginator`
+        The paginator that emitted the event.
+    interaction: Optional[:class:`discord.Interaction`]
+        The interaction that caused the event, if any.
+    """
+
+    __slots__ = ("paginator", "interaction")
+
+    def __init__(self, paginator: ModalPaginator, interaction: Optional[discord.Interaction[Any]]) -> None:
+        self.paginator: ModalPaginator = paginator
+        self.interaction: Optional[discord.Interaction[Any]] = interaction
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} paginator={self.paginator!r}>"
+
+
+class SessionStartEvent(PaginatorEvent):
+    """Emitted as ``session_start`` when the paginator was sent.
+
+    ``interaction`` is ``None`` if the paginator wasn't sent to an interaction.
+
+    .. versionadded:: 1.3
+    """
+
+    __slots__ = ()
+
+
+class PageChangeEvent(PaginatorEvent):
+    """Emitted as ``page_change`` when the current page changed, by the "Next" and "Previous" buttons
+    or after a modal was submitted.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    previous: :class:`int`
+        The index of the previous page.
+    page: :class:`int`
+        The index of the new page.
+    """
+
+    __slots__ = ("previous", "page")
+
+    def __init__(
+        self, paginator: ModalPaginator, interaction: Optional[discord.Interaction[Any]], previous: int, page: int
+    ) -> None:
+        super().__init__(paginator, interaction)
+        self.previous: int = previous
+        self.page: int = page
+
+
+class ModalSubmitEvent(PaginatorEvent):
+    """Emitted as ``modal_submit`` when a modal was submitted and its answers passed validation.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    modal: :class:`.PaginatorModal`
+        The modal that was submitted.
+    delta: :class:`.SubmitDelta`
+        What changed compared to the previous submission of the modal.
+    """
+
+    __slots__ = ("modal", "delta")
+
+    def __init__(
+        self,
+        paginator: ModalPaginator,
+        interaction: Optional[discord.Interaction[Any]],
+        modal: PaginatorModal,
+        delta: SubmitDelta,
+    ) -> None:
+        super().__init__(paginator, interaction)
+        self.modal: PaginatorModal = modal
+        self.delta: SubmitDelta = delta
+
+
+class SessionEndEvent(PaginatorEvent):
+    """Emitted as ``finish``, ``cancel`` or ``timeout`` when the paginator was finished, cancelled or timed out.
+
+    ``interaction`` is ``None`` if the paginator timed out.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    state: :class:`.SessionState`
+        The state the paginator ended in.
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(
+        self, paginator: ModalPaginator, interaction: Optional[discord.Interaction[Any]], state: SessionState
+    ) -> None:
+        super().__init__(paginator, interaction)
+        self.state: SessionState = state
+
+
+class EventBus:
+    r"""Dispatches the lifecycle events of :class:`.ModalPaginator`\s to listeners.
+
+    Pass an instance to the ``events`` kwarg of :class:`.ModalPaginator`. The same instance should
+    be shared by all paginators. The events are:
+
+    - ``session_start``: :class:`SessionStartEvent`
+    - ``page_change``: :class:`PageChangeEvent`
+    - ``modal_submit``: :class:`ModalSubmitEvent`
+    - ``finish``, ``cancel`` and ``timeout``: :class:`SessionEndEvent`
+
+    The event objects are only created if there is a listener for the event, a paginator without a bus
+    or with a bus without listeners for an event doesn't do anything for it. Listeners run in their own
+    task so they don't delay the paginator, exceptions are logged.
+
+    If ``client`` is given, every event is also dispatched to it as ``modal_paginator_<event>``,
+    e.g. ``on_modal_paginator_finish``, in which case the event objects are always created.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    client: Optional[:class:`discord.Client`]
+        The client to also dispatch the events to. Defaults to ``None``.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        EVENTS = EventBus()
+
+        @EVENTS.listen()
+        async def on_finish(event: SessionEndEvent) -> None:
+            log.info("%s finished a form after %.1fs", event.interaction.user, event.paginator.age)
+
+        paginator = ModalPaginator(modals, events=EVENTS)
+    """
+
+    def __init__(self, *, client: Optional[discord.Client] = None) -> None:
+        self.client: Optional[discord.Client] = client
+        self._listeners: Dict[str, List[Listener]] = {}
+        # keeps the listener tasks alive until they're done
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def __repr__(self) -> str:
+        return f"<EventBus listeners={sum(len(listeners) for listeners in self._listeners.values())}>"
+
+    def add_listener(self, func: Listener, name: str) -> None:
+        """Adds a listener for an event.
+
+        Parameters
+        -----------
+        func: Callable[[:class:`PaginatorEvent`], Any]
+            The listener, can be a coroutine function.
+        name: :class:`str`
+            The name of the event.
+
+        Raises
+        -------
+        ValueError
+            The event doesn't exist.
+        """
+        if name not in _EVENTS:
+            raise ValueError(f"Unknown event {name!r}, must be one of: {', '.join(sorted(_EVENTS))}")
+
+        self._listeners.setdefault(name, []).append(func)
+
+    def remove_listener(self, func: Listener, name: str) -> None:
+        """Removes a listener for an event. Does nothing if it wasn't added.
+
+        Parameters
+        -----------
+        func: Callable[[:class:`PaginatorEvent`], Any]
+            The listener.
+        name: :class:`str`
+            The name of the event.
+        """
+        listeners = self._listeners.get(name)
+        if listeners is None or func not in listeners:
+            return
+
+        listeners.remove(func)
+        if not listeners:
+            # has_listeners is a key lookup
+            del self._listeners[name]
+
+    def listen(self, name: Optional[str] = None) -> Callable[[Listener], Listener]:
+        """A decorator that adds a listener for an event.
+
+        Parameters
+        -----------
+        name: Optional[:class:`str`]
+            The name of the event. Defaults to the name of the function without the ``on_`` prefix.
+        """
+
+        def decorator(func: Listener) -> Listener:
+            event = name if name is not None else func.__name__
+            self.add_listener(func, event[3:] if name is None and event.startswith("on_") else event)
+            return func
+
+        return decorator
+
+    def has_listeners(self, name: str) -> bool:
+        """Returns whether an event would be dispatched to anything.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the event.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether there are listeners for the event or a ``client`` to dispatch to.
+        """
+        return self.client is not None or name in self._listeners
+
+    def dispatch(self, name: str, event: PaginatorEvent) -> None:
+        """Dispatches an event to its listeners and the ``client``.
+
+        This is called by the paginators.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the event.
+        event: :class:`PaginatorEvent`
+            The event.
+        """
+        if self.client is not None:
+            self.client.dispatch(f"modal_paginator_{name}", event)
+
+        for listener in self._listeners.get(name, ()):
+            task = asyncio.create_task(self._run(listener, name, event))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, listener: Listener, name: str, event: PaginatorEvent) -> None:
+        try:
+            await discord.utils.maybe_coroutine(listener, event)
+        except Exception:
+            _log.exception("Listener %r for event %r raised an exception", listener, name)
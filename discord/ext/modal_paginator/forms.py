@@ -0,0 +1,578 @@
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, Union
+
+import discord
+
+from .button_set import ButtonSet
+from .core import (
+    _DEFAULT_ERROR_MESSAGES,  # pyright: ignore [reportPrivateUsage]
+    ModalPaginator,
+    PaginatorModal,
+    _default_error_message,  # pyright: ignore [reportPrivateUsage]
+)
+from .custom_button import CustomButton
+from .default_buttons import BUTTONS as DEFAULT_BUTTONS
+from .errors import InvalidForm
+
+__all__ = (
+    "FormDefinition",
+    "FormRegistry",
+)
+
+_log = logging.getLogger(__name__)
+
+_STYLES: Dict[str, discord.TextStyle] = {
+    "short": discord.TextStyle.short,
+    "long": discord.TextStyle.long,
+    "paragraph": discord.TextStyle.paragraph,
+}
+_INPUT_KEYS = frozenset(
+    ("label", "custom_id", "style", "placeholder", "default", "required", "min_length", "max_length")
+)
+
+
+def _expect(value: Any, kind: Union[type, Tuple[type, ...]], path: str) -> Any:
+    if not isinstance(value, kind) or isinstance(value, bool) and kind is int:
+        name = kind.__name__ if isinstance(kind, type) else " or ".join(k.__name__ for k in kind)
+        raise InvalidForm(path, f"expected {name}, got {type(value).__name__}")
+
+    return value
+
+
+def _compile_input(data: Any, path: str) -> Dict[str, Any]:
+    data = _expect(data, dict, path)
+    unknown = set(data) - _INPUT_KEYS
+    if unknown:
+        raise InvalidForm(path, f"unknown keys: {', '.join(sorted(unknown))}")
+
+    kwargs: Dict[str, Any] = {"label": _expect(data.get("label"), str, f"{path}.label")}
+    if len(kwargs["label"]) > 45:
+        raise InvalidForm(f"{path}.label", "must be 45 characters or fewer")
+
+    style = data.get("style", "short")
+    if style not in _STYLES:
+        raise InvalidForm(f"{path}.style", f"must be one of: {', '.join(_STYLES)}")
+    kwargs["style"] = _STYLES[style]
+
+    for key in ("custom_id", "placeholder", "default"):
+        if data.get(key) is not None:
+            kwargs[key] = _expect(data[key], str, f"{path}.{key}")
+    for key in ("min_length", "max_length"):
+        if data.get(key) is not None:
+            kwargs[key] = _expect(data[key], int, f"{path}.{key}")
+    kwargs["required"] = _expect(data.get("required", True), bool, f"{path}.required")
+    return kwargs
+
+
+class _Page:
+    __slots__ = ("title", "required", "inputs")
+
+    def __init__(self, title: str, required: bool, inputs: Tuple[Dict[str, Any], ...]) -> None:
+        self.title: str = title
+        self.required: bool = required
+        self.inputs: Tuple[Dict[str, Any], ...] = inputs
+
+
+def _compile_translations(data: Any) -> Dict[str, Dict[str, str]]:
+    data = _expect(data, dict, "translations")
+    translations: Dict[str, Dict[str, str]] = {}
+    for locale, strings in data.items():
+        path = f"translations.{locale}"
+        strings = _expect(strings, dict, path)
+        for source, translated in strings.items():
+            _expect(translated, str, f"{path}[{source!r}]")
+
+        translations[locale] = dict(strings)
+
+    return translations
+
+
+class _OpenButton(CustomButton):
+    # same as the default open button but with translated labels
+    def __init__(self, optional_label: str, required_label: str) -> None:
+        super().__init__(style=discord.ButtonStyle.gray, label=optional_label, row=0)
+        self._optional_label: str = optional_label
+        self._required_label: str = required_label
+
+    def on_optional_modal(self, button: discord.ui.Button[ModalPaginator]) -> None:
+        button.label = self._optional_label
+        button.style = discord.ButtonStyle.gray
+
+    def on_required_modal(self, button: discord.ui.Button[ModalPaginator]) -> None:
+        button.label = self._required_label
+        button.style = discord.ButtonStyle.blurple
+
+
+def _static_message(payload: Dict[str, Any]) -> Callable[[ModalPaginator], Dict[str, Any]]:
+    def get_message(self: ModalPaginator) -> Dict[str, Any]:
+        return payload.copy()
+
+    return get_message
+
+
+class _Variant:
+    __slots__ = ("locale", "pages", "buttons", "paginator_cls")
+
+    def __init__(
+        self,
+        locale: Optional[str],
+        pages: Tuple[_Page, ...],
+        buttons: Optional[ButtonSet],
+        paginator_cls: Type[ModalPaginator],
+    ) -> None:
+        self.locale: Optional[str] = locale
+        self.pages: Tuple[_Page, ...] = pages
+        self.buttons: Optional[ButtonSet] = buttons
+        self.paginator_cls: Type[ModalPaginator] = paginator_cls
+
+    @classmethod
+    def compile(cls, locale: str, pages: Tuple[_Page, ...], strings: Mapping[str, str]) -> _Variant:
+        def translate(text: str) -> str:
+            return strings.get(text, text)
+
+        translated_pages: List[_Page] = []
+        for page in pages:
+            inputs: List[Dict[str, Any]] = []
+            for kwargs in page.inputs:
+                kwargs = kwargs.copy()
+                kwargs["label"] = translate(kwargs["label"])
+                if "placeholder" in kwargs:
+                    kwargs["placeholder"] = translate(kwargs["placeholder"])
+                inputs.append(kwargs)
+
+            translated_pages.append(_Page(translate(page.title), page.required, tuple(inputs)))
+
+        buttons: Dict[str, Optional[discord.ui.Button[Any]]] = {
+            name: CustomButton(**{**button._original_kwargs, "label": translate(button.label)})  # type: ignore
+            for name, button in DEFAULT_BUTTONS.items()
+            if name != "OPEN" and button.label in strings
+        }
+        if "Open" in strings or "*Open" in strings:
+            buttons["OPEN"] = _OpenButton(translate("Open"), translate("*Open"))
+
+        namespace: Dict[str, Any] = {}
+        for name, content in _DEFAULT_ERROR_MESSAGES.items():
+            if content in strings:
+                namespace[name] = _static_message({**_default_error_message(name), "content": strings[content]})
+
+        paginator_cls = ModalPaginator
+        if namespace:
+            namespace["__module__"] = ModalPaginator.__module__
+            paginator_cls = type(ModalPaginator.__name__, (ModalPaginator,), namespace)
+
+        return cls(locale, tuple(translated_pages), ButtonSet(buttons) if buttons else None, paginator_cls)
+
+
+class FormDefinition:
+    """A compiled, immutable form that paginators can be created from.
+
+    Forms are usually loaded by a :class:`FormRegistry` but can also be compiled from a dictionary
+    using :meth:`FormDefinition.from_dict`. The dictionary is validated and compiled once, creating
+    a paginator only constructs the modals and text inputs.
+
+    The format is the following, only ``label`` is required per text input:
+
+    .. code-block:: json
+
+        {
+            "id": "verification",
+            "pages": [
+                {
+                    "title": "About you",
+                    "required": true,
+                    "inputs": [
+                        {
+                            "label": "What is your name?",
+                            "custom_id": "name",
+                            "style": "short",
+                            "placeholder": "John",
+                            "default": null,
+                            "required": true,
+                            "min_length": 2,
+                            "max_length": 32
+                        }
+                    ]
+                }
+            ],
+            "translations": {
+                "de": {
+                    "About you": "Über dich",
+                    "What is your name?": "Wie heißt du?",
+                    "Next": "Weiter"
+                }
+            }
+        }
+
+    ``style`` is one of ``"short"``, ``"long"`` or ``"paragraph"``. Pages are not required by default.
+
+    ``translations`` is optional and maps a locale (see :class:`discord.Locale`) to translations of
+    page titles, labels, placeholders, the labels of the default buttons (``"Open"``, ``"*Open"``, ``"Next"``,
+    ``"Previous"``, ``"Finish"``, ``"Cancel"`` and ``"Review"``) and the content of the default button error messages
+    (e.g. :meth:`.ModalPaginator.get_next_button_error_message`), keyed by the original text.
+    Every locale is compiled once, the first time a paginator is created for it, so creating
+    a paginator for a locale doesn't look up any translations. A locale without translations falls back
+    to its language (``"es"`` for ``"es-ES"``) and then to the original text.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    id: :class:`str`
+        The ID of the form. Used as the ``form_id`` of the paginators created from it.
+    version: :class:`int`
+        The version of the form, incremented by the :class:`FormRegistry` every time the form changed.
+    """
+
+    __slots__ = ("id", "version", "_pages", "_digest", "_translations", "_variants")
+
+    def __init__(
+        self,
+        id: str,
+        pages: Tuple[_Page, ...],
+        *,
+        version: int = 1,
+        translations: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> None:
+        self.id: str = id
+        self.version: int = version
+        self._pages: Tuple[_Page, ...] = pages
+        # the canonical JSON the form was compiled from, to skip recompiling unchanged forms
+        self._digest: Optional[str] = None
+        self._translations: Dict[str, Dict[str, str]] = translations or {}
+        # requested locale -> compiled variant, including locales that fell back
+        self._variants: Dict[Optional[str], _Variant] = {None: _Variant(None, pages, None, ModalPaginator)}
+
+    def __repr__(self) -> str:
+        return f"<FormDefinition id={self.id!r} version={self.version} pages={len(self._pages)}>"
+
+    @property
+    def locales(self) -> List[str]:
+        """List[:class:`str`]: The locales the form has translations for."""
+        return list(self._translations)
+
+    def _get_variant(self, locale: Optional[Union[str, discord.Locale]]) -> _Variant:
+        key = None if locale is None else str(locale)
+        try:
+            return self._variants[key]
+        except KeyError:
+            pass
+
+        assert key is not None
+        resolved = key if key in self._translations else key.split("-")[0]
+        if resolved in self._variants:
+            variant = self._variants[resolved]
+        elif resolved in self._translations:
+            variant = _Variant.compile(resolved, self._pages, self._translations[resolved])
+            self._variants[resolved] = variant
+        else:
+            variant = self._variants[None]
+
+        self._variants[key] = variant
+        return variant
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], *, version: int = 1) -> FormDefinition:
+        """Compiles a form from a dictionary. See the format above.
+
+        Parameters
+        -----------
+        data: Mapping[:class:`str`, Any]
+            The form.
+        version: :class:`int`
+            The version of the form. Defaults to ``1``.
+
+        Raises
+        -------
+        InvalidForm
+            The form is invalid.
+
+        Returns
+        --------
+        :class:`FormDefinition`
+            The compiled form.
+        """
+        data = _expect(data, dict, "")
+        form_id = _expect(data.get("id"), str, "id")
+        pages_data: List[Any] = _expect(data.get("pages"), list, "pages")
+        if not pages_data:
+            raise InvalidForm("pages", "must have at least one page")
+
+        pages: List[_Page] = []
+        for index, page in enumerate(pages_data):
+            path = f"pages[{index}]"
+            page = _expect(page, dict, path)
+            title = _expect(page.get("title"), str, f"{path}.title")
+            if len(title) > 45:
+                raise InvalidForm(f"{path}.title", "must be 45 characters or fewer")
+
+            inputs_data: List[Any] = _expect(page.get("inputs"), list, f"{path}.inputs")
+            if not 1 <= len(inputs_data) <= 5:
+                raise InvalidForm(f"{path}.inputs", "must have 1 to 5 text inputs")
+
+            inputs = tuple(_compile_input(inp, f"{path}.inputs[{i}]") for i, inp in enumerate(inputs_data))
+            pages.append(_Page(title, _expect(page.get("required", False), bool, f"{path}.required"), inputs))
+
+        translations = _compile_translations(data.get("translations", {}))
+        limited = {page.title for page in pages} | {kwargs["label"] for page in pages for kwargs in page.inputs}
+        for locale, strings in translations.items():
+            for source in limited.intersection(strings):
+                if len(strings[source]) > 45:
+                    raise InvalidForm(f"translations.{locale}[{source!r}]", "must be 45 characters or fewer")
+
+        return cls(form_id, tuple(pages), version=version, translations=translations)
+
+    def create_modals(self, *, locale: Optional[Union[str, discord.Locale]] = None) -> List[PaginatorModal]:
+        """Creates new modals for a single session.
+
+        Parameters
+        -----------
+        locale: Optional[Union[:class:`str`, :class:`discord.Locale`]]
+            The locale to translate the modals to. Defaults to ``None`` (not translated).
+
+        Returns
+        --------
+        List[:class:`.PaginatorModal`]
+            The modals, one per page.
+        """
+        return [
+            PaginatorModal(
+                *(discord.ui.TextInput(**kwargs) for kwargs in page.inputs),
+                title=page.title,
+                required=page.required,
+            )
+            for page in self._get_variant(locale).pages
+        ]
+
+    def create_paginator(self, *, locale: Optional[Union[str, discord.Locale]] = None, **kwargs: Any) -> ModalPaginator:
+        """Creates a new paginator with this form's modals.
+
+        Parameters
+        -----------
+        locale: Optional[Union[:class:`str`, :class:`discord.Locale`]]
+            The locale to translate the paginator to, usually :attr:`discord.Interaction.locale`.
+            Defaults to ``None`` (not translated).
+        **kwargs: Any
+            The keyword arguments to pass to :class:`.ModalPaginator`.
+            ``form_id`` defaults to :attr:`id`. ``buttons`` defaults to the translated buttons,
+            passing it replaces them.
+
+        Returns
+        --------
+        :class:`.ModalPaginator`
+            The paginator.
+        """
+        variant = self._get_variant(locale)
+        kwargs.setdefault("form_id", self.id)
+        if variant.buttons is not None:
+            kwargs.setdefault("buttons", variant.buttons)
+
+        return variant.paginator_cls(self.create_modals(locale=locale), **kwargs)
+
+
+class _Source:
+    __slots__ = ("stamp", "forms")
+
+    def __init__(self, stamp: Tuple[int, int], forms: Dict[str, FormDefinition]) -> None:
+        self.stamp: Tuple[int, int] = stamp
+        self.forms: Dict[str, FormDefinition] = forms
+
+
+class FormRegistry:
+    r"""Loads :class:`FormDefinition`\s from a JSON file or a directory of JSON files and reloads them
+    when they change.
+
+    A file can contain a single form or a list of forms. Only files that changed (by modification time and size)
+    are read and compiled again. The compiled forms are swapped at once after a reload, so a form is always
+    complete. Paginators that were already created keep the version of the form they were created from.
+
+    If a file can't be read or a form in it is invalid, the forms of that file keep their previous version.
+    See :attr:`FormRegistry.errors`.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The JSON file or the directory with JSON files (``*.json``) to load.
+    interval: :class:`float`
+        How often to check for changes when watching, in seconds. Defaults to ``5.0``.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        forms = FormRegistry("forms/")
+
+        async def setup_hook() -> None:
+            await forms.start()
+
+        @bot.tree.command()
+        async def verify(interaction: discord.Interaction) -> None:
+            form = forms.get("verification")
+            await form.create_paginator(locale=interaction.locale).send(interaction)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]], *, interval: float = 5.0) -> None:
+        self.path: str = os.fspath(path)
+        self.interval: float = interval
+        self._forms: Dict[str, FormDefinition] = {}
+        self._sources: Dict[str, _Source] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def __contains__(self, form_id: object) -> bool:
+        return form_id in self._forms
+
+    @property
+    def forms(self) -> Dict[str, FormDefinition]:
+        """Dict[:class:`str`, :class:`FormDefinition`]: A mapping of form ID to the current version of the form."""
+        return self._forms.copy()
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        """Dict[:class:`str`, :class:`Exception`]: A mapping of file path to the error of the last reload, if any."""
+        return self._errors.copy()
+
+    def get(self, form_id: str) -> FormDefinition:
+        """Returns the current version of a form.
+
+        Parameters
+        -----------
+        form_id: :class:`str`
+            The ID of the form.
+
+        Raises
+        -------
+        KeyError
+            There is no form with that ID.
+
+        Returns
+        --------
+        :class:`FormDefinition`
+            The form.
+        """
+        return self._forms[form_id]
+
+    def _list_files(self) -> Dict[str, Tuple[int, int]]:
+        if os.path.isdir(self.path):
+            paths = [
+                os.path.join(self.path, name) for name in sorted(os.listdir(self.path)) if name.endswith(".json")
+            ]
+        else:
+            paths = [self.path]
+
+        stamps: Dict[str, Tuple[int, int]] = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+
+        return stamps
+
+    def _compile_file(self, path: str, previous: Optional[_Source]) -> Dict[str, FormDefinition]:
+        with open(path, encoding="utf-8") as fp:
+            data = json.load(fp)
+
+        forms: Dict[str, FormDefinition] = {}
+        for index, form_data in enumerate(data if isinstance(data, list) else [data]):
+            form_id = form_data.get("id") if isinstance(form_data, dict) else None
+            old = previous.forms.get(form_id) if previous is not None and isinstance(form_id, str) else None
+            digest = json.dumps(form_data, sort_keys=True)
+            if old is not None and old._digest == digest:  # pyright: ignore [reportPrivateUsage]
+                form = old
+            else:
+                try:
+                    form = FormDefinition.from_dict(form_data, version=old.version + 1 if old is not None else 1)
+                except InvalidForm as e:
+                    raise InvalidForm(f"[{index}].{e.path}" if isinstance(data, list) else e.path, e.reason) from e
+
+                form._digest = digest  # pyright: ignore [reportPrivateUsage]
+
+            if form.id in forms:
+                raise InvalidForm(f"[{index}].id", f"duplicate form ID {form.id!r}")
+            forms[form.id] = form
+
+        return forms
+
+    def _scan(self) -> Tuple[Dict[str, _Source], Dict[str, Exception]]:
+        sources: Dict[str, _Source] = {}
+        errors: Dict[str, Exception] = {}
+        for path, stamp in self._list_files().items():
+            previous = self._sources.get(path)
+            if previous is not None and previous.stamp == stamp:
+                sources[path] = previous
+                continue
+
+            try:
+                forms = self._compile_file(path, previous)
+            except Exception as e:
+                errors[path] = e
+                if previous is not None:
+                    # keep the last good version of the file's forms
+                    sources[path] = previous
+                continue
+
+            sources[path] = _Source(stamp, forms)
+
+        return sources, errors
+
+    async def reload(self) -> List[str]:
+        """Reloads the files that changed since the last reload.
+
+        The files are read and compiled in the event loop's default executor.
+
+        Returns
+        --------
+        List[:class:`str`]
+            The IDs of the forms that were added or changed.
+        """
+        sources, errors = await asyncio.get_running_loop().run_in_executor(None, self._scan)
+
+        forms: Dict[str, FormDefinition] = {}
+        for path, source in sources.items():
+            for form_id, form in source.forms.items():
+                if form_id in forms:
+                    errors[path] = InvalidForm("id", f"form ID {form_id!r} is already defined in another file")
+                    continue
+                forms[form_id] = form
+
+        changed = [form_id for form_id, form in forms.items() if self._forms.get(form_id) is not form]
+        for path, error in errors.items():
+            _log.error("Failed to load forms from %s: %s", path, error)
+
+        # swapped at once so a lookup never sees a half reloaded registry
+        self._sources = sources
+        self._forms = forms
+        self._errors = errors
+        return changed
+
+    async def start(self) -> None:
+        """Loads the forms and starts watching for changes."""
+        await self.reload()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch())
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reload()
+            except Exception:
+                _log.exception("Failed to reload forms from %s", self.path)
+
+    def close(self) -> None:
+        """Stops watching for changes."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,172 @@
+from __future__ import annotations
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional
+import weakref
+
+from .enums import SessionState
+
+if TYPE_CHECKING:
+    from .core import ModalPaginator
+
+__all__ = (
+    "SessionRegistry",
+    "registry",
+)
+
+
+def _estimate_size(paginator: ModalPaginator) -> int:
+    size = sys.getsizeof(paginator) + sys.getsizeof(paginator.__dict__)
+    for modal in paginator.modals:
+        size += sys.getsizeof(modal) + sys.getsizeof(modal.__dict__)
+        for text_input in modal.text_inputs:
+            size += sys.getsizeof(text_input) + sys.getsizeof(text_input.value)
+
+    return size
+
+
+class SessionRegistry:
+    r"""Tracks all :class:`.ModalPaginator`\s of the process using weak references.
+
+    Every paginator is added to :data:`registry` when it's created. The registry never keeps
+    a paginator alive, so any paginator that is in it is still referenced somewhere.
+    A stopped paginator that stays in the registry for long is likely leaked, e.g. kept alive by
+    a modal that was opened but never submitted or by a reference in user code.
+
+    .. versionadded:: 1.3
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        from discord.ext.modal_paginator.registry import registry
+
+        @tasks.loop(minutes=5)
+        async def check_sessions():
+            counts = registry.counts()
+            if counts[SessionState.finished] > 1000:
+                log.warning("%d finished paginators are still alive", counts[SessionState.finished])
+                registry.sweep()
+    """
+
+    __slots__ = ("_sessions",)
+
+    def __init__(self) -> None:
+        self._sessions: weakref.WeakSet[ModalPaginator] = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{state.name}={count}" for state, count in self.counts().items())
+        return f"<SessionRegistry {counts}>"
+
+    def add(self, paginator: ModalPaginator) -> None:
+        """Adds a paginator to the registry. This is done when a paginator is created.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to add.
+        """
+        self._sessions.add(paginator)
+
+    def sessions(self, state: Optional[SessionState] = None) -> List[ModalPaginator]:
+        """Returns the paginators that are alive.
+
+        Parameters
+        -----------
+        state: Optional[:class:`.SessionState`]
+            Only return paginators in this state. Defaults to ``None`` (all states).
+
+        Returns
+        --------
+        List[:class:`.ModalPaginator`]
+            The paginators, oldest first.
+        """
+        sessions = [p for p in list(self._sessions) if state is None or p.state is state]
+        sessions.sort(key=lambda p: p._created_at)  # pyright: ignore [reportPrivateUsage]
+        return sessions
+
+    def counts(self) -> Dict[SessionState, int]:
+        """Returns the amount of paginators that are alive per state.
+
+        Returns
+        --------
+        Dict[:class:`.SessionState`, :class:`int`]
+            A mapping of every state to the amount of paginators in it.
+        """
+        counts = dict.fromkeys(SessionState, 0)
+        for paginator in list(self._sessions):
+            counts[paginator.state] += 1
+
+        return counts
+
+    def ages(self, state: Optional[SessionState] = None) -> List[float]:
+        """Returns how long the paginators that are alive have existed for.
+
+        Parameters
+        -----------
+        state: Optional[:class:`.SessionState`]
+            Only include paginators in this state. Defaults to ``None`` (all states).
+
+        Returns
+        --------
+        List[:class:`float`]
+            The ages in seconds, oldest first.
+        """
+        return [paginator.age for paginator in self.sessions(state)]
+
+    def memory_estimate(self, state: Optional[SessionState] = None) -> int:
+        """Returns a rough estimate of the memory used by the paginators that are alive.
+
+        This only counts the paginators, their modals and text inputs and the answers, not
+        e.g. the messages or interactions they reference.
+
+        Parameters
+        -----------
+        state: Optional[:class:`.SessionState`]
+            Only include paginators in this state. Defaults to ``None`` (all states).
+
+        Returns
+        --------
+        :class:`int`
+            The estimate in bytes.
+        """
+        return sum(_estimate_size(paginator) for paginator in self.sessions(state))
+
+    def sweep(self, *, older_than: Optional[float] = None) -> int:
+        """Releases what stopped paginators still reference so they can be garbage collected
+        once user code doesn't reference them anymore.
+
+        This stops all their modals, removing modals that were opened but never submitted from the
+        library's modal store, and removes the references to the message and interaction.
+
+        Parameters
+        -----------
+        older_than: Optional[:class:`float`]
+            If given, active paginators that are older than this many seconds are also
+            stopped (as timed out) and released. Defaults to ``None``.
+
+        Returns
+        --------
+        :class:`int`
+            The amount of paginators that were released, not counting ones released by a previous sweep.
+        """
+        released = 0
+        for paginator in list(self._sessions):
+            if paginator.state is SessionState.active:
+                if older_than is None or paginator.age < older_than:
+                    continue
+
+                paginator._state = SessionState.timed_out  # pyright: ignore [reportPrivateUsage]
+                paginator.stop()
+
+            if paginator._release():  # pyright: ignore [reportPrivateUsage]
+                released += 1
+
+        return released
+
+
+registry: SessionRegistry = SessionRegistry()
+"""The :class:`SessionRegistry` all paginators are added to."""
@@ -0,0 +1,230 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple, Union
+
+import discord
+
+from .enums import SessionState
+
+if TYPE_CHECKING:
+    from .core import ModalPaginator
+
+__all__ = (
+    "Renderer",
+    "ContentRenderer",
+    "EmbedRenderer",
+)
+
+# current page, state, (title, required, finished) per modal
+_RenderKey = Tuple[int, SessionState, Tuple[Tuple[str, bool, bool], ...]]
+
+_STATE_FOOTERS: Dict[SessionState, str] = {
+    SessionState.finished: "Finished",
+    SessionState.cancelled: "Cancelled",
+    SessionState.timed_out: "Timed out",
+}
+
+
+class Renderer(ABC):
+    """The base class for renderers, which render the message of a :class:`.ModalPaginator`.
+
+    Pass an instance to the ``renderer`` kwarg of :class:`.ModalPaginator`. The rendered keyword arguments
+    are used in :meth:`.ModalPaginator.send`, :meth:`.ModalPaginator.update` and
+    :meth:`.ModalPaginator.disable_all_buttons`, unless the same keyword argument was passed to these methods.
+
+    Subclass this and override :meth:`Renderer.render` to create your own renderer.
+
+    .. versionadded:: 1.3
+    """
+
+    @abstractmethod
+    def render(self, paginator: ModalPaginator) -> Dict[str, Any]:
+        """Renders the current page of the paginator.
+
+        This is called every time the page changes, so this should be cheap.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to render.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            A new dictionary with the same keys as :meth:`discord.InteractionResponse.edit_message`,
+            e.g. ``content`` and ``embed``.
+        """
+
+    def render_stopped(self, paginator: ModalPaginator) -> Dict[str, Any]:
+        """Renders the paginator after it was finished, cancelled or timed out.
+
+        This is called in :meth:`.ModalPaginator.disable_all_buttons`.
+        The default implementation returns an empty dictionary, leaving the message as is.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to render.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            A new dictionary with the same keys as :meth:`discord.InteractionResponse.edit_message`.
+        """
+        return {}
+
+
+class ContentRenderer(Renderer):
+    """The default renderer. Renders :attr:`.ModalPaginator.page_string` as the content of the message.
+
+    .. versionadded:: 1.3
+    """
+
+    def render(self, paginator: ModalPaginator) -> Dict[str, Any]:
+        return {"content": paginator.page_string}
+
+
+class EmbedRenderer(Renderer):
+    r"""Renders the paginator as an embed with a progress bar, an optional description per page and
+    the pages with a checkmark for every finished one.
+
+    Rendered embeds are cached per page and state of the paginator (the current page, whether it was stopped
+    and the title, required and finished state of every modal). The same instance can, and should, be shared
+    by all paginators of the same form so they reuse each other's embeds.
+    The cached :class:`discord.Embed`\s are shared, don't modify them.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    descriptions: Optional[Sequence[Optional[:class:`str`]]]
+        The description of every page, by page index. Defaults to ``None`` (no descriptions).
+    colour: Optional[Union[:class:`discord.Colour`, :class:`int`]]
+        The colour of the embed. Defaults to ``None``.
+    bar_length: :class:`int`
+        The amount of segments of the progress bar. Defaults to ``10``.
+    max_size: :class:`int`
+        The maximum amount of embeds to cache. The least recently used embed is removed
+        when this is exceeded. Defaults to ``256``.
+
+    Attributes
+    -----------
+    hits: :class:`int`
+        The amount of renders that were served from the cache.
+    misses: :class:`int`
+        The amount of renders that built a new embed.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        RENDERER = EmbedRenderer(descriptions=["Tell us about yourself.", "Why do you want to join?"])
+
+        paginator = ModalPaginator(modals, renderer=RENDERER)
+    """
+
+    def __init__(
+        self,
+        *,
+        descriptions: Optional[Sequence[Optional[str]]] = None,
+        colour: Optional[Union[discord.Colour, int]] = None,
+        bar_length: int = 10,
+        max_size: int = 256,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        self.descriptions: Sequence[Optional[str]] = descriptions or ()
+        self.colour: Optional[Union[discord.Colour, int]] = colour
+        self.bar_length: int = bar_length
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: OrderedDict[_RenderKey, discord.Embed] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        return f"<EmbedRenderer cached={len(self._cache)} hits={self.hits} misses={self.misses}>"
+
+    def clear(self) -> None:
+        """Removes all cached embeds, e.g. after changing :attr:`descriptions`."""
+        self._cache.clear()
+
+    def _get_key(self, paginator: ModalPaginator) -> _RenderKey:
+        return (
+            paginator.current_page,
+            paginator.state,
+            tuple((modal.title, modal.required, modal.is_finished()) for modal in paginator.modals),
+        )
+
+    def _get_embed(self, paginator: ModalPaginator) -> discord.Embed:
+        key = self._get_key(paginator)
+        try:
+            embed = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return embed
+
+        self.misses += 1
+        embed = self.build_embed(paginator)
+        self._cache[key] = embed
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+        return embed
+
+    def build_embed(self, paginator: ModalPaginator) -> discord.Embed:
+        """Builds the embed for the current page and state of the paginator.
+
+        This is only called if the embed isn't cached. Override this to change the embed,
+        it must only depend on what the cache is keyed by (see above) and this renderer.
+
+        Parameters
+        -----------
+        paginator: :class:`.ModalPaginator`
+            The paginator to build the embed for.
+
+        Returns
+        --------
+        :class:`discord.Embed`
+            The embed.
+        """
+        modals = paginator.modals
+        page = paginator.current_page
+        current = modals[page] if 0 <= page < len(modals) else None
+        description = self.descriptions[page] if 0 <= page < len(self.descriptions) else None
+        embed = discord.Embed(title=current.title if current else None, description=description, colour=self.colour)
+
+        finished = sum(modal.is_finished() for modal in modals)
+        filled = round(self.bar_length * finished / len(modals)) if modals else 0
+        bar = "▰" * filled + "▱" * (self.bar_length - filled)
+        embed.add_field(name="Progress", value=f"{bar} {finished}/{len(modals)}", inline=False)
+
+        lines = []
+        for index, modal in enumerate(modals):
+            mark = "✅" if modal.is_finished() else "⬜"
+            title = f"**{modal.title}**" if index == page else modal.title
+            required = " \\*" if modal.required else ""
+            lines.append(f"{mark} {title}{required}")
+
+        pages = "\n".join(lines)
+        if len(pages) > 1024:
+            pages = pages[:1023] + "…"
+        embed.add_field(name="Pages", value=pages, inline=False)
+
+        footer = _STATE_FOOTERS.get(paginator.state)
+        embed.set_footer(text=footer or f"Page {page + 1}/{len(modals)}")
+        return embed
+
+    def render(self, paginator: ModalPaginator) -> Dict[str, Any]:
+        return {"content": None, "embed": self._get_embed(paginator)}
+
+    def render_stopped(self, paginator: ModalPaginator) -> Dict[str, Any]:
+        return self.render(paginator)
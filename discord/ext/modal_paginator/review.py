@@ -0,0 +1,207 @@
+from __future__ import annotations
+import io
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
+
+import discord
+
+if TYPE_CHECKING:
+    from .core import ModalPaginator
+
+__all__ = ("AnswerReview",)
+
+# https://discord.com/developers/docs/resources/message#embed-object-embed-limits
+_MAX_EMBED_SIZE = 6000
+_MAX_FIELDS = 25
+_MAX_FIELD_NAME = 256
+_MAX_FIELD_VALUE = 1024
+# room for the footer, which is set when the page is shown
+_FOOTER_SIZE = 32
+
+
+def _chunk(value: str, size: int) -> Iterator[str]:
+    while len(value) > size:
+        # prefer to split on a line break so paragraphs stay readable
+        index = value.rfind("\n", size // 2, size)
+        if index == -1:
+            index = size
+        yield value[:index]
+        value = value[index:].lstrip("\n")
+
+    yield value
+
+
+class AnswerReview:
+    r"""Renders the answers of a :class:`.ModalPaginator` into embeds for the user to review before finishing.
+
+    Pages are only built when they are requested, one after another, so reviewing the first page
+    of a long form doesn't build the rest. Answers that don't fit in a single embed field are split
+    over multiple fields and embeds so every embed stays within Discord's limits.
+    All answers can also be downloaded as a text file with :meth:`AnswerReview.to_file`.
+
+    The answers are read when the review is created, so every page and the file show the same answers
+    even if a modal is submitted again while the review is open.
+
+    This is used by :meth:`.ModalPaginator.review`.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    paginator: :class:`.ModalPaginator`
+        The paginator to review the answers of.
+    title: :class:`str`
+        The title of the embeds. Defaults to ``"Review your answers"``.
+    colour: Optional[Union[:class:`discord.Colour`, :class:`int`]]
+        The colour of the embeds. Defaults to ``None``.
+    empty: :class:`str`
+        What to show for questions that weren't answered. Defaults to ``"*No answer*"``.
+    """
+
+    def __init__(
+        self,
+        paginator: ModalPaginator,
+        *,
+        title: str = "Review your answers",
+        colour: Optional[Union[discord.Colour, int]] = None,
+        empty: str = "*No answer*",
+    ) -> None:
+        self.paginator: ModalPaginator = paginator
+        self.title: str = title
+        self.colour: Optional[Union[discord.Colour, int]] = colour
+        self.empty: str = empty
+        # (modal title, [(label, value), ...]) per modal
+        self._answers: List[Tuple[str, List[Tuple[str, Optional[str]]]]] = [
+            (modal.title, [(text_input.label, text_input.value) for text_input in modal.text_inputs])
+            for modal in paginator.modals
+        ]
+        self._pages: List[discord.Embed] = []
+        self._builder: Optional[Iterator[discord.Embed]] = self._build_pages()
+
+    def __repr__(self) -> str:
+        return f"<AnswerReview built={len(self._pages)} exhausted={self.exhausted}>"
+
+    @property
+    def exhausted(self) -> bool:
+        """:class:`bool`: Whether all pages were built, :attr:`page_count` is only known then."""
+        return self._builder is None
+
+    @property
+    def page_count(self) -> Optional[int]:
+        """Optional[:class:`int`]: The amount of pages or ``None`` if not all pages were built yet."""
+        return len(self._pages) if self._builder is None else None
+
+    def _iter_fields(self) -> Iterator[Tuple[str, str]]:
+        for title, answers in self._answers:
+            for label, value in answers:
+                name = f"{title}: {label}"[:_MAX_FIELD_NAME]
+                for index, chunk in enumerate(_chunk(value or self.empty, _MAX_FIELD_VALUE)):
+                    yield (name if index == 0 else f"{name} (cont.)"[:_MAX_FIELD_NAME], chunk)
+
+    def _build_pages(self) -> Iterator[discord.Embed]:
+        embed = discord.Embed(title=self.title, colour=self.colour)
+        size = len(self.title) + _FOOTER_SIZE
+        for name, value in self._iter_fields():
+            field_size = len(name) + len(value)
+            if embed.fields and (len(embed.fields) >= _MAX_FIELDS or size + field_size > _MAX_EMBED_SIZE):
+                yield embed
+                embed = discord.Embed(title=self.title, colour=self.colour)
+                size = len(self.title) + _FOOTER_SIZE
+
+            embed.add_field(name=name, value=value, inline=False)
+            size += field_size
+
+        if embed.fields or not self._pages:
+            yield embed
+
+    def get_page(self, index: int) -> Optional[discord.Embed]:
+        """Returns a page, building the pages up to it if they weren't built yet.
+
+        Parameters
+        -----------
+        index: :class:`int`
+            The index of the page.
+
+        Returns
+        --------
+        Optional[:class:`discord.Embed`]
+            The page or ``None`` if there is no page with that index.
+        """
+        while self._builder is not None and len(self._pages) <= index:
+            try:
+                self._pages.append(next(self._builder))
+            except StopIteration:
+                self._builder = None
+
+        if 0 <= index < len(self._pages):
+            return self._pages[index]
+
+        return None
+
+    def to_file(self, filename: str = "answers.txt") -> discord.File:
+        """Writes all answers to a text file in memory.
+
+        Use this if the answers are too long to review in embeds, e.g. to send them as an attachment.
+
+        Parameters
+        -----------
+        filename: :class:`str`
+            The name of the file. Defaults to ``"answers.txt"``.
+
+        Returns
+        --------
+        :class:`discord.File`
+            The file.
+        """
+        buffer = io.BytesIO()
+        for title, answers in self._answers:
+            buffer.write(f"# {title}\n\n".encode())
+            for label, value in answers:
+                buffer.write(f"{label}\n{value}\n\n".encode())
+
+        buffer.seek(0)
+        return discord.File(buffer, filename=filename)
+
+    async def send(self, interaction: discord.Interaction[Any]) -> None:
+        """Sends the first page as an ephemeral response to the interaction with buttons to
+        go through the pages and to download the answers as a file.
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction to respond to.
+        """
+        view = _ReviewView(self)
+        await interaction.response.send_message(**view._get_kwargs(), view=view, ephemeral=True)
+
+
+class _ReviewView(discord.ui.View):
+    def __init__(self, review: AnswerReview) -> None:
+        super().__init__(timeout=180)
+        self.review: AnswerReview = review
+        self.index: int = 0
+
+    def _get_kwargs(self) -> dict[str, Any]:
+        embed = self.review.get_page(self.index)
+        assert embed is not None
+        # look one page ahead to know whether there is a next page
+        has_next = self.review.get_page(self.index + 1) is not None
+        self.previous_page.disabled = self.index <= 0
+        self.next_page.disabled = not has_next
+
+        total = self.review.page_count
+        embed.set_footer(text=f"Page {self.index + 1}/{total}" if total is not None else f"Page {self.index + 1}")
+        return {"embed": embed}
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.gray)
+    async def previous_page(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Any]) -> None:
+        self.index = max(self.index - 1, 0)
+        await interaction.response.edit_message(**self._get_kwargs(), view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.gray)
+    async def next_page(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Any]) -> None:
+        self.index += 1
+        await interaction.response.edit_message(**self._get_kwargs(), view=self)
+
+    @discord.ui.button(label="Download", style=discord.ButtonStyle.blurple)
+    async def download(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Any]) -> None:
+        await interaction.response.send_message(file=self.review.to_file(), ephemeral=True)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional, Union
+
+import discord
+
+from .core import ModalPaginator
+from .custom_button import CustomButton
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+else:
+    Self = Any
+
+SessionFactory = Callable[
+    [discord.Interaction[Any]], Union[Coroutine[Any, Any, ModalPaginator], ModalPaginator]
+]
+
+__all__ = ("SharedModalPaginator",)
+
+
+class SharedModalPaginator(discord.ui.View):
+    """A view that can be sent once in a public channel and hands out a
+    :class:`.ModalPaginator` per user that interacts with it.
+
+    Each user gets their own paginator, created by ``factory``, which is sent as
+    an ephemeral response to the interaction. The paginators are stored in an internal map
+    keyed by the user's ID so that pressing the button again resumes the user's paginator
+    instead of creating a new one. A resumed paginator is sent again as it is, it's not
+    validated or admitted again, see :meth:`.ModalPaginator.send`.
+
+    Sessions are evicted when the user's paginator is stopped (finished, cancelled or timed out),
+    when :meth:`remove_session` is called or when ``max_sessions`` is reached, in which case
+    the least recently used session is stopped, its buttons are disabled and it's removed.
+    A paginator that couldn't be sent, e.g. because it was rejected by its
+    :class:`~discord.ext.modal_paginator.admission.AdmissionController`, is not kept as a session.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    factory: Callable[[:class:`discord.Interaction`], Union[:class:`.ModalPaginator`, Coroutine[Any, Any, :class:`.ModalPaginator`]]]
+        A callable that creates a new paginator for the user of the given interaction.
+        The paginator's :attr:`~.ModalPaginator.author_id` is set to the user's ID if it's not set.
+    timeout: Optional[:class:`float`]
+        The timeout of the view. Defaults to ``None``.
+    max_sessions: Optional[:class:`int`]
+        The maximum amount of sessions to keep at once, at least ``1``. Defaults to ``None`` (no limit).
+    button: Optional[:class:`discord.ui.Button`]
+        A button to customize the default "Start" button with.
+        It's recommended to use :class:`.CustomButton`. See the ``buttons`` kwarg in :class:`.ModalPaginator`.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        def create_paginator(interaction: discord.Interaction) -> ModalPaginator:
+            return ModalPaginator.from_text_inputs("What is your name?", "Why do you want to join?")
+
+        await channel.send("Press the button to sign up!", view=SharedModalPaginator(create_paginator))
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        factory: SessionFactory,
+        *,
+        timeout: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+        button: Optional[discord.ui.Button[Any]] = None,
+    ) -> None:
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1.")
+
+        super().__init__(timeout=timeout)
+        self._factory: SessionFactory = factory
+        self.max_sessions: Optional[int] = max_sessions
+        self._sessions: OrderedDict[int, ModalPaginator] = OrderedDict()
+
+        if button is not None:
+            CustomButton._copy_attrs(self.start_button, button)  # pyright: ignore [reportPrivateUsage]
+
+    @property
+    def sessions(self) -> Dict[int, ModalPaginator]:
+        """Dict[:class:`int`, :class:`.ModalPaginator`]: A mapping of user ID to their active paginator."""
+        self._evict_stopped()
+        return dict(self._sessions)
+
+    def get_session(self, user_id: int, /) -> Optional[ModalPaginator]:
+        """Returns the active paginator of the given user, if any.
+
+        Parameters
+        -----------
+        user_id: :class:`int`
+            The ID of the user.
+
+        Returns
+        --------
+        Optional[:class:`.ModalPaginator`]
+            The paginator or ``None`` if the user has no active session.
+        """
+        paginator = self._sessions.get(user_id)
+        if paginator is not None and paginator.is_finished():
+            del self._sessions[user_id]
+            return None
+
+        return paginator
+
+    def remove_session(self, user_id: int, /) -> Optional[ModalPaginator]:
+        """Stops and removes the paginator of the given user. Nothing happens if the user has no session.
+
+        Parameters
+        -----------
+        user_id: :class:`int`
+            The ID of the user.
+
+        Returns
+        --------
+        Optional[:class:`.ModalPaginator`]
+            The removed paginator, if any.
+        """
+        paginator = self._sessions.pop(user_id, None)
+        if paginator is not None:
+            paginator.stop()
+
+        return paginator
+
+    def _evict_stopped(self) -> None:
+        for user_id in [uid for uid, paginator in self._sessions.items() if paginator.is_finished()]:
+            del self._sessions[user_id]
+
+    async def _evict_overflow(self) -> None:
+        if self.max_sessions is None:
+            return
+
+        evicted: List[ModalPaginator] = []
+        while len(self._sessions) >= self.max_sessions:
+            _, paginator = self._sessions.popitem(last=False)
+            paginator.stop()
+            evicted.append(paginator)
+
+        for paginator in evicted:
+            # so the evicted paginator's buttons don't look like they still work
+            await paginator._edit_stopped_message()  # pyright: ignore [reportPrivateUsage]
+
+    async def _create_session(self, interaction: discord.Interaction[Any]) -> ModalPaginator:
+        self._evict_stopped()
+        await self._evict_overflow()
+
+        paginator = await discord.utils.maybe_coroutine(self._factory, interaction)
+        if paginator.author_id is None:
+            paginator.author_id = interaction.user.id
+
+        self._sessions[interaction.user.id] = paginator
+        return paginator
+
+    def stop(self) -> None:
+        """Stops the view and all active sessions."""
+        super().stop()
+        for paginator in self._sessions.values():
+            paginator.stop()
+
+        self._sessions.clear()
+
+    @discord.ui.button(label="Start", style=discord.ButtonStyle.green, custom_id="START")
+    async def start_button(self, interaction: discord.Interaction[Any], button: discord.ui.Button[Self]) -> None:
+        paginator = self.get_session(interaction.user.id)
+        if paginator is not None:
+            self._sessions.move_to_end(interaction.user.id)
+            await paginator._resume(interaction, ephemeral=True)  # pyright: ignore [reportPrivateUsage]
+            return
+
+        paginator = await self._create_session(interaction)
+        try:
+            await paginator.send(interaction, ephemeral=True)
+        except Exception:
+            # e.g. rejected by the admission controller, the next press creates a new paginator
+            # instead of resuming one that was never sent
+            if self._sessions.get(interaction.user.id) is paginator:
+                del self._sessions[interaction.user.id]
+            paginator.stop()
+            raise
@@ -0,0 +1,62 @@
+from __future__ import annotations
+import time
+
+__all__ = ("ClickThrottle",)
+
+
+class ClickThrottle:
+    """Configures how fast the "Next" and "Previous" buttons of a :class:`.ModalPaginator` may be pressed.
+
+    Every paginator gets its own token bucket of ``burst`` tokens that refills at ``rate`` tokens per second.
+    A press that finds the bucket empty is acknowledged with a defer instead of editing the message
+    and the page is still changed. Once no presses were made for ``quiet`` seconds, the message
+    is edited once to show the page the user ended up on.
+
+    Pass an instance to the ``throttle`` kwarg of :class:`.ModalPaginator`.
+    The same instance can be shared by all paginators, the buckets are per paginator.
+    See :attr:`.ModalPaginator.throttled_interactions` for metrics.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    rate: :class:`float`
+        How many presses per second are rendered right away in the long run. Defaults to ``2.0``.
+    burst: :class:`int`
+        How many presses in a row are rendered right away. Defaults to ``3``.
+    quiet: :class:`float`
+        How long to wait after the last throttled press before rendering, in seconds. Defaults to ``0.5``.
+    """
+
+    __slots__ = ("rate", "burst", "quiet")
+
+    def __init__(self, rate: float = 2.0, burst: int = 3, *, quiet: float = 0.5) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be greater than 0 and burst at least 1.")
+
+        self.rate: float = rate
+        self.burst: int = burst
+        self.quiet: float = quiet
+
+    def __repr__(self) -> str:
+        return f"<ClickThrottle rate={self.rate} burst={self.burst} quiet={self.quiet}>"
+
+
+class _TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate: float = rate
+        self.capacity: int = capacity
+        self.tokens: float = capacity
+        self.updated_at: float = time.monotonic()
+
+    def consume(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
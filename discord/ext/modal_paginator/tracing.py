@@ -0,0 +1,384 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import asyncio
+from contextvars import ContextVar, Token
+import json
+import logging
+import os
+import random
+import threading
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Type, Union
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = (
+    "Span",
+    "SpanExporter",
+    "JSONLinesExporter",
+    "Tracer",
+)
+
+_log = logging.getLogger(__name__)
+
+AttributeValue = Union[str, int, float, bool]
+
+# the span that is currently running in this task, to parent the spans started in it
+_current_span: ContextVar[Optional[Span]] = ContextVar("modal_paginator_span", default=None)
+
+# https://opentelemetry.io/docs/specs/otlp/#json-protobuf-encoding
+_SPAN_KIND_INTERNAL = 1
+_STATUS_CODE_UNSET = 0
+_STATUS_CODE_ERROR = 2
+
+
+def _detach_span() -> None:
+    # for tasks that outlive the span they were created in,
+    # the spans started in the task are parented to the root span instead of the ended span
+    _current_span.set(None)
+
+
+def _encode_value(value: AttributeValue) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64 bit integers are strings in the JSON encoding
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """A single timed operation of a trace, created by a :class:`Tracer`.
+
+    .. versionadded:: 1.3
+
+    Attributes
+    -----------
+    name: :class:`str`
+        The name of the operation.
+    trace_id: :class:`str`
+        The ID of the trace, 32 hexadecimal characters.
+    span_id: :class:`str`
+        The ID of the span, 16 hexadecimal characters.
+    parent_id: Optional[:class:`str`]
+        The ID of the parent span or ``None`` if this is the root span of the trace.
+    start_time: :class:`int`
+        When the span started, in nanoseconds since the epoch.
+    end_time: Optional[:class:`int`]
+        When the span ended, in nanoseconds since the epoch. ``None`` if it didn't end yet.
+    attributes: Dict[:class:`str`, Union[:class:`str`, :class:`int`, :class:`float`, :class:`bool`]]
+        The attributes of the span.
+    error: Optional[:class:`str`]
+        The error the operation failed with, if any.
+    """
+
+    __slots__ = (
+        "_tracer",
+        "_token",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_time",
+        "end_time",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, AttributeValue],
+    ) -> None:
+        self._tracer: Tracer = tracer
+        # restores the current span when the span is exited
+        self._token: Optional[Token[Optional[Span]]] = None
+        self.name: str = name
+        self.trace_id: str = trace_id
+        self.span_id: str = f"{random.getrandbits(64):016x}"
+        self.parent_id: Optional[str] = parent_id
+        self.start_time: int = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.attributes: Dict[str, AttributeValue] = attributes
+        self.error: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<Span name={self.name!r} trace_id={self.trace_id} span_id={self.span_id}>"
+
+    def __enter__(self) -> Self:
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        if exc_value is not None and not isinstance(exc_value, asyncio.CancelledError):
+            self.error = f"{exc_type.__name__ if exc_type else 'Exception'}: {exc_value}"
+        self.end()
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Optional[:class:`float`]: How long the span took in seconds or ``None`` if it didn't end yet."""
+        if self.end_time is None:
+            return None
+
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Sets an attribute of the span.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the attribute.
+        value: Union[:class:`str`, :class:`int`, :class:`float`, :class:`bool`]
+            The value of the attribute.
+        """
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        """Ends the span and hands it to the tracer to be exported. Does nothing if it already ended."""
+        if self.end_time is not None:
+            return
+
+        self.end_time = time.time_ns()
+        self._tracer._on_end(self)  # pyright: ignore [reportPrivateUsage]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the span in the OTLP JSON format.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            The span.
+        """
+        data: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time if self.end_time is not None else self.start_time),
+            "attributes": [{"key": key, "value": _encode_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": _STATUS_CODE_UNSET},
+        }
+        if self.parent_id is not None:
+            data["parentSpanId"] = self.parent_id
+        if self.error is not None:
+            data["status"] = {"code": _STATUS_CODE_ERROR, "message": self.error}
+
+        return data
+
+
+class SpanExporter(ABC):
+    """The base class for exporters, which a :class:`Tracer` hands the ended spans to.
+
+    Subclass this and override :meth:`SpanExporter.export` to create your own exporter,
+    e.g. one that sends the spans to an OpenTelemetry collector.
+
+    .. versionadded:: 1.3
+    """
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Exports a batch of ended spans.
+
+        This is called in the event loop's default executor so it can do blocking I/O.
+        Batches can be exported concurrently.
+
+        Parameters
+        -----------
+        spans: Sequence[:class:`Span`]
+            The spans to export.
+        """
+
+
+class JSONLinesExporter(SpanExporter):
+    """Appends the spans to a file, one batch per line in the OTLP JSON format.
+
+    Every line is an ``ExportTraceServiceRequest`` that e.g. the OpenTelemetry collector's
+    ``otlpjsonfile`` receiver can read.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The file to append to. It's created if it doesn't exist.
+    service_name: :class:`str`
+        The ``service.name`` resource attribute of the spans. Defaults to ``"discord-bot"``.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]], *, service_name: str = "discord-bot") -> None:
+        self.path: str = os.fspath(path)
+        self.service_name: str = service_name
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<JSONLinesExporter path={self.path!r}>"
+
+    def export(self, spans: Sequence[Span]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "discord.ext.modal_paginator"},
+                            "spans": [span.to_dict() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(request, separators=(",", ":")) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as fp:
+            fp.write(line)
+
+
+class Tracer:
+    r"""Traces :class:`.ModalPaginator`\s, every session (from sending the paginator until it's stopped) is a trace.
+
+    Pass an instance to the ``tracer`` kwarg of :class:`.ModalPaginator`. The same instance should
+    be shared by all paginators. Paginators without a tracer don't create any spans.
+
+    The spans of a session are:
+
+    - ``ModalPaginator.session``, the root span.
+    - ``button <custom ID>`` and ``modal submit``, for every button press and modal submission.
+    - ``check``, for the ``check`` passed to the paginator.
+    - ``callback <name>``, for :meth:`.ModalPaginator.on_finish`, :meth:`.ModalPaginator.on_cancel`,
+      :meth:`.ModalPaginator.on_page_submit`, the ``finish_callback`` and the modal's ``callback``.
+    - ``http <method>``, for the requests to Discord, e.g. ``http interaction.response.edit_message``.
+
+    Ended spans are exported in batches in the event loop's default executor, once a session ended
+    or ``max_batch`` spans ended.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    exporter: :class:`SpanExporter`
+        The exporter to export the spans with.
+    max_batch: :class:`int`
+        The maximum amount of spans to export at once. Defaults to ``256``.
+
+    Example
+    --------
+    .. code-block:: python
+        :linenos:
+
+        TRACER = Tracer(JSONLinesExporter("traces.jsonl"))
+
+        paginator = ModalPaginator(modals, tracer=TRACER)
+    """
+
+    def __init__(self, exporter: SpanExporter, *, max_batch: int = 256) -> None:
+        self.exporter: SpanExporter = exporter
+        self.max_batch: int = max_batch
+        self._pending: List[Span] = []
+        self._tasks: Set[asyncio.Future[None]] = set()
+
+    def __repr__(self) -> str:
+        return f"<Tracer exporter={self.exporter!r} pending={len(self._pending)}>"
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """Returns the span that is currently entered (``with span:``) in this task, if any.
+
+        Returns
+        --------
+        Optional[:class:`Span`]
+            The span.
+        """
+        return _current_span.get()
+
+    def start_trace(self, name: str, **attributes: AttributeValue) -> Span:
+        """Starts the root span of a new trace.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the span.
+        **attributes: Union[:class:`str`, :class:`int`, :class:`float`, :class:`bool`]
+            The attributes of the span.
+
+        Returns
+        --------
+        :class:`Span`
+            The span. Call :meth:`Span.end` to end it.
+        """
+        return Span(self, name, f"{random.getrandbits(128):032x}", None, attributes)
+
+    def start_span(self, name: str, trace: Span, **attributes: AttributeValue) -> Span:
+        """Starts a span in a trace.
+
+        The parent is the span that is currently entered (``with span:``) in this task if it's in the same trace,
+        else the root span.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the span.
+        trace: :class:`Span`
+            The root span of the trace.
+        **attributes: Union[:class:`str`, :class:`int`, :class:`float`, :class:`bool`]
+            The attributes of the span.
+
+        Returns
+        --------
+        :class:`Span`
+            The span. Use it as a context manager or call :meth:`Span.end` to end it.
+        """
+        current = _current_span.get()
+        parent = current if current is not None and current.trace_id == trace.trace_id else trace
+        return Span(self, name, trace.trace_id, parent.span_id, attributes)
+
+    def _on_end(self, span: Span) -> None:
+        self._pending.append(span)
+        if span.parent_id is None or len(self._pending) >= self.max_batch:
+            self._export()
+
+    def _export(self) -> None:
+        spans, self._pending = self._pending, []
+        if not spans:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._export_batch(spans)
+            return
+
+        future = loop.run_in_executor(None, self._export_batch, spans)
+        self._tasks.add(future)
+        future.add_done_callback(self._tasks.discard)
+
+    def _export_batch(self, spans: List[Span]) -> None:
+        try:
+            self.exporter.export(spans)
+        except Exception:
+            _log.exception("Failed to export %d spans with %r", len(spans), self.exporter)
+
+    async def flush(self) -> None:
+        """Exports the spans that ended but weren't exported yet and waits for all exports to finish.
+
+        Call this before shutting down to not lose any spans.
+        """
+        self._export()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
@@ -1,3 +1,5 @@
+from typing import Any
+
 import discord
 
 
@@ -6,3 +8,15 @@ IS_DPY2_5 = discord.version_info >= (2, 5, 0)
 # https://canary.discord.com/channels/336642139381301249/1341405833640022098
 # https://github.com/Rapptz/discord.py/issues/10107
 IS_DPY_2_5_WITH_INTERACTIONEDITFIXED = discord.version_info >= (2, 5, 1)
+
+
+def question_key(text_input: discord.ui.TextInput[Any]) -> str:
+    """Returns a key that identifies the question of a text input across paginators.
+
+    This is the custom ID if it was explicitly passed, else the label as
+    generated custom IDs are random and differ per instance.
+    """
+    if getattr(text_input, "_provided_custom_id", False):
+        return text_input.custom_id
+
+    return text_input.label
@@ -0,0 +1,236 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import math
+import re
+from typing import Any, Callable, Coroutine, FrozenSet, Iterable, Optional, Pattern, Union
+
+import discord
+
+
+AsyncValidatorFunc = Callable[[discord.Interaction[Any], str], Coroutine[Any, Any, bool]]
+
+__all__ = (
+    "Validator",
+    "Regex",
+    "NumberRange",
+    "Choice",
+    "AsyncValidator",
+)
+
+
+class Validator(ABC):
+    """The base class for synchronous validators that can be attached to text inputs in a :class:`.PaginatorModal`.
+
+    Validators are run when the modal is submitted, see :meth:`.PaginatorModal.add_validator`.
+    Everything that is needed to validate (e.g. a regex) should be compiled in the constructor
+    so that the same instance can be reused for every submission.
+
+    Subclass this and override :meth:`validate` to create your own validator.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    message: Optional[:class:`str`]
+        The error message to show when the value is invalid. Defaults to :attr:`default_message`.
+    """
+
+    __slots__ = ("message",)
+
+    default_message: str = "Invalid value."
+    """:class:`str`: The error message to show if no ``message`` was passed."""
+
+    def __init__(self, *, message: Optional[str] = None) -> None:
+        self.message: str = message or self.default_message
+
+    def __call__(self, value: str) -> Optional[str]:
+        return None if self.validate(value) else self.message
+
+    @abstractmethod
+    def validate(self, value: str) -> bool:
+        """Validates the value of a text input.
+
+        Parameters
+        -----------
+        value: :class:`str`
+            The value of the text input. Never empty, empty optional values aren't validated.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the value is valid.
+        """
+
+
+class Regex(Validator):
+    """A validator that checks if the whole value matches a regular expression.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    pattern: Union[:class:`str`, :class:`re.Pattern`]
+        The regular expression. Compiled once.
+    flags: :class:`int`
+        The flags to compile the regular expression with. Defaults to ``0``.
+    message: Optional[:class:`str`]
+        The error message to show when the value is invalid.
+    """
+
+    __slots__ = ("pattern",)
+
+    default_message = "The value does not have the right format."
+
+    def __init__(self, pattern: Union[str, Pattern[str]], *, flags: int = 0, message: Optional[str] = None) -> None:
+        super().__init__(message=message)
+        self.pattern: Pattern[str] = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+
+    def validate(self, value: str) -> bool:
+        return self.pattern.fullmatch(value) is not None
+
+
+class NumberRange(Validator):
+    """A validator that checks if the value is a number within a range (inclusive).
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    min: Optional[:class:`float`]
+        The minimum value. Defaults to ``None`` (no minimum).
+    max: Optional[:class:`float`]
+        The maximum value. Defaults to ``None`` (no maximum).
+    integer: :class:`bool`
+        Whether the value must be a whole number. Defaults to ``False``.
+    message: Optional[:class:`str`]
+        The error message to show when the value is invalid.
+    """
+
+    __slots__ = ("min", "max", "integer")
+
+    def __init__(
+        self,
+        min: Optional[float] = None,
+        max: Optional[float] = None,
+        *,
+        integer: bool = False,
+        message: Optional[str] = None,
+    ) -> None:
+        if message is None:
+            kind = "a whole number" if integer else "a number"
+            if min is not None and max is not None:
+                message = f"The value must be {kind} between {min:g} and {max:g}."
+            elif min is not None:
+                message = f"The value must be {kind} of at least {min:g}."
+            elif max is not None:
+                message = f"The value must be {kind} of at most {max:g}."
+            else:
+                message = f"The value must be {kind}."
+
+        super().__init__(message=message)
+        self.min: Optional[float] = min
+        self.max: Optional[float] = max
+        self.integer: bool = integer
+
+    def validate(self, value: str) -> bool:
+        try:
+            number = int(value) if self.integer else float(value)
+        except ValueError:
+            return False
+
+        # float() accepts "nan" and "inf", which compare false against every bound
+        if not math.isfinite(number):
+            return False
+        if self.min is not None and number < self.min:
+            return False
+        if self.max is not None and number > self.max:
+            return False
+
+        return True
+
+
+class Choice(Validator):
+    """A validator that checks if the value is one of the given choices.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    choices: Iterable[:class:`str`]
+        The valid choices.
+    case_sensitive: :class:`bool`
+        Whether the comparison is case sensitive. Defaults to ``False``.
+    message: Optional[:class:`str`]
+        The error message to show when the value is invalid. Defaults to a message listing the choices.
+    """
+
+    __slots__ = ("choices", "case_sensitive")
+
+    def __init__(self, choices: Iterable[str], *, case_sensitive: bool = False, message: Optional[str] = None) -> None:
+        choices = tuple(choices)
+        super().__init__(message=message or f"The value must be one of: {', '.join(choices)}.")
+        self.case_sensitive: bool = case_sensitive
+        self.choices: FrozenSet[str] = frozenset(
+            choices if case_sensitive else (choice.strip().casefold() for choice in choices)
+        )
+
+    def validate(self, value: str) -> bool:
+        return (value if self.case_sensitive else value.strip().casefold()) in self.choices
+
+
+class AsyncValidator:
+    """A validator for checks that need I/O, e.g. looking something up in a database or on a website.
+
+    Unlike :class:`Validator`, these are not run when a modal is submitted but when the "Finish"
+    button is pressed. All async validators of the paginator are then run concurrently,
+    see :meth:`.ModalPaginator.validate_answers`.
+
+    Either pass a coroutine function or subclass this and override :meth:`validate`.
+
+    .. versionadded:: 1.3
+
+    Parameters
+    -----------
+    func: Optional[Callable[[:class:`discord.Interaction`, :class:`str`], Coroutine[Any, Any, :class:`bool`]]]
+        The coroutine function to validate the value with. Must return whether the value is valid.
+    message: Optional[:class:`str`]
+        The error message to show when the value is invalid. Defaults to :attr:`default_message`.
+    """
+
+    __slots__ = ("message", "_func")
+
+    default_message: str = "Invalid value."
+    """:class:`str`: The error message to show if no ``message`` was passed."""
+    timeout_message: str = "This value could not be checked in time, please try again."
+    """:class:`str`: The error message to show if validation didn't finish in time."""
+    error_message: str = "This value could not be checked, please try again."
+    """:class:`str`: The error message to show if validation raised an exception."""
+
+    def __init__(self, func: Optional[AsyncValidatorFunc] = None, *, message: Optional[str] = None) -> None:
+        self.message: str = message or self.default_message
+        self._func: Optional[AsyncValidatorFunc] = func
+
+    async def __call__(self, interaction: discord.Interaction[Any], value: str) -> Optional[str]:
+        return None if await self.validate(interaction, value) else self.message
+
+    async def validate(self, interaction: discord.Interaction[Any], value: str) -> bool:
+        """Validates the value of a text input.
+
+        The default implementation calls the ``func`` passed to the constructor.
+
+        Parameters
+        -----------
+        interaction: :class:`discord.Interaction`
+            The interaction of the "Finish" button.
+        value: :class:`str`
+            The value of the text input. Never empty, empty optional values aren't validated.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the value is valid.
+        """
+        if self._func is None:
+            raise NotImplementedError
+
+        return await self._func(interaction, value)
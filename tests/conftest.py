@@ -0,0 +1,200 @@
+from __future__ import annotations
+import asyncio
+import inspect
+import itertools
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import discord
+import pytest
+
+from discord.ext.modal_paginator import ModalPaginator
+
+_ids = itertools.count(1000)
+
+Call = Tuple[str, Dict[str, Any]]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> Optional[bool]:
+    # runs the async tests in a new event loop, no plugin needed
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+
+    kwargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    asyncio.run(pyfuncitem.obj(**kwargs))
+    return True
+
+
+class FakeUser:
+    def __init__(self, user_id: int) -> None:
+        self.id: int = user_id
+        self.name: str = f"user{user_id}"
+        self.display_name: str = self.name
+        self.mention: str = f"<@{user_id}>"
+
+
+class FakeMessage:
+    def __init__(self, calls: List[Call]) -> None:
+        self.id: int = next(_ids)
+        self.calls: List[Call] = calls
+
+    async def edit(self, **kwargs: Any) -> FakeMessage:
+        self.calls.append(("message.edit", kwargs))
+        return self
+
+
+class FakeResponse:
+    def __init__(self, interaction: FakeInteraction) -> None:
+        self._interaction: FakeInteraction = interaction
+        self._done: bool = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def _respond(self, name: str, kwargs: Dict[str, Any]) -> None:
+        assert not self._done, f"{name} on an interaction that was already responded to"
+        self._done = True
+        self._interaction.calls.append((name, kwargs))
+
+    async def edit_message(self, **kwargs: Any) -> None:
+        self._respond("edit_message", kwargs)
+
+    async def send_message(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self._respond("send_message", {"content": content, **kwargs})
+
+    async def defer(self, **kwargs: Any) -> None:
+        self._respond("defer", kwargs)
+
+    async def send_modal(self, modal: discord.ui.Modal) -> None:
+        self._respond("send_modal", {"modal": modal})
+        # like the library, a finished modal isn't stored so its submissions are discarded
+        if not modal.is_finished():
+            self._interaction.client_.store_modal(modal)
+
+
+class FakeFollowup:
+    def __init__(self, interaction: FakeInteraction) -> None:
+        self._interaction: FakeInteraction = interaction
+
+    async def send(self, *args: Any, **kwargs: Any) -> FakeMessage:
+        self._interaction.calls.append(("followup.send", kwargs))
+        return FakeMessage(self._interaction.calls)
+
+
+class FakeInteraction(discord.Interaction):  # type: ignore
+    def __init__(
+        self,
+        client: FakeClient,
+        user_id: int,
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        locale: discord.Locale = discord.Locale.american_english,
+        guild: Any = None,
+    ) -> None:
+        self.client_: FakeClient = client
+        self.calls: List[Call] = []
+        self.id = next(_ids)
+        self.user = FakeUser(user_id)  # type: ignore
+        self.data = data  # type: ignore
+        self.extras = {}
+        self.locale = locale
+        self.guild_id = getattr(guild, "id", None)
+        self.message = None
+        self._fake_guild = guild
+        self._fake_response = FakeResponse(self)
+        self._fake_followup = FakeFollowup(self)
+
+    @property
+    def response(self) -> Any:
+        return self._fake_response
+
+    @property
+    def followup(self) -> Any:
+        return self._fake_followup
+
+    @property
+    def guild(self) -> Any:
+        return self._fake_guild
+
+    async def original_response(self) -> Any:
+        self.calls.append(("original_response", {}))
+        return FakeMessage(self.calls)
+
+    async def edit_original_response(self, **kwargs: Any) -> Any:
+        self.calls.append(("edit_original_response", kwargs))
+        return FakeMessage(self.calls)
+
+    @property
+    def call_names(self) -> List[str]:
+        return [name for name, _ in self.calls]
+
+
+class FakeClient:
+    """Dispatches button presses and modal submissions the way the library does."""
+
+    def __init__(self) -> None:
+        # the library's modal store, by custom ID
+        self.modals: Dict[str, discord.ui.Modal] = {}
+
+    def store_modal(self, modal: discord.ui.Modal) -> None:
+        modal._start_listening_from_store(self)  # type: ignore
+        self.modals[modal.custom_id] = modal
+
+    def remove_view(self, view: discord.ui.Modal) -> None:
+        self.modals.pop(view.custom_id, None)
+
+    def interaction(self, user_id: int = 1, **kwargs: Any) -> FakeInteraction:
+        return FakeInteraction(self, user_id, **kwargs)
+
+    async def press(
+        self, paginator: ModalPaginator, custom_id: str, user_id: int = 1, **kwargs: Any
+    ) -> FakeInteraction:
+        interaction = self.interaction(user_id, data={"custom_id": custom_id, "component_type": 2}, **kwargs)
+        item = next(i for i in paginator.children if getattr(i, "custom_id", None) == custom_id)
+        errors: List[Exception] = []
+
+        async def on_error(interaction: Any, error: Exception, item: Any) -> None:
+            errors.append(error)
+
+        paginator.on_error = on_error  # type: ignore
+        task = paginator._dispatch_item(item, interaction)  # type: ignore
+        if task is not None:
+            await task
+        if errors:
+            raise errors[0]
+
+        return interaction
+
+    async def submit(
+        self, custom_id: str, values: Sequence[Optional[str]], user_id: int = 1, **kwargs: Any
+    ) -> Optional[FakeInteraction]:
+        """Submits the stored modal with the given values, in order of its text inputs.
+
+        Returns ``None`` if the modal isn't stored, like the library discards the submission.
+        """
+        modal = self.modals.get(custom_id)
+        if modal is None:
+            return None
+
+        interaction = self.interaction(user_id, **kwargs)
+        text_inputs = [item for item in modal.children if isinstance(item, discord.ui.TextInput)]
+        components = [
+            {"type": 1, "components": [{"type": 4, "custom_id": text_input.custom_id, "value": value}]}
+            for text_input, value in zip(text_inputs, values)
+        ]
+        errors: List[Exception] = []
+
+        async def on_error(interaction: Any, error: Exception) -> None:
+            errors.append(error)
+
+        modal.on_error = on_error  # type: ignore
+        await modal._scheduled_task(interaction, components, {})  # type: ignore
+        if errors:
+            raise errors[0]
+
+        return interaction
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    return FakeClient()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import asyncio
+from typing import Any
+
+import pytest
+
+from discord.ext.modal_paginator import AdmissionController, AdmissionPolicy, ModalPaginator, SessionState
+from discord.ext.modal_paginator.errors import AdmissionRejected
+
+
+def make_paginator(admission: AdmissionController) -> ModalPaginator:
+    return ModalPaginator.from_text_inputs("Name", "Age", admission=admission)
+
+
+async def test_reject(client: Any) -> None:
+    admission = AdmissionController(per_user=1)
+    await make_paginator(admission).send(client.interaction())
+
+    interaction = client.interaction()
+    with pytest.raises(AdmissionRejected) as exc_info:
+        await make_paginator(admission).send(interaction)
+
+    assert exc_info.value.scope == "user"
+    assert not interaction.response.is_done()
+    assert len(admission) == 1
+
+
+async def test_queue_defers_interaction_before_waiting(client: Any) -> None:
+    admission = AdmissionController(per_user=1, policy=AdmissionPolicy.queue)
+    first = make_paginator(admission)
+    await first.send(client.interaction())
+
+    interaction = client.interaction()
+    second = make_paginator(admission)
+    task = asyncio.create_task(second.send(interaction, ephemeral=True))
+    await asyncio.sleep(0)
+
+    assert interaction.call_names == ["defer"]
+    assert interaction.calls[0][1] == {"ephemeral": True, "thinking": True}
+    assert admission.waiting == 1
+    assert not task.done()
+
+    first.stop()
+    await asyncio.wait_for(task, timeout=1)
+    assert interaction.call_names == ["defer", "followup.send"]
+    assert second.message is not None
+    assert admission.waiting == 0
+    assert len(admission) == 1
+
+
+async def test_queue_timeout_after_defer(client: Any) -> None:
+    admission = AdmissionController(per_user=1, policy=AdmissionPolicy.queue, queue_timeout=0.01)
+    await make_paginator(admission).send(client.interaction())
+
+    interaction = client.interaction()
+    with pytest.raises(AdmissionRejected):
+        await make_paginator(admission).send(interaction)
+
+    assert interaction.call_names == ["defer"]
+    assert admission.waiting == 0
+
+
+async def test_queue_admits_without_defer_if_free(client: Any) -> None:
+    admission = AdmissionController(per_user=1, policy=AdmissionPolicy.queue)
+    interaction = client.interaction()
+    await make_paginator(admission).send(interaction)
+
+    assert interaction.call_names == ["send_message"]
+
+
+async def test_replace_oldest_disables_replaced_paginator(client: Any) -> None:
+    admission = AdmissionController(per_user=1, policy=AdmissionPolicy.replace_oldest)
+    first_interaction = client.interaction()
+    first = make_paginator(admission)
+    await first.send(first_interaction)
+
+    second = make_paginator(admission)
+    await second.send(client.interaction())
+
+    assert first.is_finished()
+    assert first.state is SessionState.cancelled
+    assert first_interaction.call_names == ["send_message", "edit_original_response"]
+    view = first_interaction.calls[1][1]["view"]
+    assert view is first
+    assert all(item.disabled for item in first.children)  # type: ignore
+    assert admission._sessions.keys() == {second}
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int) -> None:
+        self.id: int = guild_id
+
+
+async def test_replace_oldest_keeps_paginator_that_would_not_free_the_limit(client: Any) -> None:
+    admission = AdmissionController(per_guild=1, policy=AdmissionPolicy.replace_oldest)
+    first = make_paginator(admission)
+    await first.send(client.interaction(user_id=1, guild=FakeGuild(100)))
+    await make_paginator(admission).send(client.interaction(user_id=2, guild=FakeGuild(200)))
+
+    interaction = client.interaction(user_id=1, guild=FakeGuild(200))
+    with pytest.raises(AdmissionRejected) as exc_info:
+        await make_paginator(admission).send(interaction)
+
+    assert exc_info.value.scope == "guild"
+    assert not first.is_finished()
+    assert not interaction.response.is_done()
+    assert len(admission) == 2
@@ -0,0 +1,40 @@
+from __future__ import annotations
+from typing import Any
+
+from discord.ext.modal_paginator import AdvancePolicy, ModalPaginator, PaginatorModal
+
+
+def make_paginator(**kwargs: Any) -> ModalPaginator:
+    modals = []
+    for custom_id in ("first", "second", "third"):
+        modal = PaginatorModal(title=custom_id.title(), custom_id=custom_id)
+        modal.add_input(label="Answer")
+        modals.append(modal)
+
+    return ModalPaginator(modals, advance_policy=AdvancePolicy.next_unfinished, **kwargs)
+
+
+async def test_wraps_around_to_unfinished_page(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "OPEN")
+    await client.submit("second", ["a"])
+    assert paginator.current_page == 2
+
+    await client.press(paginator, "OPEN")
+    await client.submit("third", ["b"])
+    assert paginator.current_page == 0
+
+
+async def test_does_not_wrap_around_if_going_back_is_disabled(client: Any) -> None:
+    paginator = make_paginator(can_go_back=False)
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "OPEN")
+    await client.submit("third", ["b"])
+
+    assert paginator.current_page == 2
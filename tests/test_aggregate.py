@@ -0,0 +1,49 @@
+from __future__ import annotations
+import statistics
+from typing import List, Optional
+
+import pytest
+
+from discord.ext.modal_paginator.aggregate import FormAggregator
+
+
+@pytest.mark.parametrize("answers", [["a", "bbb", "cc"], ["a", "bbb", "cc", "dddd"], ["", "", "xyz"], ["same"] * 4])
+def test_length_statistics(answers: List[str]) -> None:
+    aggregator = FormAggregator()
+    for answer in answers:
+        aggregator.add_answers({"q": answer})
+
+    summary = aggregator.summary("q")
+    lengths = [len(answer) for answer in answers]
+    assert summary.responses == len(answers)
+    assert summary.min_length == min(lengths)
+    assert summary.max_length == max(lengths)
+    assert summary.mean_length == statistics.mean(lengths)
+    assert summary.median_length == statistics.median(lengths)
+
+
+def test_empty_question() -> None:
+    aggregator = FormAggregator()
+    aggregator.add_answers({"q": None})
+
+    summary = aggregator.summary("q")
+    assert summary.responses == summary.empty == 1
+    assert summary.median_length == 0.0
+    assert summary.top_values() == []
+    assert summary.top_values(include_empty=True) == [("", 1)]
+
+
+def test_summary_is_a_snapshot() -> None:
+    aggregator = FormAggregator()
+    answers: List[Optional[str]] = ["red", "blue", "red"]
+    for answer in answers:
+        aggregator.add_answers({"color": answer})
+
+    summary = aggregator.summary("color")
+    aggregator.add_answers({"color": "blue"})
+    aggregator.add_answers({"color": "green" * 30})
+
+    assert summary.top_values() == [("red", 2), ("blue", 1)]
+    assert summary.length_distribution(bucket_size=4) == {0: 2, 4: 1}
+    assert aggregator.summary("color").top_values(1) == [("red", 2)]
+    assert aggregator.summary("color").length_distribution(bucket_size=4) == {0: 2, 4: 2, 148: 1}
@@ -0,0 +1,87 @@
+from __future__ import annotations
+import time
+from typing import Any, List, Optional
+
+import pytest
+
+from discord.ext.modal_paginator import AnswerCache, ModalPaginator, PaginatorModal
+
+
+def make_paginator(cache: AnswerCache, form_id: str = "verify") -> ModalPaginator:
+    first = PaginatorModal(title="First", custom_id="first", required=True)
+    first.add_input(label="Name", custom_id="name")
+    second = PaginatorModal(title="Second", custom_id="second", required=True)
+    second.add_input(label="Hobby", custom_id="hobby")
+    return ModalPaginator([first, second], answer_cache=cache, form_id=form_id, sort_modals=False)
+
+
+def defaults(paginator: ModalPaginator) -> List[Optional[str]]:
+    return [text_input.default for modal in paginator.modals for text_input in modal.text_inputs]
+
+
+async def test_cancelled_answers_are_prefilled(client: Any) -> None:
+    cache = AnswerCache(60)
+    paginator = make_paginator(cache)
+    await paginator.send(client.interaction())
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann"])
+    await client.press(paginator, "CANCEL")
+
+    again = make_paginator(cache)
+    await again.send(client.interaction())
+    assert defaults(again) == ["Ann", None]
+
+    other_user = make_paginator(cache)
+    await other_user.send(client.interaction(user_id=2))
+    assert defaults(other_user) == [None, None]
+
+    other_form = make_paginator(cache, form_id="apply")
+    await other_form.send(client.interaction())
+    assert defaults(other_form) == [None, None]
+
+
+async def test_earlier_answers_are_kept(client: Any) -> None:
+    cache = AnswerCache(60)
+    paginator = make_paginator(cache)
+    await paginator.send(client.interaction())
+    for custom_id, answer in (("first", "Ann"), ("second", "Chess")):
+        await client.press(paginator, "OPEN")
+        await client.submit(custom_id, [answer])
+    await client.press(paginator, "FINISH")
+    assert paginator.is_finished()
+
+    # only the first page is submitted again before cancelling
+    again = make_paginator(cache)
+    await again.send(client.interaction())
+    await client.press(again, "OPEN")
+    await client.submit("first", ["Bob"])
+    await client.press(again, "CANCEL")
+
+    assert cache.get(1, "verify") == {"name": "Bob", "hobby": "Chess"}
+
+
+def test_answers_expire() -> None:
+    cache = AnswerCache(0.01)
+    cache.set(1, "verify", {"name": "Ann"})
+    assert cache.get(1, "verify") == {"name": "Ann"}
+
+    time.sleep(0.02)
+    assert cache.get(1, "verify") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_answers_are_removed() -> None:
+    cache = AnswerCache(60, max_size=2)
+    cache.set(1, "verify", {"name": "Ann"})
+    cache.set(2, "verify", {"name": "Bob"})
+    cache.get(1, "verify")
+    cache.set(3, "verify", {"name": "Cid"})
+
+    assert cache.get(2, "verify") is None
+    assert cache.get(1, "verify") == {"name": "Ann"}
+    assert len(cache) == 2
+
+
+def test_form_id_is_required() -> None:
+    with pytest.raises(ValueError):
+        ModalPaginator.from_text_inputs("Name", answer_cache=AnswerCache(60))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Any
+
+import discord
+
+from discord.ext.modal_paginator import ModalPaginator, PaginatorModal, SessionState
+
+
+class ThankingPaginator(ModalPaginator):
+    async def on_finish(self, interaction: discord.Interaction[Any]) -> None:
+        self.set_final_message(content="Thanks!")
+
+
+def make_paginator(**kwargs: Any) -> ModalPaginator:
+    first = PaginatorModal(title="First", custom_id="first", required=True)
+    first.add_input(label="Name")
+    second = PaginatorModal(title="Second", custom_id="second", required=True)
+    second.add_input(label="Hobby")
+    return ThankingPaginator([first, second], auto_finish=True, **kwargs)
+
+
+async def test_final_message_is_sent_with_last_submit(client: Any) -> None:
+    paginator = make_paginator()
+    sent = client.interaction()
+    await paginator.send(sent)
+
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann"])
+    await client.press(paginator, "OPEN")
+    interaction = await client.submit("second", ["Chess"])
+
+    assert paginator.state is SessionState.finished
+    assert interaction.call_names == ["edit_message"]
+    kwargs = interaction.calls[0][1]
+    assert kwargs["content"] == "Thanks!"
+    assert all(item.disabled for item in kwargs["view"].children)
+    assert sent.call_names == ["send_message"]
+
+
+async def test_buttons_stay_enabled_without_disable_after(client: Any) -> None:
+    paginator = make_paginator(disable_after=False)
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann"])
+    await client.press(paginator, "OPEN")
+    interaction = await client.submit("second", ["Chess"])
+
+    assert interaction.call_names == ["edit_message"]
+    assert interaction.calls[0][1]["content"] == "Thanks!"
+    assert not all(item.disabled for item in paginator.children)  # type: ignore
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, List
+
+import discord
+import pytest
+
+from discord.ext.modal_paginator import ModalPaginator, broadcast
+
+
+class FakeMessage:
+    async def edit(self, **kwargs: Any) -> FakeMessage:
+        return self
+
+
+class FakeChannel(discord.abc.Messageable):
+    """A channel that is rate limited ``rate_limits`` times before sending, or always raises ``error``."""
+
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def __init__(self, channel_id: int, *, rate_limits: int = 0, error: Any = None) -> None:
+        self.id: int = channel_id
+        self.rate_limits: int = rate_limits
+        self.error: Any = error
+        self.sent: List[Any] = []
+
+    async def _get_channel(self) -> Any:
+        return self
+
+    async def send(self, **kwargs: Any) -> Any:  # type: ignore
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self.error is not None:
+                raise self.error
+            if self.rate_limits:
+                self.rate_limits -= 1
+                raise discord.RateLimited(0.001)
+
+            self.sent.append(kwargs)
+            return FakeMessage()
+        finally:
+            cls.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def reset_in_flight() -> None:
+    FakeChannel.in_flight = FakeChannel.max_in_flight = 0
+
+
+def factory(recipient: discord.abc.Messageable) -> ModalPaginator:
+    return ModalPaginator.from_text_inputs("Name")
+
+
+async def test_sends_with_bounded_concurrency() -> None:
+    channels = [FakeChannel(i) for i in range(10)]
+    report = await broadcast(factory, channels, concurrency=3, content="Please verify!")
+
+    assert [result.recipient for result in report.results] == channels
+    assert len(report.succeeded) == 10
+    assert FakeChannel.max_in_flight == 3
+    assert all(len(channel.sent) == 1 for channel in channels)
+    assert channels[0].sent[0]["content"].endswith("Please verify!")
+    assert report.throughput > 0
+
+
+async def test_rate_limited_recipient_is_retried() -> None:
+    channels = [FakeChannel(1, rate_limits=2), FakeChannel(2)]
+    report = await broadcast(factory, channels, concurrency=2)
+
+    assert report.rate_limited == 2
+    assert [result.attempts for result in report.results] == [3, 1]
+    assert all(result.success for result in report.results)
+    assert report.results[0].error is None
+
+
+async def test_retries_are_limited() -> None:
+    report = await broadcast(factory, [FakeChannel(1, rate_limits=5)], max_retries=1)
+
+    result = report.results[0]
+    assert not result.success
+    assert result.attempts == 2
+    assert isinstance(result.error, discord.RateLimited)
+    assert result.paginator.is_finished()
+
+
+async def test_failed_recipient_is_not_retried() -> None:
+    error = RuntimeError("cannot send messages to this user")
+    report = await broadcast(factory, [FakeChannel(1, error=error), FakeChannel(2)])
+
+    assert report.failed == [report.results[0]]
+    assert report.results[0].error is error
+    assert report.results[0].attempts == 1
+    assert report.results[0].paginator.is_finished()
+    assert report.rate_limited == 0
+
+
+async def test_collector_is_called_with_stopped_paginators() -> None:
+    collected: List[ModalPaginator] = []
+    report = await broadcast(factory, [FakeChannel(1), FakeChannel(2)], collector=collected.append)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await report.wait(timeout=0.01)
+    assert collected == []
+
+    for result in report.results:
+        result.paginator.stop()
+    await report.wait(timeout=1)
+
+    assert sorted(collected, key=id) == sorted((result.paginator for result in report.results), key=id)
+
+
+async def test_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        await broadcast(factory, [FakeChannel(1)], concurrency=0)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from typing import Any, List
+
+import discord
+import pytest
+
+from discord.ext.modal_paginator import ButtonSet, CustomButton, ModalPaginator, PaginatorModal
+from discord.ext.modal_paginator.errors import InvalidButtonKey
+
+
+class StarredOpenButton(CustomButton):
+    """Stars the label of the "Open" button on required pages and records how often the hooks are called."""
+
+    def __init__(self) -> None:
+        super().__init__(label="Open")
+        self.hook_calls: int = 0
+
+    def on_required_modal(self, button: discord.ui.Button[Any]) -> None:
+        self.hook_calls += 1
+        button.label = "*Open"
+        button.style = discord.ButtonStyle.red
+
+    def on_optional_modal(self, button: discord.ui.Button[Any]) -> None:
+        self.hook_calls += 1
+        button.label = "Open"
+
+
+class HelpButton(CustomButton):
+    def __init__(self) -> None:
+        super().__init__(label="Help", override_callback=True)
+        self.pressed_by: List[int] = []
+
+    async def callback(self, interaction: discord.Interaction[Any]) -> None:
+        self.pressed_by.append(interaction.user.id)
+        await interaction.response.send_message("Ask a moderator.", ephemeral=True)
+
+
+def make_paginator(buttons: ButtonSet) -> ModalPaginator:
+    required = PaginatorModal(title="Required", custom_id="required", required=True)
+    required.add_input(label="Name")
+    optional = PaginatorModal(title="Optional", custom_id="optional")
+    optional.add_input(label="Hobby")
+    return ModalPaginator([required, optional], buttons=buttons, sort_modals=False)
+
+
+def get_button(paginator: ModalPaginator, custom_id: str) -> discord.ui.Button[Any]:
+    return next(item for item in paginator.children if getattr(item, "custom_id", None) == custom_id)  # type: ignore
+
+
+def test_invalid_key_is_rejected() -> None:
+    with pytest.raises(InvalidButtonKey):
+        ButtonSet({"SUBMIT": CustomButton(label="Submit")})  # type: ignore
+
+
+def test_removed_buttons() -> None:
+    buttons = ButtonSet({"CANCEL": None, "FINISH": CustomButton(label="Done")})
+    paginator = make_paginator(buttons)
+
+    assert buttons.removed == {"CANCEL"}
+    assert "CANCEL" not in [getattr(item, "custom_id", None) for item in paginator.children]
+    assert get_button(paginator, "FINISH").label == "Done"
+
+
+async def test_states_are_resolved_once(client: Any) -> None:
+    open_button = StarredOpenButton()
+    buttons = ButtonSet({"OPEN": open_button})
+    paginators = [make_paginator(buttons) for _ in range(3)]
+    for paginator in paginators:
+        await paginator.send(client.interaction())
+
+    paginator = paginators[0]
+    button = get_button(paginator, "OPEN")
+    assert (button.label, button.style) == ("*Open", discord.ButtonStyle.red)
+
+    await client.press(paginator, "OPEN")
+    await client.submit("required", ["Ann"])
+    assert paginator.current_page == 1
+    assert (button.label, button.style) == ("Open", discord.ButtonStyle.secondary)
+
+    await client.press(paginator, "PREVIOUS")
+    # the required page is finished now
+    assert button.label == "Open"
+
+    # once for every state, not for every paginator or page change
+    assert open_button.hook_calls == 2
+    # the buttons of the paginators are not shared
+    assert get_button(paginators[1], "OPEN") is not button
+    assert get_button(paginators[1], "OPEN").label == "*Open"
+
+
+async def test_overridden_callback_is_called(client: Any) -> None:
+    help_button = HelpButton()
+    paginator = make_paginator(ButtonSet({"CANCEL": help_button}))
+    await paginator.send(client.interaction())
+
+    interaction = await client.press(paginator, "CANCEL", user_id=2)
+
+    assert help_button.pressed_by == [2]
+    assert interaction.calls == [("send_message", {"content": "Ask a moderator.", "ephemeral": True})]
+    assert not paginator.is_finished()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Sequence
+
+import pytest
+
+from discord.ext.modal_paginator import ModalPaginator
+from discord.ext.modal_paginator.tracing import Span, SpanExporter, Tracer
+
+
+class NullExporter(SpanExporter):
+    def export(self, spans: Sequence[Span]) -> None:
+        pass
+
+
+def custom_ids(paginator: ModalPaginator) -> List[Optional[str]]:
+    return [getattr(item, "custom_id", None) for item in paginator.children]
+
+
+@pytest.mark.parametrize("tracer", [None, Tracer(NullExporter())])
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, ["OPEN", "PREVIOUS", "NEXT", "FINISH", "CANCEL"]),
+        ({"auto_finish": True}, ["OPEN", "PREVIOUS", "NEXT", "CANCEL"]),
+        ({"can_go_back": False}, ["OPEN", "NEXT", "FINISH", "CANCEL"]),
+        ({"review": True}, ["OPEN", "PREVIOUS", "NEXT", "FINISH", "CANCEL", "REVIEW"]),
+        ({"auto_finish": True, "can_go_back": False}, ["OPEN", "NEXT", "CANCEL"]),
+    ],
+)
+def test_buttons_are_removed(tracer: Optional[Tracer], kwargs: Dict[str, Any], expected: List[str]) -> None:
+    paginator = ModalPaginator.from_text_inputs("Name", tracer=tracer, **kwargs)
+
+    assert sorted(custom_ids(paginator)) == sorted(expected)  # type: ignore
@@ -0,0 +1,82 @@
+from __future__ import annotations
+from typing import Any, List
+
+import discord
+
+from discord.ext.modal_paginator import CheckCache, ModalPaginator, PaginatorModal
+
+
+class CountingCheck:
+    """A check that only lets ``allowed`` users through and records who it was run for."""
+
+    def __init__(self, *allowed: int) -> None:
+        self.allowed: List[int] = list(allowed)
+        self.checked: List[int] = []
+
+    async def __call__(self, paginator: ModalPaginator, interaction: discord.Interaction[Any]) -> bool:
+        self.checked.append(interaction.user.id)
+        return interaction.user.id in self.allowed
+
+
+def make_paginator(check: CountingCheck, cache: CheckCache) -> ModalPaginator:
+    modals = []
+    for custom_id in ("first", "second"):
+        modal = PaginatorModal(title=custom_id.title(), custom_id=custom_id)
+        modal.add_input(label="Answer")
+        modals.append(modal)
+
+    return ModalPaginator(modals, check=check, check_cache=cache, sort_modals=False)
+
+
+async def test_check_runs_once_per_user(client: Any) -> None:
+    check = CountingCheck(1)
+    paginator = make_paginator(check, CheckCache(60))
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "PREVIOUS")
+    await client.press(paginator, "NEXT", user_id=2)
+    await client.press(paginator, "NEXT", user_id=2)
+
+    assert check.checked == [1, 2]
+    # user 2 didn't pass the check, so their presses were ignored
+    assert paginator.current_page == 0
+
+
+async def test_submit_does_not_run_check_again(client: Any) -> None:
+    check = CountingCheck(1)
+    cache = CheckCache(60)
+    paginator = make_paginator(check, cache)
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    # the cached result is removed, only the open and submit pair skips the check now
+    cache.invalidate()
+    assert await client.submit("first", ["Ann"]) is not None
+
+    assert check.checked == [1]
+    assert paginator.modals[0].is_finished()
+
+
+async def test_invalidate_check_runs_check_again(client: Any) -> None:
+    check = CountingCheck(1)
+    paginator = make_paginator(check, CheckCache(60))
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "NEXT")
+    paginator.invalidate_check(1)
+    await client.press(paginator, "PREVIOUS")
+
+    assert check.checked == [1, 1]
+
+
+async def test_failed_check_is_cached(client: Any) -> None:
+    check = CountingCheck()
+    paginator = make_paginator(check, CheckCache(60))
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "NEXT")
+
+    assert check.checked == [1]
+    assert paginator.current_page == 0
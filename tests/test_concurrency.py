@@ -0,0 +1,72 @@
+from __future__ import annotations
+import asyncio
+from typing import Any
+
+from discord.ext.modal_paginator import ModalPaginator, PaginatorModal
+
+
+def make_paginator(**kwargs: Any) -> ModalPaginator:
+    modals = []
+    for custom_id in ("first", "second", "third"):
+        modal = PaginatorModal(title=custom_id.title(), custom_id=custom_id)
+        modal.add_input(label="Answer")
+        modals.append(modal)
+
+    return ModalPaginator(modals, sort_modals=False, **kwargs)
+
+
+async def test_double_click_is_dropped(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+
+    # both presses are made on the first render, before either is handled
+    first, second = await asyncio.gather(client.press(paginator, "NEXT"), client.press(paginator, "NEXT"))
+
+    assert paginator.current_page == 1
+    assert first.call_names == ["edit_message"]
+    assert second.call_names == ["defer"]
+    assert paginator.coalesced_interactions == 1
+
+
+async def test_press_on_new_render_is_handled(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "NEXT")
+    interaction = await client.press(paginator, "NEXT")
+
+    assert paginator.current_page == 2
+    assert interaction.call_names == ["edit_message"]
+    assert paginator.coalesced_interactions == 0
+
+
+async def test_press_on_outdated_render_after_submit_is_dropped(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    # the press is made on the first page's render but handled after the modal was submitted
+    next_task = asyncio.ensure_future(client.press(paginator, "NEXT"))
+    await asyncio.sleep(0)
+    await client.submit("first", ["a"])
+    interaction = await next_task
+
+    assert paginator.current_page == 1
+    assert interaction.call_names == ["defer"]
+    assert paginator.coalesced_interactions == 1
+
+
+async def test_double_finish_is_dropped(client: Any) -> None:
+    finished = []
+
+    async def on_finish(paginator: ModalPaginator, interaction: Any) -> None:
+        finished.append(interaction)
+
+    paginator = make_paginator(finish_callback=on_finish)
+    await paginator.send(client.interaction())
+
+    first, second = await asyncio.gather(client.press(paginator, "FINISH"), client.press(paginator, "FINISH"))
+
+    assert len(finished) == 1
+    assert second.call_names == ["defer"]
+    assert paginator.coalesced_interactions == 1
@@ -0,0 +1,124 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from discord.ext.modal_paginator import Converter, IntConverter, MemberResolver, ModalPaginator, PaginatorModal
+
+
+class FakeMember:
+    def __init__(self, member_id: int) -> None:
+        self.id: int = member_id
+
+
+class FakeGuild:
+    """A guild with an empty member cache that records its member requests."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.id: int = 1
+        self.fail: bool = fail
+        self.queries: List[List[int]] = []
+
+    def get_member(self, user_id: int) -> None:
+        return None
+
+    async def query_members(self, *, user_ids: List[int], limit: int, cache: bool) -> List[FakeMember]:
+        self.queries.append(list(user_ids))
+        if self.fail:
+            raise asyncio.TimeoutError()
+
+        return [FakeMember(user_id) for user_id in user_ids]
+
+    async def fetch_member(self, user_id: int) -> FakeMember:
+        raise AssertionError("members must not be fetched one by one")
+
+
+def make_paginator() -> ModalPaginator:
+    first = PaginatorModal(title="First", custom_id="first", required=True)
+    first.add_input(label="Name", custom_id="name")
+    first.add_input(label="Age", custom_id="age", converter=IntConverter())
+    second = PaginatorModal(title="Second", custom_id="second", required=True)
+    second.add_input(label="Hobby", custom_id="hobby")
+    return ModalPaginator([first, second], sort_modals=False)
+
+
+async def fill(client: Any, paginator: ModalPaginator, values: Dict[str, List[str]]) -> None:
+    for page, (custom_id, answers) in enumerate(values.items()):
+        paginator.current_page = page
+        await client.press(paginator, "OPEN")
+        await client.submit(custom_id, answers)
+
+
+async def test_finish_converts_answers(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+    await fill(client, paginator, {"first": ["Ann", "30"], "second": ["Chess"]})
+    assert paginator.converted_answers is None
+
+    interaction = await client.press(paginator, "FINISH")
+    assert interaction.call_names[0] == "defer"
+    assert paginator.is_finished()
+    assert paginator.converted_answers == {"name": "Ann", "age": 30, "hobby": "Chess"}
+
+
+async def test_conversion_error_keeps_paginator_open(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+    await fill(client, paginator, {"first": ["Ann", "thirty"], "second": ["Chess"]})
+
+    interaction = await client.press(paginator, "FINISH")
+    assert interaction.call_names == ["defer", "edit_original_response"]
+    assert "Page 1: **Age**" in interaction.calls[1][1]["content"]
+    assert paginator.current_page == 0
+    assert not paginator.modals[0].is_finished()
+    assert not paginator.is_finished()
+    assert paginator.converted_answers is None
+
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann", "30"])
+    await client.press(paginator, "FINISH")
+    assert paginator.is_finished()
+    assert paginator.converted_answers is not None
+    assert paginator.converted_answers["age"] == 30
+
+
+async def test_duplicate_questions_are_rejected(client: Any) -> None:
+    first = PaginatorModal(title="First")
+    first.add_input(label="Name", converter=IntConverter())
+    second = PaginatorModal(title="Second")
+    second.add_input(label="Name")
+
+    with pytest.raises(ValueError, match="'Name'"):
+        await ModalPaginator([first, second]).send(client.interaction())
+
+
+async def test_member_ids_are_queried_in_chunks() -> None:
+    guild = FakeGuild()
+    resolver = MemberResolver(delay=0)
+    user_ids = list(range(10**17, 10**17 + 150))
+
+    members: List[Optional[Any]] = await asyncio.gather(
+        *(resolver.resolve(guild, str(user_id)) for user_id in user_ids)  # type: ignore
+    )
+
+    assert [member.id for member in members] == user_ids  # type: ignore
+    assert [len(query) for query in guild.queries] == [100, 50]
+
+
+async def test_failed_member_query_is_raised() -> None:
+    guild = FakeGuild(fail=True)
+    resolver = MemberResolver(delay=0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await resolver.resolve(guild, str(10**17))  # type: ignore
+
+    assert len(guild.queries) == 1
+
+
+def test_converter_must_implement_convert() -> None:
+    class Incomplete(Converter[int]):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
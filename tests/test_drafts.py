@@ -0,0 +1,33 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from discord.ext.modal_paginator.drafts import Drafts, DraftStore, JSONDraftStore, PageDraft
+
+
+def test_store_must_implement_all_methods() -> None:
+    class Incomplete(DraftStore):
+        async def save(self, drafts: Drafts) -> None:
+            pass
+
+        async def load(self, key: str) -> Optional[Dict[int, PageDraft]]:
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
+
+
+async def test_json_store_round_trip(tmp_path: Path) -> None:
+    store = JSONDraftStore(tmp_path)
+    await store.save({"form:1": {0: {"finished": True, "values": {"name": "Ann"}}}})
+    await store.save({"form:1": {1: {"finished": False, "values": {"hobby": "Chess"}}}})
+
+    assert await store.load("form:1") == {
+        0: {"finished": True, "values": {"name": "Ann"}},
+        1: {"finished": False, "values": {"hobby": "Chess"}},
+    }
+
+    await store.delete("form:1")
+    assert await store.load("form:1") is None
@@ -0,0 +1,190 @@
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Any, List, Tuple
+
+import pytest
+
+from discord.ext.modal_paginator import (
+    EventBus,
+    ModalPaginator,
+    ModalSubmitEvent,
+    PageChangeEvent,
+    PaginatorEvent,
+    PaginatorModal,
+    SessionEndEvent,
+    SessionStartEvent,
+    SessionState,
+)
+
+EVENTS = ("session_start", "page_change", "modal_submit", "finish", "cancel", "timeout")
+
+
+class RecordingBus(EventBus):
+    def __init__(self, *, client: Any = None) -> None:
+        super().__init__(client=client)
+        self.dispatched: List[str] = []
+
+    def dispatch(self, name: str, event: PaginatorEvent) -> None:
+        self.dispatched.append(name)
+        super().dispatch(name, event)
+
+
+class FakeDiscordClient:
+    def __init__(self) -> None:
+        self.dispatched: List[Tuple[str, PaginatorEvent]] = []
+
+    def dispatch(self, name: str, event: PaginatorEvent) -> None:
+        self.dispatched.append((name, event))
+
+
+def make_paginator(events: EventBus) -> ModalPaginator:
+    modals = []
+    for custom_id in ("first", "second"):
+        modal = PaginatorModal(title=custom_id.title(), custom_id=custom_id)
+        modal.add_input(label="Answer", custom_id=custom_id)
+        modals.append(modal)
+
+    return ModalPaginator(modals, events=events, sort_modals=False)
+
+
+def record_all(events: EventBus) -> List[Tuple[str, PaginatorEvent]]:
+    received: List[Tuple[str, PaginatorEvent]] = []
+    for name in EVENTS:
+        events.add_listener(lambda event, name=name: received.append((name, event)), name)
+
+    return received
+
+
+async def run_listeners() -> None:
+    # the listeners run in their own tasks
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_event_order_and_payloads(client: Any) -> None:
+    events = EventBus()
+    received = record_all(events)
+    paginator = make_paginator(events)
+    sent = client.interaction()
+
+    await paginator.send(sent)
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "PREVIOUS")
+    await client.press(paginator, "OPEN")
+    submitted = await client.submit("first", ["a"])
+    finished = await client.press(paginator, "FINISH")
+    await run_listeners()
+
+    assert [name for name, _ in received] == [
+        "session_start",
+        "page_change",
+        "page_change",
+        "modal_submit",
+        "page_change",
+        "finish",
+    ]
+    assert all(event.paginator is paginator for _, event in received)
+
+    start = received[0][1]
+    assert isinstance(start, SessionStartEvent)
+    assert start.interaction is sent
+
+    pages = [(event.previous, event.page) for _, event in received if isinstance(event, PageChangeEvent)]
+    assert pages == [(0, 1), (1, 0), (0, 1)]
+
+    submit = received[3][1]
+    assert isinstance(submit, ModalSubmitEvent)
+    assert submit.interaction is submitted
+    assert submit.modal is paginator.modals[0]
+    assert submit.delta.changed == {"first": "a"}
+
+    finish = received[5][1]
+    assert isinstance(finish, SessionEndEvent)
+    assert finish.interaction is finished
+    assert finish.state is SessionState.finished
+
+
+async def test_cancel_and_timeout(client: Any) -> None:
+    events = EventBus()
+    received = record_all(events)
+    cancelled = make_paginator(events)
+    await cancelled.send(client.interaction())
+    await client.press(cancelled, "CANCEL")
+
+    timed_out = make_paginator(events)
+    await timed_out.send(client.interaction())
+    # what the library calls when the view times out
+    timed_out._dispatch_timeout()  # type: ignore
+    await run_listeners()
+
+    ends = [(name, event) for name, event in received if isinstance(event, SessionEndEvent)]
+    assert [(name, event.paginator, event.state) for name, event in ends] == [
+        ("cancel", cancelled, SessionState.cancelled),
+        ("timeout", timed_out, SessionState.timed_out),
+    ]
+    assert ends[1][1].interaction is None
+
+
+async def test_events_without_listeners_are_not_dispatched(client: Any) -> None:
+    events = RecordingBus()
+    received: List[PaginatorEvent] = []
+    events.add_listener(received.append, "finish")
+    paginator = make_paginator(events)
+
+    await paginator.send(client.interaction())
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "FINISH")
+    await run_listeners()
+
+    assert events.dispatched == ["finish"]
+    assert len(received) == 1
+
+
+async def test_events_are_dispatched_to_client(client: Any) -> None:
+    discord_client = FakeDiscordClient()
+    events = RecordingBus(client=discord_client)  # type: ignore
+    paginator = make_paginator(events)
+
+    await paginator.send(client.interaction())
+    await client.press(paginator, "CANCEL")
+
+    assert [name for name, _ in discord_client.dispatched] == [
+        "modal_paginator_session_start",
+        "modal_paginator_cancel",
+    ]
+
+
+async def test_raising_listener_is_logged(client: Any, caplog: pytest.LogCaptureFixture) -> None:
+    events = EventBus()
+
+    @events.listen()
+    async def on_session_start(event: SessionStartEvent) -> None:
+        raise RuntimeError("analytics are down")
+
+    received: List[PaginatorEvent] = []
+    events.add_listener(received.append, "session_start")
+
+    with caplog.at_level(logging.ERROR, logger="discord.ext.modal_paginator.events"):
+        await make_paginator(events).send(client.interaction())
+        await run_listeners()
+
+    assert len(received) == 1
+    assert "analytics are down" in caplog.text
+
+
+def test_listeners() -> None:
+    events = EventBus()
+
+    def on_finish(event: PaginatorEvent) -> None:
+        pass
+
+    with pytest.raises(ValueError):
+        events.add_listener(on_finish, "submit")
+
+    events.listen()(on_finish)
+    assert events.has_listeners("finish")
+    events.remove_listener(on_finish, "finish")
+    assert not events.has_listeners("finish")
+    # removing it again does nothing
+    events.remove_listener(on_finish, "finish")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from discord.ext.modal_paginator.errors import InvalidForm
+from discord.ext.modal_paginator.forms import FormDefinition, FormRegistry
+
+
+def form_data(form_id: str, *titles: str) -> Dict[str, Any]:
+    return {"id": form_id, "pages": [{"title": title, "inputs": [{"label": "Answer"}]} for title in titles]}
+
+
+def write(path: Path, data: Any) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    # the registry compares the modification time, make sure it changes between quick writes
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def titles(form: FormDefinition) -> List[str]:
+    return [modal.title for modal in form.create_modals()]
+
+
+async def test_only_changed_forms_are_recompiled(tmp_path: Path) -> None:
+    write(tmp_path / "verify.json", form_data("verify", "About you"))
+    write(tmp_path / "more.json", [form_data("apply", "Why?"), form_data("report", "What?")])
+    (tmp_path / "notes.txt").write_text("not a form")
+    registry = FormRegistry(tmp_path)
+
+    assert sorted(await registry.reload()) == ["apply", "report", "verify"]
+    verify, apply, report = registry.get("verify"), registry.get("apply"), registry.get("report")
+    paginator = verify.create_paginator()
+    assert await registry.reload() == []
+
+    write(tmp_path / "verify.json", form_data("verify", "About you", "Your hobbies"))
+    write(tmp_path / "more.json", [form_data("apply", "Why?"), form_data("report", "What happened?")])
+    assert sorted(await registry.reload()) == ["report", "verify"]
+
+    assert registry.get("apply") is apply
+    assert registry.get("report").version == report.version + 1
+    assert titles(registry.get("verify")) == ["About you", "Your hobbies"]
+    assert registry.get("verify").version == 2
+    # sessions that already started keep their version
+    assert [modal.title for modal in paginator.modals] == ["About you"]
+    assert titles(verify) == ["About you"]
+
+
+async def test_invalid_file_keeps_previous_version(tmp_path: Path) -> None:
+    path = tmp_path / "verify.json"
+    write(path, form_data("verify", "About you"))
+    registry = FormRegistry(tmp_path)
+    await registry.reload()
+    form = registry.get("verify")
+
+    write(path, {"id": "verify", "pages": []})
+    assert await registry.reload() == []
+
+    assert registry.get("verify") is form
+    error = registry.errors[str(path)]
+    assert isinstance(error, InvalidForm)
+    assert error.path == "pages"
+
+    write(path, form_data("verify", "Fixed"))
+    assert await registry.reload() == ["verify"]
+    assert registry.errors == {}
+
+
+async def test_duplicate_form_ids_across_files(tmp_path: Path) -> None:
+    write(tmp_path / "a.json", form_data("verify", "First"))
+    write(tmp_path / "b.json", form_data("verify", "Second"))
+    registry = FormRegistry(tmp_path)
+    await registry.reload()
+
+    assert titles(registry.get("verify")) == ["First"]
+    assert list(registry.errors) == [str(tmp_path / "b.json")]
+
+
+async def test_removed_file_removes_its_forms(tmp_path: Path) -> None:
+    write(tmp_path / "verify.json", form_data("verify", "About you"))
+    write(tmp_path / "apply.json", form_data("apply", "Why?"))
+    registry = FormRegistry(tmp_path)
+    await registry.reload()
+
+    (tmp_path / "apply.json").unlink()
+    await registry.reload()
+
+    assert "apply" not in registry
+    assert list(registry.forms) == ["verify"]
+    with pytest.raises(KeyError):
+        registry.get("apply")
+
+
+async def test_single_file(tmp_path: Path) -> None:
+    path = tmp_path / "forms.json"
+    write(path, [form_data("verify", "About you"), form_data("apply", "Why?")])
+    registry = FormRegistry(path)
+    await registry.reload()
+
+    assert len(registry) == 2
+
+
+@pytest.mark.parametrize(
+    ("data", "path"),
+    [
+        ({"pages": []}, "id"),
+        ({"id": "verify", "pages": [{"title": "x" * 46, "inputs": [{"label": "Answer"}]}]}, "pages[0].title"),
+        ({"id": "verify", "pages": [{"title": "About you", "inputs": []}]}, "pages[0].inputs"),
+    ],
+)
+def test_invalid_form(data: Dict[str, Any], path: str) -> None:
+    with pytest.raises(InvalidForm) as exc_info:
+        FormDefinition.from_dict(data)
+
+    assert exc_info.value.path == path
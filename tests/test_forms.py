@@ -0,0 +1,74 @@
+from __future__ import annotations
+from typing import Any, Dict, List
+
+import discord
+import pytest
+
+from discord.ext.modal_paginator import ModalPaginator
+from discord.ext.modal_paginator.forms import FormDefinition
+
+NEXT_ERROR = "Please complete the current modal before going to the next one."
+
+
+def make_form() -> FormDefinition:
+    data: Dict[str, Any] = {
+        "id": "signup",
+        "pages": [
+            {"title": "About you", "required": True, "inputs": [{"label": "Name", "custom_id": "name"}]},
+            {"title": "More", "inputs": [{"label": "Hobby", "custom_id": "hobby"}]},
+        ],
+        "translations": {
+            "de": {"About you": "Über dich", "Name": "Name", "Next": "Weiter", NEXT_ERROR: "Bitte zuerst ausfüllen."},
+            "es-ES": {"About you": "Sobre ti"},
+        },
+    }
+    return FormDefinition.from_dict(data)
+
+
+def titles(paginator: ModalPaginator) -> List[str]:
+    return [modal.title for modal in paginator.modals]
+
+
+@pytest.mark.parametrize(
+    ("locale", "title"),
+    [
+        (None, "About you"),
+        ("de", "Über dich"),
+        (discord.Locale.german, "Über dich"),
+        ("es-ES", "Sobre ti"),
+        # falls back to the language, then to the original text
+        ("de-AT", "Über dich"),
+        ("es-419", "About you"),
+        ("fr", "About you"),
+    ],
+)
+def test_locale_fallback(locale: Any, title: str) -> None:
+    paginator = make_form().create_paginator(locale=locale)
+    paginator.validate_pages()
+
+    assert titles(paginator)[0] == title
+
+
+def test_buttons_and_error_messages_are_translated() -> None:
+    form = make_form()
+    german = form.create_paginator(locale="de")
+    english = form.create_paginator(locale="fr")
+
+    assert german.next_page.label == "Weiter"
+    assert german.get_next_button_error_message() == {
+        "content": "Bitte zuerst ausfüllen.",
+        "ephemeral": True,
+        "delete_after": 5,
+    }
+    # untranslated messages keep the default
+    assert german.get_previous_button_error_message() == ModalPaginator.get_previous_button_error_message(german)
+    assert english.next_page.label == "Next"
+    assert english.get_next_button_error_message()["content"] == NEXT_ERROR
+
+
+def test_variants_are_compiled_once() -> None:
+    form = make_form()
+    form.create_paginator(locale="de-AT")
+
+    assert form._get_variant("de") is form._get_variant("de-AT")
+    assert form._get_variant("fr") is form._get_variant(None)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import Any
+
+import discord
+
+from discord.ext.modal_paginator import ModalPaginator
+
+
+class RespondingPaginator(ModalPaginator):
+    """Responds to the interaction in on_finish, so the paginator's message is edited without it."""
+
+    async def on_finish(self, interaction: discord.Interaction[Any]) -> None:
+        await interaction.response.send_message("Thanks!")
+
+
+async def fill(client: Any, paginator: ModalPaginator) -> None:
+    await client.press(paginator, "OPEN")
+    await client.submit(paginator.modals[0].custom_id, ["Ann"])
+
+
+async def test_send_makes_one_request(client: Any) -> None:
+    paginator = ModalPaginator.from_text_inputs("Name")
+    interaction = client.interaction()
+    await paginator.send(interaction)
+
+    assert interaction.call_names == ["send_message"]
+    assert paginator.message is None
+
+
+async def test_message_is_fetched_once(client: Any) -> None:
+    paginator = ModalPaginator.from_text_inputs("Name")
+    interaction = client.interaction()
+    await paginator.send(interaction)
+
+    message = await paginator.fetch_message()
+    assert message is not None
+    assert await paginator.fetch_message() is message
+    assert paginator.message is message
+    assert interaction.call_names == ["send_message", "original_response"]
+
+
+async def test_return_message_fetches_message(client: Any) -> None:
+    paginator = ModalPaginator.from_text_inputs("Name")
+    interaction = client.interaction()
+    message = await paginator.send(interaction, return_message=True)
+
+    assert message is not None
+    assert message is paginator.message
+    assert interaction.call_names == ["send_message", "original_response"]
+
+
+async def test_unfetched_message_is_edited_through_interaction(client: Any) -> None:
+    paginator = RespondingPaginator.from_text_inputs("Name")
+    sent = client.interaction()
+    await paginator.send(sent)
+    await fill(client, paginator)
+
+    await client.press(paginator, "FINISH")
+
+    assert sent.call_names == ["send_message", "edit_original_response"]
+    assert sent.calls[1][1]["view"] is paginator
+    assert paginator.message is None
+
+
+async def test_fetched_message_is_edited(client: Any) -> None:
+    paginator = RespondingPaginator.from_text_inputs("Name")
+    sent = client.interaction()
+    await paginator.send(sent)
+    await paginator.fetch_message()
+    await fill(client, paginator)
+
+    await client.press(paginator, "FINISH")
+
+    assert sent.call_names == ["send_message", "original_response", "message.edit"]
+    assert sent.calls[2][1]["view"] is paginator
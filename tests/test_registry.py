@@ -0,0 +1,78 @@
+from __future__ import annotations
+import gc
+from typing import Any
+import weakref
+
+from discord.ext.modal_paginator import ModalPaginator, SessionState
+from discord.ext.modal_paginator.registry import SessionRegistry, registry
+
+
+def make_paginator(local: SessionRegistry) -> ModalPaginator:
+    paginator = ModalPaginator.from_text_inputs("Name")
+    # the global registry is shared with the other tests
+    local.add(paginator)
+    return paginator
+
+
+def test_registry_does_not_keep_paginators_alive() -> None:
+    paginator = ModalPaginator.from_text_inputs("Name")
+    ref = weakref.ref(paginator)
+    assert paginator in registry.sessions()
+
+    del paginator
+    gc.collect()
+
+    assert ref() is None
+
+
+async def test_counts_by_state(client: Any) -> None:
+    local = SessionRegistry()
+    paginators = [make_paginator(local) for _ in range(3)]
+    for paginator in paginators:
+        await paginator.send(client.interaction())
+    await client.press(paginators[0], "CANCEL")
+
+    counts = local.counts()
+    assert counts[SessionState.active] == 2
+    assert counts[SessionState.cancelled] == 1
+    assert counts[SessionState.finished] == 0
+    assert local.sessions(SessionState.cancelled) == [paginators[0]]
+    # oldest first
+    assert local.sessions() == paginators
+    ages = local.ages()
+    assert len(ages) == 3
+    assert ages == sorted(ages, reverse=True)
+    assert local.memory_estimate() > local.memory_estimate(SessionState.cancelled) > 0
+
+
+async def test_sweep_releases_stopped_paginators(client: Any) -> None:
+    local = SessionRegistry()
+    stopped = make_paginator(local)
+    active = make_paginator(local)
+    for paginator in (stopped, active):
+        await paginator.send(client.interaction())
+        await paginator.fetch_message()
+
+    # the modal is opened but never submitted, so the library still stores it
+    await client.press(stopped, "OPEN")
+    await client.press(stopped, "CANCEL")
+    assert stopped.modals[0].custom_id in client.modals
+
+    assert local.sweep() == 1
+    assert stopped.modals[0].custom_id not in client.modals
+    assert stopped.message is None
+    assert active.message is not None
+    assert active.state is SessionState.active
+    # already released
+    assert local.sweep() == 0
+
+
+async def test_sweep_stops_old_active_paginators(client: Any) -> None:
+    local = SessionRegistry()
+    paginator = make_paginator(local)
+    await paginator.send(client.interaction())
+
+    assert local.sweep(older_than=60) == 0
+    assert local.sweep(older_than=0) == 1
+    assert paginator.state is SessionState.timed_out
+    assert paginator.is_finished()
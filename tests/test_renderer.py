@@ -0,0 +1,26 @@
+from __future__ import annotations
+from typing import Any, Dict
+
+import pytest
+
+from discord.ext.modal_paginator import ModalPaginator
+from discord.ext.modal_paginator.renderer import ContentRenderer, Renderer
+
+
+def test_renderer_must_implement_render() -> None:
+    class Incomplete(Renderer):
+        def render_stopped(self, paginator: ModalPaginator) -> Dict[str, Any]:
+            return {}
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
+
+
+def test_stopped_render_defaults_to_nothing() -> None:
+    class Minimal(Renderer):
+        def render(self, paginator: ModalPaginator) -> Dict[str, Any]:
+            return {"content": "page"}
+
+    paginator = ModalPaginator.from_text_inputs("Name", renderer=Minimal())
+    assert paginator._renderer.render_stopped(paginator) == {}
+    assert ContentRenderer().render(paginator) == {"content": paginator.page_string}
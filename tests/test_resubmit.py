@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import Any, List
+
+import discord
+
+from discord.ext.modal_paginator import ModalPaginator, PaginatorModal, SubmitDelta
+
+
+class RecordingPaginator(ModalPaginator):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.deltas: List[SubmitDelta] = []
+
+    async def on_page_submit(self, interaction: discord.Interaction[Any], delta: SubmitDelta) -> None:
+        self.deltas.append(delta)
+
+
+def make_paginator(**kwargs: Any) -> RecordingPaginator:
+    first = PaginatorModal(title="First", custom_id="first", required=True)
+    first.add_input(label="Name", custom_id="name")
+    first.add_input(label="Age", custom_id="age")
+    second = PaginatorModal(title="Second", custom_id="second")
+    second.add_input(label="Hobby")
+    return RecordingPaginator([first, second], **kwargs)
+
+
+async def test_resubmit_after_reopen(client: Any) -> None:
+    paginator = make_paginator(allow_resubmit=True)
+    await paginator.send(client.interaction())
+    first = paginator.modals[0]
+
+    await client.press(paginator, "OPEN")
+    assert await client.submit("first", ["Ann", "30"]) is not None
+    assert first.is_finished()
+    assert paginator.current_page == 1
+
+    await client.press(paginator, "PREVIOUS")
+    await client.press(paginator, "OPEN")
+    interaction = await client.submit("first", ["Ann", "31"])
+    assert interaction is not None, "the resubmission was discarded"
+    assert interaction.call_names == ["edit_message"]
+
+    assert first.is_finished()
+    assert [inp.value for inp in first.text_inputs] == ["Ann", "31"]
+    assert len(paginator.deltas) == 2
+    assert paginator.deltas[1].changes == {"age": ("30", "31")}
+
+
+async def test_reopened_modal_prefills_previous_answers(client: Any) -> None:
+    paginator = make_paginator(allow_resubmit=True)
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann", "30"])
+    await client.press(paginator, "PREVIOUS")
+    interaction = await client.press(paginator, "OPEN")
+
+    sent = interaction.calls[0][1]["modal"]
+    payload = sent.to_dict()
+    defaults = [row["components"][0].get("value") for row in payload["components"]]
+    assert defaults == ["Ann", "30"]
+
+
+async def test_dismissed_reopen_keeps_page_finished(client: Any) -> None:
+    paginator = make_paginator(allow_resubmit=True)
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann", "30"])
+    await client.press(paginator, "PREVIOUS")
+    # the user closes the modal without submitting it
+    await client.press(paginator, "OPEN")
+
+    assert paginator.modals[0].is_finished()
+    await client.press(paginator, "NEXT")
+    assert paginator.current_page == 1
+
+
+async def test_reopened_modal_is_stopped_with_paginator(client: Any) -> None:
+    paginator = make_paginator(allow_resubmit=True)
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann", "30"])
+    await client.press(paginator, "PREVIOUS")
+    await client.press(paginator, "OPEN")
+    assert "first" in client.modals
+
+    paginator.stop()
+    paginator._release()
+    assert "first" not in client.modals
+
+
+async def test_finished_modal_cannot_be_opened_without_resubmit(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    await client.submit("first", ["Ann", "30"])
+    await client.press(paginator, "PREVIOUS")
+
+    assert paginator.open_button.disabled
@@ -0,0 +1,49 @@
+from __future__ import annotations
+from typing import Any
+
+from discord.ext.modal_paginator import ModalPaginator, PaginatorModal
+from discord.ext.modal_paginator.review import AnswerReview
+
+
+def make_paginator() -> ModalPaginator:
+    modal = PaginatorModal(title="Profile", custom_id="profile")
+    modal.add_input(label="Name", custom_id="name")
+    modal.add_input(label="Bio", custom_id="bio")
+    return ModalPaginator([modal], allow_resubmit=True)
+
+
+async def test_review_is_a_snapshot(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+    await client.press(paginator, "OPEN")
+    await client.submit("profile", ["Ann", "x" * 3000])
+
+    # no page is built yet
+    review = AnswerReview(paginator)
+    await client.press(paginator, "OPEN")
+    await client.submit("profile", ["Bob", "y" * 3000])
+
+    values = [field.value for field in review.get_page(0).fields]  # type: ignore
+    assert values[0] == "Ann"
+    assert all(set(value) == {"x"} for value in values[1:])
+    assert review.to_file().fp.read().decode().startswith("# Profile\n\nName\nAnn\n\n")
+
+
+def test_long_answers_are_split() -> None:
+    paginator = make_paginator()
+    name, bio = paginator.modals[0].text_inputs
+    name._value = "Ann"  # type: ignore
+    bio._value = "z" * 2500  # type: ignore
+
+    review = AnswerReview(paginator)
+    embed = review.get_page(0)
+    assert embed is not None
+    assert [field.name for field in embed.fields] == [
+        "Profile: Name",
+        "Profile: Bio",
+        "Profile: Bio (cont.)",
+        "Profile: Bio (cont.)",
+    ]
+    assert "".join(field.value for field in embed.fields[1:]) == "z" * 2500  # type: ignore
+    assert review.get_page(1) is None
+    assert review.page_count == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Any, List, Optional, Tuple
+
+import discord
+import pytest
+
+from discord.ext.modal_paginator import AdmissionController, ModalPaginator, SharedModalPaginator
+from discord.ext.modal_paginator.errors import AdmissionRejected
+
+
+class CountingPaginator(ModalPaginator):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.validations: int = 0
+
+    def validate_pages(self) -> None:
+        self.validations += 1
+        super().validate_pages()
+
+
+def make_shared(
+    admission: Optional[AdmissionController] = None, **kwargs: Any
+) -> Tuple[SharedModalPaginator, List[ModalPaginator]]:
+    admission = admission or AdmissionController(per_user=1)
+    created: List[ModalPaginator] = []
+
+    def factory(interaction: discord.Interaction[Any]) -> ModalPaginator:
+        paginator = CountingPaginator.from_text_inputs("Name", "Age", admission=admission)
+        created.append(paginator)
+        return paginator
+
+    return SharedModalPaginator(factory, **kwargs), created
+
+
+def test_max_sessions_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        SharedModalPaginator(lambda i: ModalPaginator.from_text_inputs("Name"), max_sessions=0)
+
+
+async def test_resume_does_not_send_again(client: Any) -> None:
+    shared, created = make_shared()
+    await client.press(shared, "START")
+    paginator = shared.get_session(1)
+    assert isinstance(paginator, CountingPaginator)
+
+    # the admission controller would reject a second send of the same user
+    interaction = await client.press(shared, "START")
+    assert created == [paginator]
+    assert paginator.validations == 1
+    assert interaction.call_names == ["send_message"]
+    assert interaction.calls[0][1]["view"] is paginator
+    assert interaction.calls[0][1]["ephemeral"] is True
+    assert paginator._interaction is interaction
+
+
+async def test_oldest_session_is_evicted(client: Any) -> None:
+    shared, _ = make_shared(max_sessions=1)
+    first_interaction = await client.press(shared, "START", user_id=1)
+    first = shared.get_session(1)
+    await client.press(shared, "START", user_id=2)
+
+    assert first is not None and first.is_finished()
+    assert list(shared.sessions) == [2]
+    # the evicted paginator's buttons are disabled
+    assert first_interaction.call_names == ["send_message", "edit_original_response"]
+    assert first_interaction.calls[1][1]["view"] is first
+    assert all(item.disabled for item in first.children)  # type: ignore
+
+
+async def test_rejected_session_is_not_kept(client: Any) -> None:
+    admission = AdmissionController(total=1)
+    await ModalPaginator.from_text_inputs("Name", admission=admission).send(client.interaction(user_id=5))
+    shared, created = make_shared(admission)
+
+    for _ in range(2):
+        with pytest.raises(AdmissionRejected):
+            await client.press(shared, "START")
+
+        assert shared.get_session(1) is None
+
+    # a new paginator was created for the second press instead of resuming the rejected one
+    assert len(created) == 2
+    assert all(paginator.is_finished() for paginator in created)
+    assert len(admission) == 1
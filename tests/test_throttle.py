@@ -0,0 +1,54 @@
+from __future__ import annotations
+import asyncio
+from typing import Any
+
+import pytest
+
+from discord.ext.modal_paginator import ClickThrottle, ModalPaginator, PaginatorModal
+
+
+def make_paginator() -> ModalPaginator:
+    modals = []
+    for page in range(10):
+        modal = PaginatorModal(title=f"Page {page + 1}")
+        modal.add_input(label="Answer")
+        modals.append(modal)
+
+    return ModalPaginator(modals, throttle=ClickThrottle(rate=0.001, burst=2, quiet=0.01))
+
+
+def test_invalid_throttle() -> None:
+    with pytest.raises(ValueError):
+        ClickThrottle(burst=0)
+
+    with pytest.raises(ValueError):
+        ClickThrottle(rate=0)
+
+
+async def test_presses_over_the_burst_are_coalesced(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+
+    interactions = [await client.press(paginator, "NEXT") for _ in range(5)]
+    assert [i.call_names for i in interactions] == [["edit_message"]] * 2 + [["defer"]] * 3
+    assert paginator.current_page == 5
+    assert paginator.throttled_interactions == 3
+    assert paginator.coalesced_renders == 0
+
+    await asyncio.sleep(0.05)
+    # only the last throttled press is rendered, showing the page the user ended up on
+    assert [i.call_names for i in interactions[2:]] == [["defer"], ["defer"], ["defer", "edit_original_response"]]
+    assert "Page 6" in interactions[-1].calls[1][1]["content"]
+    assert paginator.coalesced_renders == 1
+
+
+async def test_pending_render_is_cancelled_on_stop(client: Any) -> None:
+    paginator = make_paginator()
+    await paginator.send(client.interaction())
+
+    interactions = [await client.press(paginator, "NEXT") for _ in range(3)]
+    paginator.stop()
+    await asyncio.sleep(0.05)
+
+    assert interactions[-1].call_names == ["defer"]
+    assert paginator.coalesced_renders == 0
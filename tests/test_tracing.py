@@ -0,0 +1,78 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from discord.ext.modal_paginator import ClickThrottle, ModalPaginator, PaginatorModal
+from discord.ext.modal_paginator.tracing import Span, SpanExporter, Tracer
+
+
+class RecordingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.spans.extend(spans)
+
+    def by_name(self) -> Dict[str, Span]:
+        return {span.name: span for span in self.spans}
+
+
+def make_paginator(tracer: Tracer, pages: int = 2, **kwargs: Any) -> ModalPaginator:
+    modals = []
+    for page in range(pages):
+        modal = PaginatorModal(title=f"Page {page + 1}", custom_id=f"page{page + 1}")
+        modal.add_input(label="Answer")
+        modals.append(modal)
+
+    return ModalPaginator(modals, tracer=tracer, **kwargs)
+
+
+async def test_session_spans(client: Any) -> None:
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter)
+    paginator = make_paginator(tracer)
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "OPEN")
+    await client.submit("page1", ["a"])
+    await client.press(paginator, "FINISH")
+    await tracer.flush()
+
+    spans = exporter.by_name()
+    root = spans["ModalPaginator.session"]
+    assert root.parent_id is None
+    assert root.attributes["state"] == "finished"
+    assert all(span.trace_id == root.trace_id for span in exporter.spans)
+    assert spans["button OPEN"].parent_id == root.span_id
+    assert spans["modal submit"].parent_id == root.span_id
+    assert spans["callback on_page_submit"].parent_id == spans["modal submit"].span_id
+    assert spans["callback on_finish"].parent_id == spans["button FINISH"].span_id
+    assert all(span.end_time is not None for span in exporter.spans)
+
+
+async def test_throttled_render_is_parented_to_root(client: Any) -> None:
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter)
+    paginator = make_paginator(tracer, pages=5, throttle=ClickThrottle(rate=0.001, burst=1, quiet=0.01))
+    await paginator.send(client.interaction())
+
+    await client.press(paginator, "NEXT")
+    await client.press(paginator, "NEXT")
+    await asyncio.sleep(0.05)
+    paginator.stop()
+    await tracer.flush()
+
+    root = exporter.by_name()["ModalPaginator.session"]
+    renders = [span for span in exporter.spans if span.name == "http interaction.edit_original_response"]
+    assert len(renders) == 1
+    assert renders[0].parent_id == root.span_id
+
+
+def test_exporter_must_implement_export() -> None:
+    class Incomplete(SpanExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
@@ -0,0 +1,157 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, Dict, List
+
+import discord
+import pytest
+
+from discord.ext.modal_paginator import AsyncValidator, ModalPaginator, NumberRange, PaginatorModal, Validator
+
+
+class CheckedNames:
+    """An async validator function that only accepts names that are in ``valid``."""
+
+    def __init__(self, *valid: str) -> None:
+        self.valid: List[str] = list(valid)
+        self.checked: List[str] = []
+
+    async def __call__(self, interaction: discord.Interaction[Any], value: str) -> bool:
+        self.checked.append(value)
+        return value in self.valid
+
+
+def make_paginator(*validators: Any, optional: bool = False, check_age: bool = False) -> ModalPaginator:
+    modal = PaginatorModal(title="Profile", custom_id="profile", required=not optional)
+    modal.add_input(label="Name", custom_id="name", validators=validators)
+    age = modal.add_input(label="Age", custom_id="age", required=False)
+    if check_age:
+        modal.add_validator(age, NumberRange(0, 150, integer=True))
+    other = PaginatorModal(title="Other", custom_id="other", required=True)
+    other.add_input(label="Hobby")
+    return ModalPaginator([modal, other], sort_modals=False)
+
+
+async def fill(client: Any, paginator: ModalPaginator, values: Dict[str, List[str]]) -> None:
+    for page, (custom_id, answers) in enumerate(values.items()):
+        paginator.current_page = page
+        await client.press(paginator, "OPEN")
+        await client.submit(custom_id, answers)
+
+
+async def test_sync_errors_keep_page_unfinished(client: Any) -> None:
+    paginator = make_paginator(check_age=True)
+    await paginator.send(client.interaction())
+    modal = paginator.modals[0]
+
+    await client.press(paginator, "OPEN")
+    interaction = await client.submit("profile", ["Ann", "abc"])
+    assert not modal.is_finished()
+    assert "**Age**" in interaction.calls[0][1]["content"]
+
+    await client.press(paginator, "OPEN")
+    await client.submit("profile", ["Ann", "30"])
+    assert modal.is_finished()
+    assert modal.errors == {}
+
+
+async def test_resubmit_clears_async_errors(client: Any) -> None:
+    names = CheckedNames("Bob")
+    paginator = make_paginator(AsyncValidator(names, message="Unknown name."))
+    await paginator.send(client.interaction())
+    await fill(client, paginator, {"profile": ["Ann", "30"], "other": ["Chess"]})
+
+    interaction = await client.press(paginator, "FINISH")
+    assert interaction.call_names == ["defer", "edit_original_response"]
+    assert "Unknown name." in interaction.calls[1][1]["content"]
+    assert paginator.current_page == 0
+    assert not paginator.modals[0].is_finished()
+    assert not paginator.is_finished()
+
+    # the page has no sync validators, submitting it again must still clear the error
+    await client.press(paginator, "OPEN")
+    assert await client.submit("profile", ["Bob", "30"]) is not None
+    assert paginator.modals[0].is_finished()
+
+    await client.press(paginator, "FINISH")
+    assert names.checked == ["Ann", "Bob"]
+    assert paginator.is_finished()
+
+
+async def test_async_errors_are_validated_again(client: Any) -> None:
+    names = CheckedNames()
+    paginator = make_paginator(AsyncValidator(names), optional=True)
+    await paginator.send(client.interaction())
+    await fill(client, paginator, {"profile": ["Ann", ""], "other": ["Chess"]})
+
+    await client.press(paginator, "FINISH")
+    assert paginator.modals[0].errors
+
+    # the page is optional so it can be finished without submitting it again
+    names.valid.append("Ann")
+    await client.press(paginator, "FINISH")
+    assert names.checked == ["Ann", "Ann"]
+    assert paginator.modals[0].errors == {}
+    assert paginator.is_finished()
+
+
+async def test_raising_validator_is_reported_as_invalid(client: Any) -> None:
+    async def broken(interaction: discord.Interaction[Any], value: str) -> bool:
+        raise RuntimeError("database is down")
+
+    names = CheckedNames("Ann")
+    paginator = make_paginator(AsyncValidator(broken), AsyncValidator(names))
+    await paginator.send(client.interaction())
+    await fill(client, paginator, {"profile": ["Ann", ""], "other": ["Chess"]})
+
+    invalid = await paginator.validate_answers(client.interaction())
+    modal = paginator.modals[0]
+    assert invalid == [modal]
+    assert list(modal.errors.values()) == [AsyncValidator.error_message]
+    assert names.checked == ["Ann"]
+
+
+async def test_slow_validator_times_out(client: Any) -> None:
+    async def slow(interaction: discord.Interaction[Any], value: str) -> bool:
+        await asyncio.sleep(10)
+        return True
+
+    paginator = make_paginator(AsyncValidator(slow))
+    paginator.validation_timeout = 0.01
+    await paginator.send(client.interaction())
+    await fill(client, paginator, {"profile": ["Ann", ""], "other": ["Chess"]})
+
+    invalid = await paginator.validate_answers(client.interaction())
+    assert invalid == [paginator.modals[0]]
+    assert list(paginator.modals[0].errors.values()) == [AsyncValidator.timeout_message]
+
+
+async def test_sync_errors_are_not_validated_async(client: Any) -> None:
+    names = CheckedNames("Ann")
+    paginator = make_paginator(AsyncValidator(names), optional=True, check_age=True)
+    await paginator.send(client.interaction())
+    await fill(client, paginator, {"profile": ["Ann", "abc"], "other": ["Chess"]})
+    errors = dict(paginator.modals[0].errors)
+
+    assert await paginator.validate_answers(client.interaction()) == []
+    assert names.checked == []
+    assert paginator.modals[0].errors == errors
+
+
+def test_validator_must_implement_validate() -> None:
+    class Incomplete(Validator):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
+
+
+@pytest.mark.parametrize("value", ["nan", "NaN", "inf", "-inf", "Infinity"])
+def test_number_range_rejects_non_finite_values(value: str) -> None:
+    assert not NumberRange().validate(value)
+    assert not NumberRange(0, 150).validate(value)
+
+
+def test_number_range_accepts_values_in_range() -> None:
+    assert NumberRange(0, 150).validate("1.5e2")
+    assert not NumberRange(0, 150).validate("150.5")
+    assert NumberRange(integer=True).validate("-3")